@@ -0,0 +1,35 @@
+"""
+예제 스크립트용 간단한 .env 로더 (auth / automation 예제가 공유)
+"""
+from __future__ import annotations
+
+import functools
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+# 저장소 루트의 .env (src/pyaps/_dotenv.py 기준)
+DEFAULT_ENV_FILE = Path(__file__).resolve().parent.parent.parent / ".env"
+
+# KEY=VALUE 한 줄: 주석/빈 줄은 건너뛰고 첫 '=' 기준으로 분리, 앞뒤 공백 제거 (파일 전체를 한 번에 매칭)
+# 줄바꿈을 넘지 않도록 \s 대신 [ \t]만 사용 (빈 값 'KEY='가 다음 줄을 삼키지 않음)
+_ENV_RE = re.compile(r"^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env(path: Path, mtime: float) -> Dict[str, str]:
+    """.env 파싱 결과를 (경로, 수정 시각)별로 캐시 (파일이 바뀌지 않았으면 다시 읽지 않음)"""
+    return dict(_ENV_RE.findall(path.read_text()))
+
+
+def load_dotenv(env_file: Optional[Path] = None) -> None:
+    """Simple .env loader (이미 설정된 환경 변수는 덮어쓰지 않음)"""
+    env_file = Path(env_file) if env_file is not None else DEFAULT_ENV_FILE
+    try:
+        mtime = env_file.stat().st_mtime
+    except OSError:
+        return
+    # 셸에서 export한 값을 .env가 덮어쓰지 않음
+    for key, value in _parse_env(env_file, mtime).items():
+        os.environ.setdefault(key, value)
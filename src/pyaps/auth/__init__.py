@@ -1,6 +1,6 @@
 # src/pyaps/auth/__init__.py
 from .client import AuthClient, Scopes
-from .token_store import OAuth2Token, TokenStore, InMemoryTokenStore
+from .token_store import OAuth2Token, TokenStore, InMemoryTokenStore, FileTokenStore
 
 __all__ = [
     "AuthClient",
@@ -8,4 +8,5 @@ __all__ = [
     "OAuth2Token",
     "TokenStore",
     "InMemoryTokenStore",
+    "FileTokenStore",
 ]
@@ -1,20 +1,46 @@
 # src/pyaps/auth/client.py
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
 import hashlib
-import os
+import secrets
+import sys
+import threading
+import time
 import urllib.parse
-from typing import Any, Callable, Dict, Iterable, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
 
 import requests
 
-from pyaps.http.client import HTTPClient
+from pyaps.http.client import HTTPClient, _CappedRetry, _json_loads, _pooled_session as _pooled_http_session
 from pyaps.auth.token_store import OAuth2Token, TokenStore
 
 DEFAULT_AUTH_BASE = "https://developer.api.autodesk.com/authentication/v2"
 DEFAULT_USERPROFILE_BASE = "https://api.userprofile.autodesk.com"
 
+# 프로세스 내 캐시는 만료 5분 전부터 토큰을 갱신 대상으로 취급
+MEMORY_CACHE_SKEW_SECONDS = 300
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+_q = urllib.parse.quote_plus
+
+# PKCE challenge용 초기화된 SHA-256 컨텍스트 (호출마다 copy()하여 재사용)
+_SHA256_TEMPLATE = hashlib.sha256()
+
+
+class _ClientFixed(NamedTuple):
+    """클라이언트 설정에서 미리 계산해 두는 값 (캐시 키 접두어, grant별 고정 폼 필드는 인코딩된 상태)"""
+    key2l_prefix: str
+    key3l_prefix: str
+    form_client_credentials: str
+    form_authorization_code: str
+    form_refresh_token: str
+
 
 class AuthClient:
     """
@@ -24,6 +50,15 @@ class AuthClient:
         - User Profile: OIDC UserInfo endpoint
     """
 
+    # 바뀌면 미리 계산한 캐시 키 접두어/폼 본문/쿼리를 다시 만들어야 하는 공개 속성
+    _FIXED_SOURCES = frozenset({"client_id", "client_secret", "redirect_uri", "cache_prefix"})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in AuthClient._FIXED_SOURCES:
+            super().__setattr__("_fixed_cache", None)
+            super().__setattr__("_authorize_fixed", None)
+
     def __init__(
         self,
         client_id: str,
@@ -39,6 +74,9 @@ class AuthClient:
         session: Optional[requests.Session] = None,
         proxies: Optional[Dict[str, str]] = None,
         trust_env: bool = True,
+        prefetch_scopes: Optional[list[list[str]]] = None,
+        auto_refresh: bool = False,
+        async_workers: Optional[int] = None,
     ) -> None:
         """
         Args:
@@ -52,8 +90,18 @@ class AuthClient:
             user_agent: User-Agent 헤더 값
             cache_prefix: Cache key prefix
             session: 커스텀 requests.Session (선택)
+                미지정 시 커넥션 풀(HTTPAdapter)이 설정된 세션을 생성하여
+                http_auth/http_userprofile이 공유 (스레드 간 공유 시 keep-alive 재사용)
             proxies: 프록시 설정 (선택)
             trust_env: 환경 변수에서 프록시 읽기 (기본: True)
+            prefetch_scopes: 미리 발급해 둘 2-legged 스코프 조합 목록 (선택)
+                예: [[Scopes.DATA_READ], [Scopes.CODE_ALL, Scopes.BUCKET_READ]]
+                client_secret이 있으면 백그라운드 스레드에서 토큰을 발급해 캐시를 데움
+            auto_refresh: 캐시된 2-legged 토큰을 만료 전에 백그라운드에서 미리 갱신 (기본: False)
+                사용 후 close()로 타이머 정리
+            async_workers: 비동기 메서드(aget_token 등) 전용 스레드 풀 크기 (선택)
+                미지정 시 이벤트 루프의 기본 executor 사용 (최대 min(32, CPU+4) 스레드)
+                동시 토큰 요청이 많은 게이트웨이에서는 세션 풀 크기(64) 이하로 지정 권장
         """
         self.client_id = client_id
         self.client_secret = client_secret
@@ -61,6 +109,19 @@ class AuthClient:
         self.store = store
         self.cache_prefix = cache_prefix
         self.timeout = timeout
+        self._memory_cache = _MemoryTokenCache(generation=lambda: getattr(self.store, "generation", 0))
+        self.auto_refresh = auto_refresh
+        self._refresh_timers: Dict[str, threading.Timer] = {}
+        self._refresh_lock = threading.Lock()
+        self._closed = False
+        self.async_workers = async_workers
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+
+        # /authorize 고정 쿼리 (redirect_uri가 없을 수 있으므로 최초 사용 시 계산, 설정 변경 시 초기화)
+        self._authorize_fixed: Optional[str] = None
+
+        if session is None:
+            session = _pooled_session()
 
         # HTTPClient for API calls that need authentication (e.g., userinfo)
         def _token_provider() -> str:
@@ -86,26 +147,246 @@ class AuthClient:
             trust_env=trust_env,
         )
 
+        # Endpoint URLs (base URL은 생성 이후 변하지 않음)
+        self._url_token = f"{self.http_auth.base_url}/token"
+        self._url_revoke = f"{self.http_auth.base_url}/revoke"
+        self._url_logout = f"{self.http_auth.base_url}/logout"
+        self._url_authorize = f"{self.http_auth.base_url}/authorize"
+        self._url_userinfo = f"{self.http_userprofile.base_url}/userinfo"
+
         # Public facades
         self.two_legged = _TwoLegged(self)
         self.three_legged = _ThreeLegged(self)
         self.tokens = _Tokens(self)
         self.user = _User(self)
 
+        if prefetch_scopes and client_secret:
+            threading.Thread(target=self._prefetch, args=(prefetch_scopes,), daemon=True).start()
+
+    def _fixed(self) -> _ClientFixed:
+        """
+        캐시 키 접두어와 grant별 고정 폼 필드 (최초 사용 시 계산해 재사용, 요청마다 가변 부분만 이어붙임)
+        client_id/client_secret/redirect_uri/cache_prefix가 바뀌면 다시 계산
+        """
+        fixed = self._fixed_cache
+        if fixed is None:
+            common = f"client_id={_q(self.client_id)}"
+            if self.client_secret:
+                common += f"&client_secret={_q(self.client_secret)}"
+            authorization_code = f"grant_type=authorization_code&{common}"
+            if self.redirect_uri:
+                authorization_code += f"&redirect_uri={_q(self.redirect_uri)}"
+            fixed = self._fixed_cache = _ClientFixed(
+                key2l_prefix=f"{self.cache_prefix}:2l:{self.client_id}:",
+                key3l_prefix=f"{self.cache_prefix}:3l:{self.client_id}:{self.redirect_uri}:",
+                form_client_credentials=f"grant_type=client_credentials&{common}",
+                form_authorization_code=authorization_code,
+                form_refresh_token=f"grant_type=refresh_token&{common}",
+            )
+        return fixed
+
     def _get_session(self) -> requests.Session:
         """Get the underlying requests session"""
         return self.http_auth.session
 
+    def close(self) -> None:
+        """백그라운드 갱신 타이머와 비동기 전용 스레드 풀 정리"""
+        with self._refresh_lock:
+            self._closed = True
+            timers = list(self._refresh_timers.values())
+            self._refresh_timers.clear()
+            executor, self._async_executor = self._async_executor, None
+        for t in timers:
+            t.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def _run_async(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """동기 호출을 워커 스레드에서 실행 (async_workers 지정 시 전용 풀 사용)"""
+        if self.async_workers is None:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        with self._refresh_lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=self.async_workers, thread_name_prefix="pyaps-auth"
+                )
+            executor = self._async_executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+    def _schedule_refresh(self, key: str, token: OAuth2Token, callback: Callable[[], None]) -> None:
+        """메모리 캐시가 토큰을 만료로 보기 60초 전에 callback 실행 예약"""
+        if not self.auto_refresh:
+            return
+        delay = max(1.0, token._mono_expiry - time.monotonic() - MEMORY_CACHE_SKEW_SECONDS - 60)
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        with self._refresh_lock:
+            if self._closed:
+                return
+            previous = self._refresh_timers.pop(key, None)
+            self._refresh_timers[key] = timer
+            timer.start()
+        if previous is not None:
+            previous.cancel()
+
+    def _prefetch(self, scope_sets: list[list[str]]) -> None:
+        """2-legged 토큰 사전 발급 (실패는 무시하고 첫 실제 호출에서 다시 시도)"""
+        for scopes in scope_sets:
+            try:
+                self.two_legged.get_token(scopes)
+            except Exception:
+                pass
+
 
 # ----------------------------
-# 2-Legged (Client Credentials)
+# In-process Token Cache
 # ----------------------------
-class _TwoLegged:
-    """2-legged OAuth (Client Credentials) flow"""
+class _CacheEntry:
+    __slots__ = ("token", "error", "ready")
+
+    def __init__(self) -> None:
+        self.token: Optional[OAuth2Token] = None
+        self.error: Optional[BaseException] = None
+        self.ready = threading.Event()
+
+
+class _MemoryTokenCache:
+    """
+    프로세스 메모리 토큰 캐시 (스레드 세이프)
+    - 캐시 히트는 dict 조회 한 번으로 처리 (store I/O 없음)
+    - 같은 키에 대한 동시 미스는 한 스레드만 fetch 하고 나머지는 결과를 기다림
+    - maxsize를 넘으면 가장 오래 사용하지 않은 키부터 제거 (LRU)
+    - generation()이 바뀌면(저장소 delete/clear) 전체를 비움
+    """
+
+    def __init__(self, maxsize: int = 1024, generation: Callable[[], int] = lambda: 0) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self.maxsize = maxsize
+        self._generation = generation
+        self._seen_generation = generation()
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], OAuth2Token],
+        *,
+        wait_timeout: Optional[float] = None,
+    ) -> OAuth2Token:
+        generation = self._generation()
+        with self._lock:
+            self._sync_generation(generation)
+            entry = self._entries.get(key)
+            if entry is not None and entry.ready.is_set():
+                if entry.token is not None and not entry.token.is_expired(MEMORY_CACHE_SKEW_SECONDS):
+                    self._entries.move_to_end(key)
+                    return entry.token
+                entry = None
+            leader = entry is None
+            if leader:
+                entry = _CacheEntry()
+                self._insert(key, entry)
+
+        if not leader:
+            if not entry.ready.wait(wait_timeout):
+                # 선행 요청이 지연되면 직접 가져옴
+                return fetch()
+            if entry.error is not None:
+                raise entry.error
+            return entry.token
+
+        try:
+            token = fetch()
+        except BaseException as e:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            entry.error = e
+            entry.ready.set()
+            raise
+        entry.token = token
+        entry.ready.set()
+        return token
+
+    def put(self, key: str, token: OAuth2Token) -> None:
+        entry = _CacheEntry()
+        entry.token = token
+        entry.ready.set()
+        generation = self._generation()
+        with self._lock:
+            self._sync_generation(generation)
+            current = self._entries.get(key)
+            # 진행 중인 fetch가 있으면 그 결과를 덮어쓰지 않음
+            if current is None or current.ready.is_set():
+                self._insert(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def discard_token(self, value: str) -> list[str]:
+        """access/refresh 토큰 값이 value인 항목을 제거하고 제거된 키 목록을 반환"""
+        with self._lock:
+            keys = [
+                k for k, e in self._entries.items()
+                if e.token is not None and value in (e.token.access_token, e.token.refresh_token)
+            ]
+            for k in keys:
+                del self._entries[k]
+        return keys
+
+    def _sync_generation(self, generation: int) -> None:
+        # self._lock을 보유한 상태에서 호출
+        if generation != self._seen_generation:
+            self._entries.clear()
+            self._seen_generation = generation
+
+    def _insert(self, key: str, entry: _CacheEntry) -> None:
+        # self._lock을 보유한 상태에서 호출
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# ----------------------------
+# Shared Token Operations
+# ----------------------------
+class _TokenOps:
+    """/token 호출과 캐시 입출력 공통 구현"""
 
     def __init__(self, client: AuthClient):
         self.client = client
 
+    def _post_token(self, body: str) -> Dict:
+        """POST to /token endpoint (body: urlencoded form string)"""
+        session = self.client._get_session()
+        resp = session.post(self.client._url_token, data=body, headers=_FORM_HEADERS, timeout=self.client.timeout)
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
+    def _cache_key_3l(self, scope_str: str) -> str:
+        """Generate cache key for 3-legged token"""
+        return self.client._fixed().key3l_prefix + _join_scopes(scope_str.split())
+
+    def _read_cache(self, key: str) -> Optional[OAuth2Token]:
+        if not self.client.store:
+            return None
+        return self.client.store.read(key)
+
+    def _write_cache(self, key: str, token: OAuth2Token) -> None:
+        self.client._memory_cache.put(key, token)
+        if self.client.store:
+            self.client.store.write(key, token)
+
+
+# ----------------------------
+# 2-Legged (Client Credentials)
+# ----------------------------
+class _TwoLegged(_TokenOps):
+    """2-legged OAuth (Client Credentials) flow"""
+
     def get_token(self, scopes: Iterable[str]) -> OAuth2Token:
         """
         Get or fetch a 2-legged access token.
@@ -115,55 +396,64 @@ class _TwoLegged:
             raise ValueError("2-legged flow requires client_secret")
 
         scope_str = _join_scopes(scopes)
-        cache_key = f"{self.client.cache_prefix}:2l:{self.client.client_id}:{scope_str}"
+        cache_key = self.client._fixed().key2l_prefix + scope_str
+
+        return self.client._memory_cache.get_or_fetch(
+            cache_key,
+            lambda: self._fetch_token(cache_key, scope_str),
+            wait_timeout=self.client.timeout,
+        )
+
+    async def aget_token(self, scopes: Iterable[str]) -> OAuth2Token:
+        """
+        Async variant of get_token.
+        Runs on a worker thread (see AuthClient async_workers) and shares the in-process cache with the sync path.
+        """
+        return await self.client._run_async(self.get_token, _materialize_scopes(scopes))
 
-        # Check cache
+    async def aget_tokens(self, scope_sets: Iterable[Iterable[str]]) -> list[OAuth2Token]:
+        """Fetch tokens for several scope combinations concurrently"""
+        return list(await asyncio.gather(*(self.aget_token(s) for s in scope_sets)))
+
+    def _fetch_token(self, cache_key: str, scope_str: str) -> OAuth2Token:
+        """Store 확인 후 없으면 /token 호출 (single-flight로 한 스레드만 실행)"""
         token = self._read_cache(cache_key)
-        if token and not token.is_expired():
-            return token
+        if not token or token.is_expired(MEMORY_CACHE_SKEW_SECONDS):
+            token = self._request_token(cache_key, scope_str)
+        self._schedule_refresh(cache_key, scope_str, token)
+        return token
 
-        # Fetch new token
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client.client_id,
-            "client_secret": self.client.client_secret,
-        }
+    def _request_token(self, cache_key: str, scope_str: str) -> OAuth2Token:
+        body = self.client._fixed().form_client_credentials
         if scope_str:
-            data["scope"] = scope_str
+            body += f"&scope={_q(scope_str)}"
 
-        resp = self._post_token(data)
+        resp = self._post_token(body)
         token = OAuth2Token.from_token_response(resp, now=_now_utc())
 
         self._write_cache(cache_key, token)
         return token
 
-    def _post_token(self, data: Dict[str, Any]) -> Dict:
-        """POST to /token endpoint"""
-        session = self.client._get_session()
-        url = f"{self.client.http_auth.base_url}/token"
-        resp = session.post(url, data=data, timeout=self.client.timeout)
-        resp.raise_for_status()
-        return resp.json()
-
-    def _read_cache(self, key: str) -> Optional[OAuth2Token]:
-        if not self.client.store:
-            return None
-        return self.client.store.read(key)
+    def _schedule_refresh(self, cache_key: str, scope_str: str, token: OAuth2Token) -> None:
+        self.client._schedule_refresh(
+            cache_key, token, lambda: self._background_refresh(cache_key, scope_str)
+        )
 
-    def _write_cache(self, key: str, token: OAuth2Token) -> None:
-        if self.client.store:
-            self.client.store.write(key, token)
+    def _background_refresh(self, cache_key: str, scope_str: str) -> None:
+        """만료 전 선제 갱신 (실패 시 요청 경로의 지연 갱신에 맡김)"""
+        try:
+            token = self._request_token(cache_key, scope_str)
+        except Exception:
+            return
+        self._schedule_refresh(cache_key, scope_str, token)
 
 
 # ----------------------------
 # 3-Legged (Authorization Code + PKCE)
 # ----------------------------
-class _ThreeLegged:
+class _ThreeLegged(_TokenOps):
     """3-legged OAuth (Authorization Code) flow with optional PKCE"""
 
-    def __init__(self, client: AuthClient):
-        self.client = client
-
     def generate_pkce_pair(self, length: int = 64) -> tuple[str, str]:
         """
         Generate PKCE code_verifier and code_challenge (S256).
@@ -172,9 +462,12 @@ class _ThreeLegged:
         if not 43 <= length <= 128:
             raise ValueError("PKCE verifier length must be between 43 and 128")
 
-        verifier = base64.urlsafe_b64encode(os.urandom(length)).decode("ascii").rstrip("=")
-        digest = hashlib.sha256(verifier.encode("ascii")).digest()
-        challenge = base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+        # token_urlsafe는 패딩 없는 base64url 문자열을 반환하므로 length 글자로 자르기만 하면 됨
+        verifier = secrets.token_urlsafe(length)[:length]
+        h = _SHA256_TEMPLATE.copy()
+        h.update(verifier.encode("ascii"))
+        digest = h.digest()
+        challenge = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
         return verifier, challenge
 
     def build_authorize_url(
@@ -195,13 +488,15 @@ class _ThreeLegged:
         if not self.client.redirect_uri:
             raise ValueError("redirect_uri is required to build authorize URL")
 
-        scope_str = _join_scopes(scopes)
-        params = {
-            "response_type": response_type,
-            "client_id": self.client.client_id,
-            "redirect_uri": self.client.redirect_uri,
-            "scope": scope_str,
-        }
+        fixed = self.client._authorize_fixed
+        if fixed is None:
+            fixed = urllib.parse.urlencode({
+                "client_id": self.client.client_id,
+                "redirect_uri": self.client.redirect_uri,
+            })
+            self.client._authorize_fixed = fixed
+
+        params = {"scope": _join_scopes(scopes)}
         if state:
             params["state"] = state
         if prompt:
@@ -211,7 +506,8 @@ class _ThreeLegged:
             if code_challenge_method:
                 params["code_challenge_method"] = code_challenge_method
 
-        return f"{self.client.http_auth.base_url}/authorize?{urllib.parse.urlencode(params)}"
+        query = f"response_type={urllib.parse.quote_plus(response_type)}&{fixed}&{urllib.parse.urlencode(params)}"
+        return f"{self.client._url_authorize}?{query}"
 
     def exchange_code(
         self,
@@ -226,26 +522,18 @@ class _ThreeLegged:
         if not self.client.redirect_uri:
             raise ValueError("redirect_uri is required for code exchange")
 
-        data = {
-            "grant_type": "authorization_code",
-            "client_id": self.client.client_id,
-            "code": code,
-            "redirect_uri": self.client.redirect_uri,
-        }
-
-        # Confidential client: include client_secret
-        if self.client.client_secret:
-            data["client_secret"] = self.client.client_secret
+        # client_id, redirect_uri, client_secret(Confidential client)는 미리 인코딩됨
+        body = f"{self.client._fixed().form_authorization_code}&code={_q(code)}"
 
         # PKCE: include code_verifier
         if code_verifier:
-            data["code_verifier"] = code_verifier
+            body += f"&code_verifier={_q(code_verifier)}"
 
-        resp = self._post_token(data)
+        resp = self._post_token(body)
         token = OAuth2Token.from_token_response(resp, now=_now_utc())
 
         # Cache the token
-        cache_key = self._cache_key(token.scope or "")
+        cache_key = self._cache_key_3l(token.scope or "")
         self._write_cache(cache_key, token)
         return token
 
@@ -254,12 +542,24 @@ class _ThreeLegged:
         Get 3-legged token from cache (with auto-refresh if expired).
         Raises ValueError if no valid token found and refresh fails.
         """
-        scope_str = _join_scopes(scopes)
-        cache_key = self._cache_key(scope_str)
+        scopes = _materialize_scopes(scopes)
+        cache_key = self._cache_key_3l(_join_scopes(scopes))
+
+        return self.client._memory_cache.get_or_fetch(
+            cache_key,
+            lambda: self._fetch_token(cache_key, scopes),
+            wait_timeout=self.client.timeout,
+        )
+
+    async def aget_token(self, scopes: Iterable[str]) -> OAuth2Token:
+        """Async variant of get_token (shares the in-process cache with the sync path)"""
+        return await self.client._run_async(self.get_token, _materialize_scopes(scopes))
 
+    def _fetch_token(self, cache_key: str, scopes: Iterable[str]) -> OAuth2Token:
+        """Store 확인 후 만료 임박 시 refresh (single-flight로 한 스레드만 실행)"""
         token = self._read_cache(cache_key)
         if token:
-            if not token.is_expired():
+            if not token.is_expired(MEMORY_CACHE_SKEW_SECONDS):
                 return token
             # Try auto-refresh
             if token.refresh_token:
@@ -267,43 +567,21 @@ class _ThreeLegged:
                     return self.client.tokens.refresh(token.refresh_token, scopes=scopes)
                 except Exception:
                     pass
+            # 갱신 실패했지만 아직 유효한 토큰은 그대로 사용
+            if not token.is_expired():
+                return token
 
         raise ValueError(
             "No valid 3-legged token found. Please authorize first using build_authorize_url() and exchange_code()"
         )
 
-    def _cache_key(self, scope_str: str) -> str:
-        """Generate cache key for 3-legged token"""
-        normalized = _join_scopes(scope_str.split())
-        return f"{self.client.cache_prefix}:3l:{self.client.client_id}:{self.client.redirect_uri}:{normalized}"
-
-    def _post_token(self, data: Dict[str, Any]) -> Dict:
-        """POST to /token endpoint"""
-        session = self.client._get_session()
-        url = f"{self.client.http_auth.base_url}/token"
-        resp = session.post(url, data=data, timeout=self.client.timeout)
-        resp.raise_for_status()
-        return resp.json()
-
-    def _read_cache(self, key: str) -> Optional[OAuth2Token]:
-        if not self.client.store:
-            return None
-        return self.client.store.read(key)
-
-    def _write_cache(self, key: str, token: OAuth2Token) -> None:
-        if self.client.store:
-            self.client.store.write(key, token)
-
 
 # ----------------------------
 # Token Management (Refresh, Revoke, Logout)
 # ----------------------------
-class _Tokens:
+class _Tokens(_TokenOps):
     """Token lifecycle management: refresh, revoke, logout"""
 
-    def __init__(self, client: AuthClient):
-        self.client = client
-
     def refresh(
         self,
         refresh_token: str,
@@ -315,17 +593,11 @@ class _Tokens:
         - Optional scope parameter to request reduced scope
         - Updates cache
         """
-        data = {
-            "grant_type": "refresh_token",
-            "client_id": self.client.client_id,
-            "refresh_token": refresh_token,
-        }
-        if self.client.client_secret:
-            data["client_secret"] = self.client.client_secret
+        body = f"{self.client._fixed().form_refresh_token}&refresh_token={_q(refresh_token)}"
         if scopes:
-            data["scope"] = _join_scopes(scopes)
+            body += f"&scope={_q(_join_scopes(scopes))}"
 
-        resp = self._post_token(data)
+        resp = self._post_token(body)
         token = OAuth2Token.from_token_response(resp, now=_now_utc())
 
         # Update cache
@@ -333,6 +605,17 @@ class _Tokens:
         self._write_cache(cache_key, token)
         return token
 
+    async def arefresh(
+        self,
+        refresh_token: str,
+        *,
+        scopes: Optional[Iterable[str]] = None,
+    ) -> OAuth2Token:
+        """Async variant of refresh"""
+        if scopes is not None:
+            scopes = _materialize_scopes(scopes)
+        return await self.client._run_async(self.refresh, refresh_token, scopes=scopes)
+
     def revoke(
         self,
         token: str,
@@ -353,29 +636,85 @@ class _Tokens:
             data["client_secret"] = self.client.client_secret
 
         session = self.client._get_session()
-        url = f"{self.client.http_auth.base_url}/revoke"
-        resp = session.post(url, data=data, timeout=self.client.timeout)
+        resp = session.post(self.client._url_revoke, data=data, timeout=self.client.timeout)
         resp.raise_for_status()
+        # 폐기된 토큰을 메모리 캐시/저장소에서 더 이상 반환하지 않도록 제거
+        for key in self.client._memory_cache.discard_token(token):
+            if self.client.store:
+                self.client.store.delete(key)
 
     def revoke_all(self, token: OAuth2Token) -> None:
         """
         Convenience method to revoke both access and refresh tokens.
-        Continues even if one fails.
+        Continues even if one fails. Both revokes are issued concurrently.
         """
-        # Revoke access token
-        try:
+        pending = []
+        if token.access_token:
+            pending.append((token.access_token, "access_token"))
+        if token.refresh_token:
+            pending.append((token.refresh_token, "refresh_token"))
+
+        if len(pending) < 2:
+            for value, hint in pending:
+                self._revoke_safe(value, hint)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as ex:
+            futures = [ex.submit(self._revoke_safe, value, hint) for value, hint in pending]
+            for f in futures:
+                f.result()
+
+    def revoke_many(self, tokens: Iterable[OAuth2Token], *, max_workers: int = 8) -> None:
+        """
+        Revoke access/refresh tokens of many OAuth2Tokens (e.g. mass sign-out).
+        Requests are spread over a thread pool and reuse the pooled keep-alive session.
+        Continues even if some revokes fail.
+        """
+        pending = []
+        for token in tokens:
             if token.access_token:
-                self.revoke(token.access_token, token_type_hint="access_token")
-        except requests.HTTPError:
-            pass
+                pending.append((token.access_token, "access_token"))
+            if token.refresh_token:
+                pending.append((token.refresh_token, "refresh_token"))
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as ex:
+            futures = [ex.submit(self._revoke_safe, value, hint) for value, hint in pending]
+            for f in futures:
+                f.result()
 
-        # Revoke refresh token
+    def _revoke_safe(self, token: str, token_type_hint: str) -> None:
+        """revoke, ignoring HTTP errors"""
         try:
-            if token.refresh_token:
-                self.revoke(token.refresh_token, token_type_hint="refresh_token")
+            self.revoke(token, token_type_hint=token_type_hint)
         except requests.HTTPError:
             pass
 
+    async def arevoke(
+        self,
+        token: str,
+        *,
+        token_type_hint: Optional[str] = None,
+    ) -> None:
+        """Async variant of revoke"""
+        await self.client._run_async(self.revoke, token, token_type_hint=token_type_hint)
+
+    async def arevoke_all(self, token: OAuth2Token) -> None:
+        """
+        Async variant of revoke_all.
+        Access and refresh tokens are revoked concurrently; HTTP errors are ignored.
+        """
+        pending = []
+        if token.access_token:
+            pending.append(self.arevoke(token.access_token, token_type_hint="access_token"))
+        if token.refresh_token:
+            pending.append(self.arevoke(token.refresh_token, token_type_hint="refresh_token"))
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for r in results:
+            if isinstance(r, BaseException) and not isinstance(r, requests.HTTPError):
+                raise r
+
     def build_logout_url(
         self,
         *,
@@ -387,8 +726,8 @@ class _Tokens:
         """
         if post_logout_redirect_uri:
             params = {"post_logout_redirect_uri": post_logout_redirect_uri}
-            return f"{self.client.http_auth.base_url}/logout?{urllib.parse.urlencode(params)}"
-        return f"{self.client.http_auth.base_url}/logout"
+            return f"{self.client._url_logout}?{urllib.parse.urlencode(params)}"
+        return self.client._url_logout
 
     def full_signout(
         self,
@@ -405,23 +744,6 @@ class _Tokens:
             self.revoke_all(token)
         return self.build_logout_url(post_logout_redirect_uri=post_logout_redirect_uri)
 
-    def _cache_key_3l(self, scope_str: str) -> str:
-        """Generate cache key for 3-legged token"""
-        normalized = _join_scopes(scope_str.split())
-        return f"{self.client.cache_prefix}:3l:{self.client.client_id}:{self.client.redirect_uri}:{normalized}"
-
-    def _post_token(self, data: Dict[str, Any]) -> Dict:
-        """POST to /token endpoint"""
-        session = self.client._get_session()
-        url = f"{self.client.http_auth.base_url}/token"
-        resp = session.post(url, data=data, timeout=self.client.timeout)
-        resp.raise_for_status()
-        return resp.json()
-
-    def _write_cache(self, key: str, token: OAuth2Token) -> None:
-        if self.client.store:
-            self.client.store.write(key, token)
-
 
 # ----------------------------
 # User Profile (OIDC UserInfo)
@@ -438,28 +760,51 @@ class _User:
         Requires 3-legged access_token with 'user-profile:read' scope.
         """
         session = self.client._get_session()
-        url = f"{self.client.http_userprofile.base_url}/userinfo"
         headers = {
             "Authorization": f"Bearer {access_token}",
             "User-Agent": self.client.http_userprofile.user_agent,
         }
-        resp = session.get(url, headers=headers, timeout=self.client.timeout)
+        resp = session.get(self.client._url_userinfo, headers=headers, timeout=self.client.timeout)
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
 
 # ----------------------------
 # Helper Functions
 # ----------------------------
-def _join_scopes(scopes: Iterable[str]) -> str:
-    """Join scopes into sorted, unique, space-separated string"""
-    return " ".join(sorted(set(s.strip() for s in scopes if s and s.strip())))
+def _pooled_session() -> requests.Session:
+    """Session with a pooled HTTPS adapter and conservative retries"""
+    return _pooled_http_session(
+        retry=_CappedRetry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504]),
+    )
 
 
-def _now_utc():
-    """Get current UTC datetime"""
-    from datetime import datetime, timezone
+_JOINED_SCOPES: Dict[Any, str] = {}
+_JOINED_SCOPES_MAX = 1024
+
 
+def _join_scopes(scopes: Iterable[str] | str) -> str:
+    """Join scopes into sorted, unique, space-separated string (accepts a space-separated str too)"""
+    key = scopes if isinstance(scopes, (tuple, str)) else tuple(scopes)
+    # 반복되는 스코프 조합은 dict 조회 한 번으로 처리
+    joined = _JOINED_SCOPES.get(key)
+    if joined is not None:
+        return joined
+    # 결과는 intern하여 캐시 키 비교 비용 절감
+    items = key.split() if isinstance(key, str) else key
+    joined = sys.intern(" ".join(sorted({s.strip() for s in items if s and s.strip()})))
+    if len(_JOINED_SCOPES) < _JOINED_SCOPES_MAX:
+        _JOINED_SCOPES[key] = joined
+    return joined
+
+
+def _materialize_scopes(scopes: Iterable[str] | str) -> tuple[str, ...] | str:
+    """일회성 이터레이터를 고정하되, 미리 조인된 문자열/튜플은 그대로 사용"""
+    return scopes if isinstance(scopes, (tuple, str)) else tuple(scopes)
+
+
+def _now_utc() -> datetime:
+    """Get current UTC datetime"""
     return datetime.now(timezone.utc)
 
 
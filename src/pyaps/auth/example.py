@@ -6,22 +6,11 @@ from __future__ import annotations
 
 import os
 import secrets
-from pathlib import Path
+from pyaps._dotenv import load_dotenv
 from pyaps.auth.client import AuthClient, Scopes
 from pyaps.auth.token_store import InMemoryTokenStore
 
 # Load .env file if exists
-def load_dotenv():
-    """Simple .env loader"""
-    env_file = Path(__file__).parent.parent.parent.parent / '.env'
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
-
 load_dotenv()
 
 
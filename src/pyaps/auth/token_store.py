@@ -3,12 +3,19 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
-from datetime import datetime, timezone
+from dataclasses import InitVar, asdict, dataclass
+from datetime import datetime
 from typing import Dict, Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 파일 락 없이 동작 (원자적 교체만 보장)
+    fcntl = None
+
 @dataclass(frozen=True)
 class OAuth2Token:
     """
@@ -22,16 +29,22 @@ class OAuth2Token:
     expires_at: str
     refresh_token: Optional[str] = None
     scope: Optional[str] = None
+    # 만료 POSIX 타임스탬프를 이미 알고 있으면 전달하여 expires_at 재파싱 생략 (필드 아님)
+    expires_ts: InitVar[Optional[float]] = None
+
+    def __post_init__(self, expires_ts: Optional[float]) -> None:
+        # 만료 시각을 생성 시 한 번만 계산하여 monotonic 기준으로 보관 (직렬화 대상 아님)
+        if expires_ts is None:
+            try:
+                expires_ts = datetime.fromisoformat(self.expires_at.replace("Z", "+00:00")).timestamp()
+            except Exception:
+                object.__setattr__(self, "_mono_expiry", float("-inf"))
+                return
+        object.__setattr__(self, "_mono_expiry", time.monotonic() + (expires_ts - time.time()))
 
     def is_expired(self, skew_seconds: int = 30) -> bool:
         """토큰 만료 여부 확인. 네트워크 지연 등을 고려해 skew 여유를 둠"""
-        try:
-            dt = datetime.fromisoformat(self.expires_at.replace("Z", "+00:00"))
-        except Exception:
-            return True
-        
-        now = datetime.now(timezone.utc)
-        return (dt.timestamp() - now.timestamp()) <= skew_seconds
+        return time.monotonic() + skew_seconds >= self._mono_expiry
     
     @staticmethod
     def from_token_response(
@@ -50,19 +63,36 @@ class OAuth2Token:
                 "scope": "data:read data:write"
             }
         """
-        now = now or datetime.now(timezone.utc)
-        expires_in = int(resp.get("expires_in") or default_ttl)
-        expires_at = datetime.fromtimestamp(now.timestamp() + expires_in, tz=timezone.utc)
+        now_ts = now.timestamp() if now is not None else time.time()
+        expires_in = resp.get("expires_in")
+        # APS는 보통 정수를 반환하므로 int() 변환은 그 외 타입(문자열 등)에만 적용
+        if not expires_in:
+            expires_in = default_ttl
+        elif type(expires_in) is not int:
+            expires_in = int(expires_in)
+        # expires_at 문자열과 동일하게 초 단위로 내림한 타임스탬프를 그대로 전달
+        expires_ts = int(now_ts) + expires_in
+        # datetime 객체 생성 없이 gmtime 정수 필드로 ISO 8601(UTC) 문자열 구성
+        expires_at = "%04d-%02d-%02dT%02d:%02d:%02dZ" % time.gmtime(expires_ts)[:6]
         return OAuth2Token(
             access_token=resp["access_token"],
             token_type=resp.get("token_type", "Bearer"),
             refresh_token=resp.get("refresh_token"),
             scope=resp.get("scope"),
-            expires_at=expires_at.replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+            expires_at=expires_at,
+            expires_ts=float(expires_ts),
         )
     
 class TokenStore(ABC):
-    """토큰 저장소 인터페이스"""
+    """
+    토큰 저장소 인터페이스
+
+    - generation: delete/clear 때마다 증가하는 카운터
+      AuthClient의 메모리 캐시는 값이 바뀌면 캐시를 비워 삭제된 토큰을 계속 반환하지 않음
+      (구현하지 않은 저장소는 0으로 고정되어 메모리 캐시 무효화가 일어나지 않음)
+    """
+
+    generation: int = 0
     
     @abstractmethod
     def read(self, key: str) -> Optional[OAuth2Token]:
@@ -81,14 +111,20 @@ class TokenStore(ABC):
         """저장소 비우기"""
         raise NotImplementedError
 
+# free-threaded(no-GIL) 빌드에서는 dict 단일 연산의 원자성을 GIL에 기댈 수 없음
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
 class InMemoryTokenStore(TokenStore):
     """프로세스 메모리 기반 저장소(스레드 세이프)"""
 
     def __init__(self) -> None:
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._data: Dict[str, OAuth2Token] = {}
     
     def read(self, key: str) -> Optional[OAuth2Token]:
+        # 읽기는 GIL 하에서 원자적인 dict.get 한 번이므로 락 생략 (쓰기/삭제만 락)
+        if _GIL_ENABLED:
+            return self._data.get(key)
         with self._lock:
             return self._data.get(key)
     
@@ -99,7 +135,75 @@ class InMemoryTokenStore(TokenStore):
     def delete(self, key: str) -> None:
         with self._lock:
             self._data.pop(key, None)
+            self.generation += 1
     
     def clear(self) -> None:
         with self._lock:
-            self._data.clear()
\ No newline at end of file
+            self._data.clear()
+            self.generation += 1
+
+class FileTokenStore(TokenStore):
+    """
+    JSON 파일 기반 저장소 (프로세스 재시작/여러 프로세스 간 토큰 공유)
+
+    - 파일 형식: {key: OAuth2Token 필드 dict}
+    - 쓰기는 임시 파일 + os.replace로 원자적 교체, POSIX에서는 fcntl 락으로 프로세스 간 직렬화
+    - 파일이 바뀌지 않았으면(mtime/크기 동일) 다시 파싱하지 않고 메모리 사본 사용
+    - 토큰은 비밀 정보이므로 파일 권한 0600으로 생성
+    """
+
+    def __init__(self, path: str | os.PathLike = "~/.pyaps/tokens.json") -> None:
+        self.path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+        self._lock = threading.Lock()
+        self._data: Dict[str, OAuth2Token] = {}
+        self._stamp: Optional[tuple] = None
+
+    def read(self, key: str) -> Optional[OAuth2Token]:
+        with self._lock:
+            self._reload()
+            return self._data.get(key)
+
+    def write(self, key: str, token: OAuth2Token) -> None:
+        self._update(lambda data: data.__setitem__(key, token))
+
+    def delete(self, key: str) -> None:
+        self._update(lambda data: data.pop(key, None))
+        self.generation += 1
+
+    def clear(self) -> None:
+        self._update(lambda data: data.clear())
+        self.generation += 1
+
+    def _reload(self) -> None:
+        # self._lock을 보유한 상태에서 호출
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._data, self._stamp = {}, None
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            self._data = {k: OAuth2Token(**v) for k, v in raw.items()}
+        except (ValueError, TypeError, AttributeError):
+            # 손상된 파일은 빈 저장소로 취급 (다음 write에서 덮어씀)
+            self._data = {}
+        self._stamp = stamp
+
+    def _update(self, mutate) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock, open(self.path + ".lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            # 다른 프로세스가 쓴 내용을 반영한 뒤 수정
+            self._reload()
+            mutate(self._data)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({k: asdict(v) for k, v in self._data.items()}, f)
+            os.replace(tmp, self.path)
+            self._stamp = None
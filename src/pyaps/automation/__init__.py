@@ -1,16 +1,19 @@
 # src/pyaps/automation/__init__.py
-from .client import AutomationClient, AutomationError, DEFAULT_AUTOMATION_SCOPES
+from .client import AutomationClient, AutomationError, DEFAULT_AUTOMATION_SCOPES, DEFAULT_AUTOMATION_SCOPES_STR
 from .types import WorkItemArgument, WorkItemSpec, AppBundleSpec, ActivitySpec
-from .workflow import AutomationWorkflow, WorkItemResult
+from .workflow import AutomationWorkflow, WebhookCompletionRegistry, WorkItemResult, WorkItemStats
 
 __all__ = [
     "AutomationClient",
     "AutomationError",
     "DEFAULT_AUTOMATION_SCOPES",
+    "DEFAULT_AUTOMATION_SCOPES_STR",
     "WorkItemArgument",
     "WorkItemSpec",
     "AppBundleSpec",
     "ActivitySpec",
     "AutomationWorkflow",
     "WorkItemResult",
+    "WorkItemStats",
+    "WebhookCompletionRegistry",
 ]
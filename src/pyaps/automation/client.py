@@ -1,24 +1,77 @@
 # src/pyaps/automation/client.py
 from __future__ import annotations
-from typing import Any, Callable, Dict, Literal, Optional
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Dict, Iterable, Literal, Optional
 from pathlib import Path
 import requests
 
-from pyaps.http.client import HTTPClient, HTTPError  # ← 공용 모듈 사용
+from pyaps.http.client import HTTPClient, HTTPError, _CappedRetry, _json_dumps, _pooled_session  # ← 공용 모듈 사용
+from pyaps.automation.types import WorkItemSpec
 
 AutomationRegion = Literal["us-east", "eu-west"]
 
-DEFAULT_AUTOMATION_SCOPES = [
+DEFAULT_AUTOMATION_SCOPES: tuple[str, ...] = (
     "code:all", "data:read", "data:write", "data:create", "bucket:read", "bucket:create", "bucket:update",
-]
+)
+# 미리 조인된 스코프 문자열: get_token()에 그대로 전달 가능 (str은 해시가 캐시되어 조회가 가장 빠름)
+DEFAULT_AUTOMATION_SCOPES_STR = " ".join(DEFAULT_AUTOMATION_SCOPES)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_TERMINAL_STATUSES = frozenset({"success", "failed", "cancelled"})
+
+def _json_body(payload: Any) -> tuple[bytes, Dict[str, str]]:
+    """payload를 한 번 직렬화(orjson 우선)하여 (본문, 헤더) 반환"""
+    return _json_dumps(payload), _JSON_HEADERS
+
+@functools.lru_cache(maxsize=256)
+def _version_body(version: int) -> bytes:
+    """alias 갱신용 {"version": N} 본문 (버전별로 한 번만 직렬화)"""
+    return _json_dumps({"version": version})
+
+def _status_by_id(resp: Any) -> Dict[str, Dict[str, Any]]:
+    """/workitems/status 응답(list 또는 {"data": [...]})을 {workitem_id: 상태}로 변환"""
+    items = resp if isinstance(resp, list) else (resp or {}).get("data") or []
+    return {item.get("id"): item for item in items}
 
 class AutomationError(RuntimeError):
     def __init__(self, message: str, status: int, payload: Any | None = None):
-        super().__init__(f"[{status}] {message}")
+        # 메시지 문자열은 __str__에서 필요할 때만 생성 (args는 pickle 재생성용 원본 인자)
+        super().__init__(message, status, payload)
+        self.message = message
         self.status = status
         self.payload = payload
 
+    def __str__(self) -> str:
+        return f"[{self.status}] {self.message}"
+
 class AutomationClient:
+    # 경로 템플릿: 폴링 등 반복 호출 시 f-string 대신 %-포맷으로 경로 생성
+    # (__init__에서 base_url이 붙은 절대 URL로 인스턴스에 한 번 해석됨)
+    _APPBUNDLE = "/appbundles/%s"
+    _APPBUNDLE_ALIASES = "/appbundles/%s/aliases"
+    _APPBUNDLE_ALIAS = "/appbundles/%s/aliases/%s"
+    _APPBUNDLE_VERSIONS = "/appbundles/%s/versions"
+    _APPBUNDLE_VERSION = "/appbundles/%s/versions/%s"
+    _ACTIVITY = "/activities/%s"
+    _ACTIVITY_ALIASES = "/activities/%s/aliases"
+    _ACTIVITY_ALIAS = "/activities/%s/aliases/%s"
+    _ACTIVITY_VERSIONS = "/activities/%s/versions"
+    _ACTIVITY_VERSION = "/activities/%s/versions/%s"
+    _WORKITEM = "/workitems/%s"
+    _WORKITEMS = "/workitems"
+    _WORKITEMS_BATCH = "/workitems/batch"
+    _WORKITEMS_STATUS = "/workitems/status"
+    _WORKITEMS_COMBINE = "/workitems/combine"
+    _SERVICE_LIMITS = "/servicelimits/%s"
+    _PATH_TEMPLATES = (
+        "_APPBUNDLE", "_APPBUNDLE_ALIASES", "_APPBUNDLE_ALIAS", "_APPBUNDLE_VERSIONS", "_APPBUNDLE_VERSION",
+        "_ACTIVITY", "_ACTIVITY_ALIASES", "_ACTIVITY_ALIAS", "_ACTIVITY_VERSIONS", "_ACTIVITY_VERSION",
+        "_WORKITEM", "_WORKITEMS", "_WORKITEMS_BATCH", "_WORKITEMS_STATUS", "_WORKITEMS_COMBINE",
+        "_SERVICE_LIMITS",
+    )
+
     def __init__(
         self,
         token_provider: Callable[[], str],
@@ -37,10 +90,18 @@ class AutomationClient:
             user_agent: User-Agent 헤더 값
             timeout: 요청 타임아웃 (초)
             session: 커스텀 requests.Session (선택)
+                미지정 시 대량 폴링을 위한 커넥션 풀(최대 128)과
+                idempotent 메서드 재시도가 설정된 세션을 생성
             proxies: 프록시 설정 (선택)
             trust_env: 환경 변수에서 프록시 읽기 (기본: True)
         """
         base_url = f"https://developer.api.autodesk.com/da/{region}/v3"
+        if session is None:
+            # POST(WorkItem 생성 등)는 중복 실행 위험이 있어 재시도 대상에서 제외 (urllib3 기본값)
+            session = _pooled_session(
+                pool_maxsize=128,
+                retry=_CappedRetry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False),
+            )
         self.http = HTTPClient(
             token_provider,
             base_url=base_url,
@@ -50,6 +111,9 @@ class AutomationClient:
             proxies=proxies,
             trust_env=trust_env,
         )
+        # 절대 URL은 HTTPClient가 그대로 사용하므로 요청마다 base_url 결합이 생략됨
+        for name in self._PATH_TEMPLATES:
+            setattr(self, name, self.http.base_url + getattr(type(self), name))
 
     # ------- ForgeApps -------
     def get_me(self) -> Dict[str, Any]:
@@ -57,10 +121,12 @@ class AutomationClient:
 
     # ------- Engines -------
     def list_engines(self, *, page: Optional[int] = None, page_size: Optional[int] = None) -> Dict[str, Any]:
+        if page is None and page_size is None:
+            return self.http.get("/engines")
         params: Dict[str, Any] = {}
         if page is not None: params["page"] = page
         if page_size is not None: params["pageSize"] = page_size
-        return self.http.get("/engines", params=params or None)
+        return self.http.get("/engines", params=params)
 
     # ------- AppBundles -------
     def create_appbundle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -70,37 +136,37 @@ class AutomationClient:
         return self.http.get("/appbundles")
 
     def get_appbundle(self, appbundle_id: str) -> Dict[str, Any]:
-        return self.http.get(f"/appbundles/{appbundle_id}")
+        return self.http.get(self._APPBUNDLE % appbundle_id)
 
     def delete_appbundle(self, appbundle_id: str) -> None:
-        self.http.delete(f"/appbundles/{appbundle_id}")
+        self.http.delete(self._APPBUNDLE % appbundle_id)
 
     def create_appbundle_alias(self, appbundle_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.http.post(f"/appbundles/{appbundle_id}/aliases", json=payload)
+        return self.http.post(self._APPBUNDLE_ALIASES % appbundle_id, json=payload)
 
     def list_appbundle_aliases(self, appbundle_id: str) -> Dict[str, Any]:
-        return self.http.get(f"/appbundles/{appbundle_id}/aliases")
+        return self.http.get(self._APPBUNDLE_ALIASES % appbundle_id)
 
     def get_appbundle_alias_detail(self, appbundle_id: str, alias: str) -> Dict[str, Any]:
-        return self.http.get(f"/appbundles/{appbundle_id}/aliases/{alias}")
+        return self.http.get(self._APPBUNDLE_ALIAS % (appbundle_id, alias))
 
     def set_appbundle_alias(self, appbundle_id: str, alias: str, *, version: int) -> Dict[str, Any]:
-        return self.http.patch(f"/appbundles/{appbundle_id}/aliases/{alias}", json={"version": version})
+        return self.http.patch(self._APPBUNDLE_ALIAS % (appbundle_id, alias), data=_version_body(version), headers=_JSON_HEADERS)
 
     def delete_appbundle_alias(self, appbundle_id: str, alias: str):
-        self.http.delete(f"/appbundles/{appbundle_id}/aliases/{alias}")
+        self.http.delete(self._APPBUNDLE_ALIAS % (appbundle_id, alias))
 
     def create_appbundle_version(self, appbundle_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.http.post(f"/appbundles/{appbundle_id}/versions", json=payload)
+        return self.http.post(self._APPBUNDLE_VERSIONS % appbundle_id, json=payload)
 
     def list_appbundle_versions(self, appbundle_id: str) -> Dict[str, Any]:
-        return self.http.get(f"/appbundles/{appbundle_id}/versions")
+        return self.http.get(self._APPBUNDLE_VERSIONS % appbundle_id)
 
     def get_appbundle_version_detail(self, appbundle_id: str, version: str) -> Dict[str, Any]:
-        return self.http.get(f"/appbundles/{appbundle_id}/versions/{version}")
+        return self.http.get(self._APPBUNDLE_VERSION % (appbundle_id, version))
 
     def delete_appbundle_version(self, appbundle_id: str, version: str):
-        self.http.delete(f"/appbundles/{appbundle_id}/versions/{version}")
+        self.http.delete(self._APPBUNDLE_VERSION % (appbundle_id, version))
 
     # Presigned form upload (S3)
     def upload_form_file(self, upload_parameters: Dict[str, Any], file_path: str | Path, *, timeout: Optional[float] = None) -> None:
@@ -127,63 +193,150 @@ class AutomationClient:
         return self.http.get("/activities")
 
     def get_activity(self, activity_id: str) -> Dict[str, Any]:
-        return self.http.get(f"/activities/{activity_id}")
+        return self.http.get(self._ACTIVITY % activity_id)
 
     def delete_activity(self, activity_id: str):
-        self.http.delete(f"/activities/{activity_id}")
+        self.http.delete(self._ACTIVITY % activity_id)
 
     def create_activity_alias(self, activity_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.http.post(f"/activities/{activity_id}/aliases", json=payload)
+        return self.http.post(self._ACTIVITY_ALIASES % activity_id, json=payload)
 
     def list_activity_aliases(self, activity_id: str) -> Dict[str, Any]:
-        return self.http.get(f"/activities/{activity_id}/aliases")
+        return self.http.get(self._ACTIVITY_ALIASES % activity_id)
 
     def get_activity_alias_detail(self, activity_id: str, alias: str) -> Dict[str, Any]:
-        return self.http.get(f"/activities/{activity_id}/aliases/{alias}")
+        return self.http.get(self._ACTIVITY_ALIAS % (activity_id, alias))
 
     def set_activity_alias(self, activity_id: str, alias: str, *, version: int) -> Dict[str, Any]:
-        return self.http.patch(f"/activities/{activity_id}/aliases/{alias}", json={"version": version})
+        return self.http.patch(self._ACTIVITY_ALIAS % (activity_id, alias), data=_version_body(version), headers=_JSON_HEADERS)
 
     def delete_activity_alias(self, activity_id: str, alias: str):
-        self.http.delete(f"/activities/{activity_id}/aliases/{alias}")
+        self.http.delete(self._ACTIVITY_ALIAS % (activity_id, alias))
 
     def create_activity_version(self, activity_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.http.post(f"/activities/{activity_id}/versions", json=payload)
+        return self.http.post(self._ACTIVITY_VERSIONS % activity_id, json=payload)
 
     def list_activity_versions(self, activity_id: str) -> Dict[str, Any]:
-        return self.http.get(f"/activities/{activity_id}/versions")
+        return self.http.get(self._ACTIVITY_VERSIONS % activity_id)
 
     def get_activity_version(self, activity_id: str, version: int) -> Dict[str, Any]:
-        return self.http.get(f"/activities/{activity_id}/versions/{version}")
+        return self.http.get(self._ACTIVITY_VERSION % (activity_id, version))
 
     def delete_activity_version(self, activity_id: str, version: int):
-        self.http.delete(f"/activities/{activity_id}/versions/{version}")
+        self.http.delete(self._ACTIVITY_VERSION % (activity_id, version))
 
     # ------- WorkItems -------
     def start_workitem(self, spec: "WorkItemSpec | Dict[str, Any]") -> Dict[str, Any]:
-        body = spec.to_dict() if hasattr(spec, "to_dict") else spec
-        return self.http.post("/workitems", json=body)
+        body, hdrs = _json_body(spec.to_dict() if isinstance(spec, WorkItemSpec) else spec)
+        return self.http.post(self._WORKITEMS, data=body, headers=hdrs)
 
     def get_workitem(self, workitem_id: str) -> Dict[str, Any]:
-        return self.http.get(f"/workitems/{workitem_id}")
+        return self.http.get(self._WORKITEM % workitem_id)
 
     def cancel_workitem(self, workitem_id: str) -> None:
-        self.http.delete(f"/workitems/{workitem_id}")
+        self.http.delete(self._WORKITEM % workitem_id)
+
+    async def aget_workitem(self, workitem_id: str) -> Dict[str, Any]:
+        """get_workitem의 비동기 버전 (블로킹 호출을 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get_workitem, workitem_id)
+
+    async def poll_workitems(
+        self,
+        ids: Iterable[str],
+        *,
+        concurrency: int = 16,
+        interval: float = 10.0,
+        timeout: float = 3600.0,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 WorkItem 상태를 동시에 조회하며 모두 종료(success/failed/cancelled)될 때까지 대기
+
+        Args:
+            ids: WorkItem ID 목록
+            concurrency: 동시에 진행할 상태 조회 수
+            interval: 라운드 간 대기 시간 (초)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            {workitem_id: 마지막 상태 응답} (입력 순서 유지)
+
+        Raises:
+            TimeoutError: 타임아웃 발생
+        """
+        order = list(dict.fromkeys(ids))
+        results: Dict[str, Dict[str, Any]] = {}
+        sem = asyncio.Semaphore(max(1, concurrency))
+        deadline = time.monotonic() + timeout
+
+        async def _one(workitem_id: str) -> None:
+            async with sem:
+                results[workitem_id] = await self.aget_workitem(workitem_id)
+
+        pending = order
+        while pending:
+            await asyncio.gather(*(_one(i) for i in pending))
+            pending = [i for i in pending if results[i].get("status") not in _TERMINAL_STATUSES]
+            if not pending:
+                break
+            if time.monotonic() + interval > deadline:
+                raise TimeoutError(f"{len(pending)} WorkItem(s) still running after {timeout}s")
+            await asyncio.sleep(interval)
+        return {i: results[i] for i in order}
 
     def create_workitems_batch(self, workitems: "list[dict] | list[WorkItemSpec]") -> dict:
-        def _to_dict(wi): return wi.to_dict() if hasattr(wi, "to_dict") else wi
-        payload = [_to_dict(w) for w in workitems]
-        return self.http.post("/workitems/batch", json=payload)
+        # 항목별로 즉시 직렬화: 전체 N×M 중간 dict 트리를 한꺼번에 들고 있지 않음
+        body = b"[" + b",".join(
+            _json_dumps(w.to_dict() if isinstance(w, WorkItemSpec) else w) for w in workitems
+        ) + b"]"
+        return self.http.post(self._WORKITEMS_BATCH, data=body, headers=_JSON_HEADERS)
 
     def get_workitems_status(self, ids: "list[str]") -> dict:
-        return self.http.post("/workitems/status", json=ids)
+        return self.http.post(self._WORKITEMS_STATUS, json=ids)
+
+    def wait_for_workitems(
+        self,
+        ids: Iterable[str],
+        *,
+        poll_interval: float = 5.0,
+        timeout: float = 3600.0,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 WorkItem이 모두 종료(success/failed/cancelled)될 때까지 대기
+        - 라운드마다 미완료 ID만 /workitems/status 한 번으로 조회 (항목별 GET 폴링 대신)
+
+        Args:
+            ids: WorkItem ID 목록
+            poll_interval: 폴링 간격 (초)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            {workitem_id: 마지막 상태 응답} (입력 순서 유지)
+
+        Raises:
+            TimeoutError: 타임아웃 발생
+        """
+        order = list(dict.fromkeys(ids))
+        results: Dict[str, Dict[str, Any]] = {}
+        deadline = time.monotonic() + timeout
+
+        pending = order
+        while pending:
+            results.update(_status_by_id(self.get_workitems_status(pending)))
+            pending = [i for i in pending if (results.get(i) or {}).get("status") not in _TERMINAL_STATUSES]
+            if not pending:
+                break
+            if time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(f"{len(pending)} WorkItem(s) still running after {timeout}s")
+            time.sleep(poll_interval)
+        return {i: results[i] for i in order}
 
     def combine_workitems(self, payload: dict) -> dict:
-        return self.http.post("/workitems/combine", json=payload)
+        body, hdrs = _json_body(payload)
+        return self.http.post(self._WORKITEMS_COMBINE, data=body, headers=hdrs)
 
     # ------- ServiceLimits -------
     def get_service_limits(self, owner: str) -> Dict[str, Any]:
-        return self.http.get(f"/servicelimits/{owner}")
+        return self.http.get(self._SERVICE_LIMITS % owner)
 
     def put_service_limits(self, owner: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.http.request_json("PUT", f"/servicelimits/{owner}", json=payload)
\ No newline at end of file
+        return self.http.request_json("PUT", self._SERVICE_LIMITS % owner, json=payload)
\ No newline at end of file
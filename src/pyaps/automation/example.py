@@ -7,26 +7,15 @@ from __future__ import annotations
 import json
 import os
 import time
-from pathlib import Path
 
+from pyaps._dotenv import load_dotenv
 from pyaps.auth import AuthClient, Scopes, InMemoryTokenStore
-from pyaps.automation.client import AutomationClient, DEFAULT_AUTOMATION_SCOPES
+from pyaps.automation.client import AutomationClient, DEFAULT_AUTOMATION_SCOPES_STR
 from pyaps.datamanagement import DataManagementClient
 from pyaps.http.client import HTTPError
 
 
 # Load .env file if exists
-def load_dotenv():
-    """Simple .env loader"""
-    env_file = Path(__file__).parent.parent.parent.parent / '.env'
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
-
 load_dotenv()
 
 
@@ -54,7 +43,7 @@ def create_clients():
     )
 
     def token_provider() -> str:
-        token = auth_client.two_legged.get_token(DEFAULT_AUTOMATION_SCOPES)
+        token = auth_client.two_legged.get_token(DEFAULT_AUTOMATION_SCOPES_STR)
         return token.access_token
 
     auto = AutomationClient(
@@ -223,12 +212,8 @@ def example_workitems():
     print("    })")
     print("    workitem_id = workitem['id']")
     print()
-    print("    # 3. Poll workitem status")
-    print("    while True:")
-    print("        status = auto.get_workitem(workitem_id)")
-    print("        if status['status'] in ('success', 'failed', 'cancelled'):")
-    print("            break")
-    print("        time.sleep(10)")
+    print("    # 3. Wait for completion (one /workitems/status call per interval)")
+    print("    status = auto.wait_for_workitems([workitem_id], poll_interval=10)[workitem_id]")
 
     print("\n[5-2] Batch workitems (structure only)")
     print("  Usage:")
@@ -238,7 +223,10 @@ def example_workitems():
     print("    ]")
     print("    batch = auto.create_workitems_batch(workitems)")
     print("    batch_ids = [wi['id'] for wi in batch]")
-    print("    status = auto.get_workitems_status(batch_ids)")
+    print("    # Poll all items with a single batch status request per interval")
+    print("    # (instead of one get_workitem round-trip per item)")
+    print("    statuses = auto.wait_for_workitems(batch_ids, poll_interval=5)")
+    print("    failed = [i for i, s in statuses.items() if s['status'] != 'success']")
 
     print("\n[5-3] Cancel workitem (structure only)")
     print("  Usage:")
@@ -310,7 +298,7 @@ def example_complete_workflow():
     print()
     print("Step 5: Monitor and download results")
     print("  # Poll until completion")
-    print("  status = auto.get_workitem(workitem['id'])")
+    print("  status = auto.wait_for_workitems([workitem['id']])[workitem['id']]")
     print("  # Download output file from OSS when status == 'success'")
 
 
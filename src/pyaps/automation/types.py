@@ -1,22 +1,33 @@
 # src/pyaps/automation/types.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional
 
-@dataclass
+# 배치 제출 시 대량 생성되는 사양 객체의 인스턴스 __dict__ 제거 (slots는 Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Design Automation이 허용하는 인자 verb (잘못된 값은 요청 전에 실패시켜 왕복 비용 절약)
+_VALID_VERBS = frozenset(("get", "head", "put", "post", "patch", "read"))
+
+@dataclass(**_SLOTS)
 class WorkItemArgument:
     """
     Automation WorkItem 인자(입력/출력 공통 포맷)
     """
     url: str
-    verb: Literal["get", "put", "head"] = "get"
+    verb: Literal["get", "head", "put", "post", "patch", "read"] = "get"
     headers: Optional[Dict[str, str]] = None
     local_name: Optional[str] = None
     on_demand: Optional[bool] = None
     unzip: Optional[bool] = None
     description: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if self.verb not in _VALID_VERBS:
+            raise ValueError(f"Invalid verb {self.verb!r}; expected one of {sorted(_VALID_VERBS)}")
+
     def to_dict(self) -> Dict[str, Any]:
         d: Dict[str, Any] = {
             "url": self.url,
@@ -35,7 +46,7 @@ class WorkItemArgument:
             d["description"] = self.description
         return d
     
-@dataclass
+@dataclass(**_SLOTS)
 class WorkItemSpec:
     """
     WorkItem 생성 요청
@@ -63,7 +74,7 @@ class WorkItemSpec:
             d["onProgress"] = self.on_progress
         return d
 
-@dataclass
+@dataclass(**_SLOTS)
 class AppBundleSpec:
     """
     AppBundle 생성/버전 생성 시 사용되는 사양의 간단 래퍼
@@ -83,7 +94,7 @@ class AppBundleSpec:
             d["description"] = self.description
         return d
 
-@dataclass
+@dataclass(**_SLOTS)
 class ActivitySpec:
     """
     Activity 생성/버전 생성용 사양(유연성을 위해 dict 병행 권장)
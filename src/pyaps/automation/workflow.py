@@ -5,17 +5,94 @@ OSS 버킷/오브젝트 준비 → WorkItem 실행 → 결과 다운로드까지
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import hmac
+import mmap
+import os
+import queue
+import secrets
+import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Literal, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 
-from pyaps.automation.client import AutomationClient
+import requests
+
+from pyaps.automation.client import AutomationClient, _status_by_id
 from pyaps.automation.types import WorkItemSpec, WorkItemArgument
-from pyaps.datamanagement.client import DataManagementClient
+from pyaps.datamanagement.client import DataManagementClient, _upload_signed_s3_parts
+from pyaps.http.client import HTTPError, _BlockReader, _CappedRetry, _json_dumps, _json_loads, _pooled_session
 
 WorkItemStatus = Literal["pending", "inprogress", "success", "failed", "cancelled"]
 
+_TERMINAL_STATUSES = frozenset({"success", "failed", "cancelled"})
+
+# POST /signed 기본 유효 시간(분)과 signed URL 캐시 설정
+_POST_SIGNED_MINUTES = 60
+_SIGNED_URL_MARGIN = 300.0
+_SIGNED_URL_CACHE_SIZE = 256
+
+# 이 크기 이상의 입력 파일은 큰 블록 단위로 소켓에 기록 (기본 16KB 블록의 반복 오버헤드 감소)
+_LARGE_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+_LARGE_UPLOAD_BLOCK = 4 * 1024 * 1024
+
+# 멀티파트 업로드 기본값 (signeds3upload는 요청 1회에 최대 25개 파트 URL 발급)
+_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+# 파일 해시 캐시에 기록하지 않을 최근 수정 파일 기준 (나노초)
+_DIGEST_RACY_NS = 2_000_000_000
+
+# POST /workitems/batch 한 번에 제출할 최대 WorkItem 수
+_WORKITEM_BATCH_SIZE = 50
+
+
+class WorkItemStats(NamedTuple):
+    """
+    WorkItem 상태 응답의 stats를 한 번 파싱한 스냅샷 (속성 접근, 없는 항목은 None)
+
+    Example:
+        >>> def on_progress(status_data):
+        ...     s = WorkItemStats.from_status(status_data)
+        ...     print(s.queued, s.instructions_started)
+    """
+    queued: Optional[str] = None
+    download_started: Optional[str] = None
+    instructions_started: Optional[str] = None
+    instructions_ended: Optional[str] = None
+    upload_ended: Optional[str] = None
+    finished: Optional[str] = None
+    bytes_downloaded: Optional[int] = None
+    bytes_uploaded: Optional[int] = None
+
+    @classmethod
+    def from_status(cls, status_data: Dict[str, Any]) -> "WorkItemStats":
+        stats = status_data.get("stats")
+        if not stats:
+            return _EMPTY_STATS
+        return cls(*map(stats.get, _STATS_KEYS))
+
+
+# WorkItemStats 필드 순서대로의 APS stats 키
+_STATS_KEYS = (
+    "timeQueued",
+    "timeDownloadStarted",
+    "timeInstructionsStarted",
+    "timeInstructionsEnded",
+    "timeUploadEnded",
+    "timeFinished",
+    "bytesDownloaded",
+    "bytesUploaded",
+)
+_EMPTY_STATS = WorkItemStats()
+
 
 @dataclass
 class WorkItemResult:
@@ -27,6 +104,283 @@ class WorkItemResult:
     details: Optional[Dict[str, Any]] = None
 
 
+class WebhookCompletionRegistry:
+    """
+    onComplete 웹훅으로 WorkItem 완료를 전달받는 레지스트리 (폴링 대체)
+
+    - 웹훅 수신 핸들러(임의의 웹 프레임워크)는 POST 본문(dict)으로 resolve() 호출
+    - 또는 serve()로 표준 라이브러리 HTTP 서버를 백그라운드 스레드에서 실행
+      (추측하기 어려운 경로 토큰(path)으로 온 POST만 처리)
+    - AutomationWorkflow(completion_registry=...)에 전달하면 on_complete URL이 지정된
+      WorkItem은 웹훅 수신 즉시 완료 처리됨 (웹훅 유실 대비 저빈도 폴링 병행)
+    - 등록되지 않은 ID의 종료 웹훅은 등록 직전에 도착한 경우를 위해 최대 max_pending개,
+      pending_ttl초 동안만 보관하고 버림 (노출된 엔드포인트로 임의 ID가 와도 메모리가 늘지 않음)
+    """
+
+    def __init__(self, *, max_pending: int = 1024, pending_ttl: float = 300.0) -> None:
+        self._lock = threading.Lock()
+        self._events: Dict[str, threading.Event] = {}
+        self._payloads: Dict[str, Dict[str, Any]] = {}
+        # 미등록 ID의 종료 웹훅: workitem_id -> (수신 시각(monotonic), 본문), 오래된 순
+        self._pending: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.max_pending = max_pending
+        self.pending_ttl = pending_ttl
+        self._server: Optional[ThreadingHTTPServer] = None
+        # serve()가 웹훅을 받는 경로 ('/<토큰>'), on_complete_url에 그대로 붙여 사용
+        self.path: Optional[str] = None
+
+    def _event(self, workitem_id: str) -> threading.Event:
+        with self._lock:
+            ev = self._events.get(workitem_id)
+            if ev is None:
+                ev = self._events[workitem_id] = threading.Event()
+            return ev
+
+    def register(self, workitem_id: str) -> None:
+        """완료 통지를 기다릴 WorkItem 등록 (웹훅이 먼저 도착해도 pending_ttl 이내면 안전)"""
+        with self._lock:
+            ev = self._events.setdefault(workitem_id, threading.Event())
+            early = self._pending.pop(workitem_id, None)
+            if early is not None and time.monotonic() - early[0] < self.pending_ttl:
+                self._payloads[workitem_id] = early[1]
+                ev.set()
+
+    def is_registered(self, workitem_id: str) -> bool:
+        return workitem_id in self._events
+
+    def resolve(self, payload: Dict[str, Any]) -> bool:
+        """웹훅 본문 전달. 등록된 WorkItem의 종료 상태면 대기 중인 wait()를 깨우고 True 반환"""
+        workitem_id = payload.get("id") if isinstance(payload, dict) else None
+        if not workitem_id:
+            return False
+        terminal = payload.get("status") in _TERMINAL_STATUSES
+        with self._lock:
+            ev = self._events.get(workitem_id)
+            if ev is None:
+                if terminal:
+                    self._hold(workitem_id, payload)
+                return False
+            self._payloads[workitem_id] = payload
+        if not terminal:
+            return False
+        ev.set()
+        return True
+
+    def _hold(self, workitem_id: str, payload: Dict[str, Any]) -> None:
+        # self._lock을 보유한 상태에서 호출
+        now = time.monotonic()
+        self._pending[workitem_id] = (now, payload)
+        self._pending.move_to_end(workitem_id)
+        while self._pending and (
+            len(self._pending) > self.max_pending
+            or now - next(iter(self._pending.values()))[0] >= self.pending_ttl
+        ):
+            self._pending.popitem(last=False)
+
+    def wait(self, workitem_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """종료 상태 웹훅을 기다려 본문 반환. 시간 내 도착하지 않으면 None"""
+        if self._event(workitem_id).wait(timeout):
+            return self._payloads.get(workitem_id)
+        return None
+
+    def discard(self, workitem_id: str) -> None:
+        with self._lock:
+            self._events.pop(workitem_id, None)
+            self._payloads.pop(workitem_id, None)
+            self._pending.pop(workitem_id, None)
+
+    def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        *,
+        path_token: Optional[str] = None,
+    ) -> ThreadingHTTPServer:
+        """
+        웹훅 수신용 HTTP 서버를 데몬 스레드에서 시작
+
+        - 인증이 없는 엔드포인트이므로 기본은 loopback에만 바인딩 (리버스 프록시/터널로 외부에 노출)
+        - path_token: 웹훅 경로 비밀값 (미지정시 무작위 생성). '/<path_token>'으로 온 POST만 처리하고
+          그 외 경로는 404 → 임의의 클라이언트가 WorkItem 완료를 위조할 수 없음
+        - on_complete_url은 외부에서 접근 가능한 HTTPS URL + self.path 로 지정
+        """
+        registry = self
+        expected = "/" + (path_token or secrets.token_urlsafe(32))
+        self.path = expected
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                if not hmac.compare_digest(self.path.split("?", 1)[0].encode(), expected.encode()):
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    registry.resolve(_json_loads(self.rfile.read(length) or b"{}"))
+                    self.send_response(200)
+                except ValueError:
+                    self.send_response(400)
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+    def close(self) -> None:
+        """serve()로 시작한 서버 종료"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self.path = None
+
+
+class _PollHub:
+    """
+    여러 스레드의 wait_for_completion이 공유하는 단일 폴링 스레드
+    - 라운드마다 대기 중인 모든 WorkItem을 /workitems/status 한 번으로 조회하고 항목별 Event로 통지
+    - 대기자가 없으면 스레드 종료, 다음 대기자가 생기면 다시 시작
+    """
+
+    def __init__(self, auto: AutomationClient) -> None:
+        self._auto = auto
+        self._lock = threading.Lock()
+        # workitem_id -> [(Event, [마지막 상태 또는 예외], 폴링 간격), ...] (같은 ID를 여러 스레드가 기다릴 수 있음)
+        self._waiters: Dict[str, List[Tuple[threading.Event, list, float]]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def wait(
+        self,
+        workitem_id: str,
+        poll_interval: float,
+        timeout: float,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        event, slot = threading.Event(), []
+        waiter = (event, slot, poll_interval)
+        with self._lock:
+            self._waiters.setdefault(workitem_id, []).append(waiter)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pyaps-poll-hub", daemon=True)
+                self._thread.start()
+
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                if not event.wait(max(0.0, deadline - time.monotonic())):
+                    raise TimeoutError(f"WorkItem {workitem_id} timed out after {timeout}s")
+                event.clear()
+                status_data = slot[0]
+                if isinstance(status_data, BaseException):
+                    raise status_data
+                if on_progress:
+                    on_progress(status_data)
+                if status_data.get("status") in _TERMINAL_STATUSES:
+                    return status_data
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(workitem_id, [])
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[workitem_id]
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    return
+                ids = list(self._waiters)
+                interval = min(w[2] for waiters in self._waiters.values() for w in waiters)
+
+            try:
+                updates = _status_by_id(self._auto.get_workitems_status(ids))
+            except Exception as e:
+                updates = dict.fromkeys(ids, e)
+
+            with self._lock:
+                for workitem_id, status_data in updates.items():
+                    for event, slot, _ in self._waiters.get(workitem_id, ()):
+                        slot[:] = [status_data]
+                        event.set()
+            time.sleep(interval)
+
+
+class _PollSchedule:
+    """
+    적응형 폴링 간격
+    - 상태(status)/진행 메시지(progress)가 그대로면 backoff배씩 늘려 max_interval에서 상한
+    - 둘 중 하나라도 바뀌면 min_interval로 복귀 (진행 중 변화가 잦은 구간은 짧게 폴링)
+    """
+
+    __slots__ = ("min_interval", "max_interval", "backoff", "_interval", "_last")
+
+    def __init__(self, min_interval: float, max_interval: float, backoff: float) -> None:
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._interval = self.min_interval
+        self._last: Optional[tuple] = None
+
+    def next(self, status_data: Dict[str, Any]) -> float:
+        """방금 받은 상태를 반영해 다음 폴링까지 대기할 시간 반환"""
+        marker = (status_data.get("status"), status_data.get("progress"))
+        if self._last is not None and marker != self._last:
+            self._interval = self.min_interval
+        self._last = marker
+        interval = self._interval
+        self._interval = min(interval * self.backoff, self.max_interval)
+        return interval
+
+
+class _ProgressDispatcher:
+    """
+    진행 상황 콜백을 백그라운드 스레드에서 실행하는 호출 가능 객체 (with 블록 동안 유효)
+    - 폴링 스레드는 상한이 있는 큐에 넣기만 하고 바로 복귀, 큐가 가득 차면 가장 오래된 상태를 버림
+    - with 블록 종료 시 남은 상태를 모두 전달한 뒤 스레드 종료
+    """
+
+    _STOP = object()
+
+    def __init__(self, callback: Callable[[Dict[str, Any]], None], maxsize: int = 16) -> None:
+        self._callback = callback
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="pyaps-progress", daemon=True)
+
+    def __enter__(self) -> "_ProgressDispatcher":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def __call__(self, status_data: Dict[str, Any]) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(status_data)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _run(self) -> None:
+        while True:
+            status_data = self._queue.get()
+            if status_data is self._STOP:
+                return
+            try:
+                self._callback(status_data)
+            except Exception:
+                # 콜백 오류로 인해 이후 진행 상황 전달이 멈추지 않도록 무시
+                pass
+
+
 class AutomationWorkflow:
     """
     Design Automation WorkItem 실행을 위한 고수준 워크플로우
@@ -45,20 +399,109 @@ class AutomationWorkflow:
         default_bucket: Optional[str] = None,
         poll_interval: float = 10.0,
         timeout: float = 3600.0,
+        completion_registry: Optional[WebhookCompletionRegistry] = None,
+        webhook_fallback_interval: float = 60.0,
+        min_poll_interval: float = 1.0,
+        poll_backoff: float = 1.5,
+        bucket_cache_ttl: float = 3600.0,
+        download_session: Optional[requests.Session] = None,
+        shared_polling: bool = False,
+        async_workers: Optional[int] = None,
+        single_presign: bool = False,
+        multipart_threshold: Optional[int] = _MULTIPART_THRESHOLD,
+        multipart_part_size: int = _MULTIPART_PART_SIZE,
+        multipart_concurrency: int = 8,
+        digest_cache_path: Optional[str | Path] = None,
     ):
         """
         Args:
             automation_client: Design Automation API 클라이언트
             data_client: Data Management API 클라이언트 (OSS 접근용)
             default_bucket: 기본 OSS 버킷 키
-            poll_interval: WorkItem 상태 폴링 간격 (초)
+            poll_interval: WorkItem 상태 폴링 최대 간격 (초)
             timeout: WorkItem 최대 대기 시간 (초)
+            completion_registry: onComplete 웹훅 수신 레지스트리 (선택)
+                지정 시 on_complete URL과 함께 시작한 WorkItem은 폴링 대신 웹훅으로 완료 감지
+            webhook_fallback_interval: 웹훅 대기 중 유실 대비 상태 확인 간격 (초)
+            min_poll_interval: 첫 폴링 간격 (초). 상태 변화가 없으면 poll_backoff배씩 늘어 poll_interval에서 상한
+            poll_backoff: 상태/진행 메시지가 그대로일 때 폴링 간격 증가 배수 (변화가 보이면 min_poll_interval로 복귀)
+            bucket_cache_ttl: ensure_bucket()으로 확인한 버킷을 재확인 없이 신뢰할 시간 (초)
+            download_session: S3 signed URL 다운로드/파트 업로드용 requests.Session (선택)
+                미지정 시 커넥션 풀과 재시도(429/5xx)가 설정된 Session을 생성하고 OSS 클라이언트의 프록시 설정을 따름
+            shared_polling: True면 여러 스레드의 wait_for_completion이 스레드별 sleep 폴링 대신
+                하나의 백그라운드 스레드를 공유 (poll_interval마다 /workitems/status 1회로 일괄 조회)
+            async_workers: 비동기 메서드(arun_workitem_with_files 등) 전용 스레드 풀 크기 (선택)
+                미지정 시 이벤트 루프의 기본 executor 사용 (최대 min(32, CPU+4) 스레드)
+                대용량 파일 업로드/다운로드를 많이 동시에 돌릴 때는 download_session 풀 크기(64) 이하로 지정 권장
+            single_presign: True면 입력 파일 URL을 POST /signed(readwrite) 한 번으로 발급받아
+                업로드와 WorkItem 다운로드에 함께 사용 (업로드 후 signeds3download 왕복 1회 생략,
+                대신 WorkItem은 S3 직접 URL이 아닌 OSS signed URL로 입력을 받음)
+            multipart_threshold: 이보다 큰 입력 파일은 signeds3upload 멀티파트로 파트를 병렬 업로드 (None이면 항상 단일 PUT)
+            multipart_part_size: 멀티파트 파트 크기 (바이트, S3 최소 5MB)
+            multipart_concurrency: 동시에 업로드할 최대 파트 수 (메모리 사용량 ≈ 파트 크기 × 이 값)
+            digest_cache_path: skip_if_unchanged/dedupe용 파일 해시를 저장할 JSON 파일 (선택)
+                수정 시각과 크기가 그대로인 파일은 재실행 시에도 다시 해시하지 않음 (미지정시 이 인스턴스 안에서만 재사용)
         """
         self.auto = automation_client
         self.dm = data_client
         self.default_bucket = default_bucket
         self.poll_interval = poll_interval
         self.timeout = timeout
+        self.completion_registry = completion_registry
+        self.webhook_fallback_interval = webhook_fallback_interval
+        self.min_poll_interval = min_poll_interval
+        self.poll_backoff = poll_backoff
+        self.bucket_cache_ttl = bucket_cache_ttl
+        # bucket_key -> (확인 시각(monotonic), 버킷 정보)
+        self._verified_buckets: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # (종류, bucket_key, object_key, 유효 분) -> (signed 응답, 만료 시각(monotonic)), LRU
+        self._signed_url_cache: "OrderedDict[tuple, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._signed_url_lock = threading.Lock()
+        # dedupe 업로드 기록: (bucket_key, object_key, sha256) -> 업로드 시각(monotonic), 및 키별 업로드 락
+        # (bucket_cache_ttl이 지나면 오브젝트가 만료/삭제되었을 수 있으므로 다시 업로드)
+        self._uploaded_hashes: Dict[tuple, float] = {}
+        self._uploaded_lock = threading.Lock()  # _uploaded_hashes 기록/정리 보호 (업로드 자체는 키별 락)
+        self._upload_locks: Dict[tuple, threading.Lock] = {}
+        self._digests = _DigestCache(digest_cache_path)
+        if download_session is None:
+            # S3 signed URL 호스트로의 연결을 다운로드 간에 재사용 (매번 TCP/TLS 핸드셰이크 방지)
+            download_session = _pooled_session(
+                retry=_CappedRetry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+            )
+            oss_session = self.dm.http_oss.session
+            download_session.proxies.update(getattr(oss_session, "proxies", None) or {})
+            download_session.trust_env = getattr(oss_session, "trust_env", True)
+        self.download_session = download_session
+        self.shared_polling = shared_polling
+        # 스레드는 첫 대기자가 생길 때 시작
+        self._poll_hub = _PollHub(automation_client)
+        self.async_workers = async_workers
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+        self._async_executor_lock = threading.Lock()
+        self.single_presign = single_presign
+        self.multipart_threshold = multipart_threshold
+        self.multipart_part_size = multipart_part_size
+        self.multipart_concurrency = multipart_concurrency
+
+    def close(self) -> None:
+        """비동기 전용 스레드 풀 정리"""
+        with self._async_executor_lock:
+            executor, self._async_executor = self._async_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def _run_async(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """동기 호출을 워커 스레드에서 실행 (async_workers 지정 시 전용 풀 사용)"""
+        if self.async_workers is None:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        with self._async_executor_lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=self.async_workers, thread_name_prefix="pyaps-workflow"
+                )
+            executor = self._async_executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
 
     # ==================== Step 1: OSS 준비 ====================
 
@@ -78,17 +521,23 @@ class AutomationWorkflow:
             policy_key: 보관 정책 (transient=24시간, temporary=30일, persistent=영구)
 
         Returns:
-            버킷 정보
+            버킷 정보 (bucket_cache_ttl 이내에 확인된 버킷은 API 호출 없이 캐시 반환,
+            이후 signed URL 발급이 404로 실패하면 캐시에서 제거되어 다음 호출에서 다시 확인/생성)
         """
+        cached = self._verified_buckets.get(bucket_key)
+        if cached and time.monotonic() - cached[0] < self.bucket_cache_ttl:
+            return cached[1]
         try:
-            return self.dm.buckets.get(bucket_key)
+            info = self.dm.buckets.get(bucket_key)
         except Exception:
             # 버킷이 없으면 생성
-            return self.dm.buckets.create(
+            info = self.dm.buckets.create(
                 bucket_key,
                 region=region,
                 policy_key=policy_key,
             )
+        self._verified_buckets[bucket_key] = (time.monotonic(), info)
+        return info
 
     def upload_input_file(
         self,
@@ -97,6 +546,8 @@ class AutomationWorkflow:
         bucket_key: Optional[str] = None,
         object_key: Optional[str] = None,
         timeout: Optional[float] = None,
+        skip_if_unchanged: bool = False,
+        dedupe: bool = False,
     ) -> str:
         """
         입력 파일을 OSS에 업로드하고 다운로드 URL 반환
@@ -106,6 +557,10 @@ class AutomationWorkflow:
             bucket_key: OSS 버킷 키 (미지정시 default_bucket 사용)
             object_key: OSS 오브젝트 키 (미지정시 파일명 사용)
             timeout: 업로드 타임아웃
+            skip_if_unchanged: OSS 오브젝트의 크기/SHA-1이 로컬 파일과 같으면 업로드 생략
+                (재실행 시 대용량 PUT 절약, 대신 오브젝트 상세 조회 1회 추가)
+            dedupe: 내용(SHA-256)이 같은 파일을 이 워크플로우에서 bucket_cache_ttl 이내에 업로드했다면 다시 업로드하지 않음
+                (object_key 미지정시 '<해시 16자리>-<파일명>'을 키로 사용)
 
         Returns:
             Signed download URL (WorkItem arguments에서 사용)
@@ -115,23 +570,95 @@ class AutomationWorkflow:
             raise ValueError("bucket_key must be provided or default_bucket must be set")
 
         local_path = Path(local_path)
-        object_key = object_key or local_path.name
+        if dedupe:
+            digest = self._digests.get(local_path, "sha256")
+            object_key = object_key or f"{digest[:16]}-{local_path.name}"
+            key = (bucket_key, object_key, digest)
+            # 같은 내용을 동시에 올리려는 스레드는 먼저 시작한 업로드가 끝날 때까지 대기
+            with self._upload_locks.setdefault(key, threading.Lock()):
+                with self._uploaded_lock:
+                    uploaded_at = self._uploaded_hashes.get(key)
+                if uploaded_at is None or time.monotonic() - uploaded_at >= self.bucket_cache_ttl:
+                    self._upload(bucket_key, object_key, local_path, timeout, skip_if_unchanged)
+                    with self._uploaded_lock:
+                        self._uploaded_hashes[key] = time.monotonic()
+        else:
+            object_key = object_key or local_path.name
+            self._upload(bucket_key, object_key, local_path, timeout, skip_if_unchanged)
+
+        if self.single_presign:
+            return self._signed_pair(bucket_key, object_key)["download_url"]
 
-        # OSS에 업로드
-        signed_upload = self.dm.objects.post_signed(
-            bucket_key, object_key, access="readwrite"
+        # 다운로드 URL 생성 (WorkItem에서 사용할 것)
+        signed_download = self._signed(
+            "download", bucket_key, object_key, 60,
+            lambda: self.dm.objects.get_signed_download(bucket_key, object_key, minutes_valid=60),
+        )
+        return signed_download.get("url") or signed_download.get("signedUrl")
+
+    def _signed_pair(self, bucket_key: str, object_key: str) -> Dict[str, Any]:
+        """업로드/다운로드 겸용 signed URL (single_presign 모드)"""
+        return self._signed(
+            "signed_pair", bucket_key, object_key, _POST_SIGNED_MINUTES,
+            lambda: self.dm.objects.post_signed_pair(bucket_key, object_key, minutes_valid=_POST_SIGNED_MINUTES),
         )
 
-        with open(local_path, "rb") as f:
-            file_data = f.read()
+    def _upload(
+        self,
+        bucket_key: str,
+        object_key: str,
+        local_path: Path,
+        timeout: Optional[float],
+        skip_if_unchanged: bool,
+    ) -> None:
+        """POST /signed로 받은 URL에 로컬 파일을 스트리밍 업로드"""
+        if skip_if_unchanged and self._object_matches(bucket_key, object_key, local_path):
+            return
 
-        self.dm.objects.upload_via_signed(signed_upload, file_data, timeout=timeout)
+        size = local_path.stat().st_size
+        if self.multipart_threshold is not None and size > self.multipart_threshold:
+            self._upload_multipart(bucket_key, object_key, local_path, size, timeout)
+            return
 
-        # 다운로드 URL 생성 (WorkItem에서 사용할 것)
-        signed_download = self.dm.objects.get_signed_download(
-            bucket_key, object_key, minutes_valid=60
+        # OSS에 업로드
+        if self.single_presign:
+            signed_upload = self._signed_pair(bucket_key, object_key)
+        else:
+            signed_upload = self._signed(
+                "post_signed", bucket_key, object_key, _POST_SIGNED_MINUTES,
+                lambda: self.dm.objects.post_signed(bucket_key, object_key, access="readwrite"),
+            )
+
+        # 파일 핸들을 그대로 전달하여 스트리밍 업로드 (전체 파일을 메모리에 올리지 않음)
+        with open(local_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            body = _BlockReader(f, size, _LARGE_UPLOAD_BLOCK) if size >= _LARGE_UPLOAD_THRESHOLD else f
+            self.dm.objects.upload_via_signed(signed_upload, body, timeout=timeout)
+
+    def _upload_multipart(
+        self,
+        bucket_key: str,
+        object_key: str,
+        local_path: Path,
+        size: int,
+        timeout: Optional[float],
+    ) -> None:
+        """signeds3upload 멀티파트 업로드 (download_session의 커넥션 풀로 파트를 병렬 PUT)"""
+        _upload_signed_s3_parts(
+            self.dm.objects, bucket_key, object_key, local_path,
+            size=size, part_size=self.multipart_part_size, concurrency=self.multipart_concurrency,
+            session=self.download_session, timeout=timeout or 300,
         )
-        return signed_download.get("url") or signed_download.get("signedUrl")
+
+    def _object_matches(self, bucket_key: str, object_key: str, local_path: Path) -> bool:
+        """OSS 오브젝트가 로컬 파일과 동일한지 확인 (크기 비교 후 일치할 때만 SHA-1 계산)"""
+        try:
+            details = self.dm.objects.get_details(bucket_key, object_key) or {}
+        except HTTPError:
+            return False
+        if details.get("size") != local_path.stat().st_size or not details.get("sha1"):
+            return False
+        return details["sha1"].lower() == self._digests.get(local_path, "sha1")
 
     def prepare_output_url(
         self,
@@ -156,11 +683,58 @@ class AutomationWorkflow:
             raise ValueError("bucket_key must be provided or default_bucket must be set")
 
         # 업로드용 signed URL 생성
-        signed = self.dm.objects.post_signed(
-            bucket_key, object_key, access="readwrite"
+        signed = self._signed(
+            "post_signed", bucket_key, object_key, _POST_SIGNED_MINUTES,
+            lambda: self.dm.objects.post_signed(bucket_key, object_key, access="readwrite"),
         )
         return signed.get("url") or signed.get("signedUrl")
 
+    def _signed(
+        self,
+        kind: str,
+        bucket_key: str,
+        object_key: str,
+        minutes_valid: int,
+        fetch: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Signed URL 응답 LRU 캐시 (만료 _SIGNED_URL_MARGIN초 전부터는 새로 발급)"""
+        key = (kind, bucket_key, object_key, minutes_valid)
+        with self._signed_url_lock:
+            hit = self._signed_url_cache.get(key)
+            if hit and hit[1] - time.monotonic() > _SIGNED_URL_MARGIN:
+                self._signed_url_cache.move_to_end(key)
+                return hit[0]
+        expires_at = time.monotonic() + minutes_valid * 60
+        try:
+            signed = fetch()
+        except HTTPError as e:
+            if e.status == 404:
+                # 버킷이 삭제되었을 수 있으므로 다음 ensure_bucket()에서 다시 확인(필요시 생성)
+                self._verified_buckets.pop(bucket_key, None)
+                with self._uploaded_lock:
+                    for k in [k for k in self._uploaded_hashes if k[0] == bucket_key]:
+                        del self._uploaded_hashes[k]
+            raise
+        with self._signed_url_lock:
+            self._signed_url_cache[key] = (signed, expires_at)
+            self._signed_url_cache.move_to_end(key)
+            while len(self._signed_url_cache) > _SIGNED_URL_CACHE_SIZE:
+                self._signed_url_cache.popitem(last=False)
+        return signed
+
+    def invalidate_signed_urls(self, bucket_key: str, object_keys: Optional[Iterable[str]] = None) -> None:
+        """
+        캐시된 signed URL 폐기 (다음 요청에서 새로 발급)
+
+        Args:
+            bucket_key: OSS 버킷 키
+            object_keys: 폐기할 오브젝트 키 목록 (미지정시 버킷의 모든 URL)
+        """
+        keys = None if object_keys is None else set(object_keys)
+        with self._signed_url_lock:
+            for key in [k for k in self._signed_url_cache if k[1] == bucket_key and (keys is None or k[2] in keys)]:
+                del self._signed_url_cache[key]
+
     # ==================== Step 2: WorkItem 실행 ====================
 
     def start_workitem(
@@ -189,24 +763,31 @@ class AutomationWorkflow:
             콜백 URL은 공개적으로 접근 가능한 HTTPS 엔드포인트여야 합니다.
             onComplete 콜백에는 WorkItem 상태, 결과, 통계 등이 포함된 JSON이 전송됩니다.
         """
-        # WorkItemArgument 변환
-        converted_args = {}
-        for key, arg in arguments.items():
-            if isinstance(arg, dict):
-                converted_args[key] = WorkItemArgument(**arg)
-            else:
-                converted_args[key] = arg
+        # WorkItemArgument 변환 (이미 WorkItemArgument인 값은 그대로 사용)
+        converted_args = {
+            key: WorkItemArgument(**arg) if isinstance(arg, dict) else arg
+            for key, arg in arguments.items()
+        }
 
-        spec = WorkItemSpec(
+        return self.start_workitem_spec(WorkItemSpec(
             activity_id=activity_id,
             arguments=converted_args,
             nickname=nickname,
             on_complete=on_complete,
             on_progress=on_progress,
-        )
+        ))
 
-        result = self.auto.start_workitem(spec)
-        return result["id"]
+    def start_workitem_spec(self, spec: WorkItemSpec) -> str:
+        """
+        미리 만든 WorkItemSpec으로 WorkItem 시작 (인자 변환 없음)
+
+        Returns:
+            WorkItem ID
+        """
+        workitem_id = self.auto.start_workitem(spec)["id"]
+        if spec.on_complete and self.completion_registry is not None:
+            self.completion_registry.register(workitem_id)
+        return workitem_id
 
     def wait_for_completion(
         self,
@@ -215,15 +796,25 @@ class AutomationWorkflow:
         poll_interval: Optional[float] = None,
         timeout: Optional[float] = None,
         on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        async_progress: bool = False,
+        min_interval: Optional[float] = None,
+        backoff: Optional[float] = None,
     ) -> WorkItemResult:
         """
         WorkItem 완료 대기
 
+        폴링 간격은 적응형입니다: min_interval에서 시작해 상태(status)와 진행 메시지(progress)가 그대로면
+        backoff배씩 늘어 poll_interval에서 상한, 둘 중 하나라도 바뀌면 다시 min_interval부터 시작합니다.
+
         Args:
             workitem_id: WorkItem ID
-            poll_interval: 폴링 간격 (초)
+            poll_interval: 최대 폴링 간격 (초)
             timeout: 최대 대기 시간 (초)
             on_progress: 진행 상황 콜백 함수
+            min_interval: 최소 폴링 간격 (초, 미지정시 min_poll_interval)
+            backoff: 변화가 없을 때 간격 증가 배수 (미지정시 poll_backoff)
+            async_progress: True면 on_progress를 별도 스레드에서 호출 (느린 콜백이 폴링 주기를 늦추지 않음)
+                밀린 상태가 16개를 넘으면 가장 오래된 것부터 버리며, 반환 전에 남은 콜백을 모두 처리
 
         Returns:
             WorkItem 실행 결과
@@ -232,10 +823,31 @@ class AutomationWorkflow:
             TimeoutError: 타임아웃 발생
             RuntimeError: WorkItem 실행 실패
         """
+        if async_progress and on_progress is not None:
+            with _ProgressDispatcher(on_progress) as dispatch:
+                return self.wait_for_completion(
+                    workitem_id, poll_interval=poll_interval, timeout=timeout, on_progress=dispatch,
+                    min_interval=min_interval, backoff=backoff,
+                )
+
         poll_interval = poll_interval or self.poll_interval
         timeout = timeout or self.timeout
 
+        registry = self.completion_registry
+        if registry is not None and registry.is_registered(workitem_id):
+            return self._wait_for_webhook(registry, workitem_id, timeout, on_progress)
+
+        if self.shared_polling:
+            # 공유 폴러의 다음 라운드를 기다리기 전에 한 번 바로 확인 (이미 끝난 짧은 작업은 즉시 반환)
+            status_data = self.auto.get_workitem(workitem_id)
+            if on_progress:
+                on_progress(status_data)
+            if status_data.get("status") not in _TERMINAL_STATUSES:
+                status_data = self._poll_hub.wait(workitem_id, poll_interval, timeout, on_progress)
+            return _to_result(workitem_id, status_data)
+
         start_time = time.time()
+        schedule = self._poll_schedule(poll_interval, min_interval, backoff)
 
         while True:
             elapsed = time.time() - start_time
@@ -250,16 +862,91 @@ class AutomationWorkflow:
             if on_progress:
                 on_progress(status_data)
 
-            if status in ("success", "failed", "cancelled"):
-                return WorkItemResult(
-                    workitem_id=workitem_id,
-                    status=status,
-                    report_url=status_data.get("reportUrl"),
-                    stats=status_data.get("stats"),
-                    details=status_data,
-                )
+            if status in _TERMINAL_STATUSES:
+                return _to_result(workitem_id, status_data)
+
+            time.sleep(min(schedule.next(status_data), max(0.0, timeout - (time.time() - start_time))))
+
+    def _poll_schedule(
+        self, poll_interval: float, min_interval: Optional[float], backoff: Optional[float],
+    ) -> "_PollSchedule":
+        return _PollSchedule(
+            self.min_poll_interval if min_interval is None else min_interval,
+            poll_interval,
+            self.poll_backoff if backoff is None else backoff,
+        )
+
+    def _wait_for_webhook(
+        self,
+        registry: WebhookCompletionRegistry,
+        workitem_id: str,
+        timeout: float,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> WorkItemResult:
+        """웹훅 수신 대기. 웹훅 유실에 대비해 webhook_fallback_interval마다 상태를 한 번 확인"""
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"WorkItem {workitem_id} timed out after {timeout}s")
+                status_data = registry.wait(workitem_id, min(self.webhook_fallback_interval, remaining))
+                if status_data is None:
+                    status_data = self.auto.get_workitem(workitem_id)
+                if on_progress:
+                    on_progress(status_data)
+                if status_data.get("status") in _TERMINAL_STATUSES:
+                    return _to_result(workitem_id, status_data)
+        finally:
+            registry.discard(workitem_id)
+
+    async def await_for_completion(
+        self,
+        workitem_id: str,
+        *,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        min_interval: Optional[float] = None,
+        backoff: Optional[float] = None,
+    ) -> WorkItemResult:
+        """
+        wait_for_completion의 비동기 버전 (같은 적응형 폴링 간격 사용)
+
+        대기 중에는 스레드를 점유하지 않고 asyncio.sleep으로 양보하므로
+        하나의 이벤트 루프에서 많은 WorkItem을 동시에 기다릴 수 있습니다.
+        """
+        poll_interval = poll_interval or self.poll_interval
+        timeout = timeout or self.timeout
+
+        registry = self.completion_registry
+        if registry is not None and registry.is_registered(workitem_id):
+            return await self._run_async(self._wait_for_webhook, registry, workitem_id, timeout, on_progress)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        schedule = self._poll_schedule(poll_interval, min_interval, backoff)
+
+        while True:
+            if loop.time() > deadline:
+                raise TimeoutError(f"WorkItem {workitem_id} timed out after {timeout}s")
+
+            status_data = await self._run_async(self.auto.get_workitem, workitem_id)
+            status = status_data.get("status")
+
+            if on_progress:
+                on_progress(status_data)
 
-            time.sleep(poll_interval)
+            if status in _TERMINAL_STATUSES:
+                return _to_result(workitem_id, status_data)
+
+            await asyncio.sleep(min(schedule.next(status_data), max(0.0, deadline - loop.time())))
+
+    def _waits_for(self, on_complete_url: Optional[str], wait: Optional[bool]) -> bool:
+        """run_*_with_files가 완료까지 기다릴지 결정 (웹훅을 받을 레지스트리가 없으면 onComplete만으로 충분)"""
+        if wait is not None:
+            return wait
+        return not on_complete_url or self.completion_registry is not None
 
     def cancel_workitem(self, workitem_id: str) -> None:
         """WorkItem 취소"""
@@ -272,6 +959,10 @@ class AutomationWorkflow:
         bucket_key: str,
         object_key: str,
         local_path: str | Path,
+        *,
+        skip_mkdir: bool = False,
+        max_concurrency: int = 1,
+        chunk_size: int = 16 * 1024 * 1024,
     ) -> None:
         """
         OSS에서 출력 파일 다운로드
@@ -280,22 +971,83 @@ class AutomationWorkflow:
             bucket_key: OSS 버킷 키
             object_key: OSS 오브젝트 키
             local_path: 저장할 로컬 경로
+            skip_mkdir: 상위 디렉토리가 이미 있다고 보고 생성 생략 (여러 파일을 받을 때 호출자가 한 번에 생성)
+            max_concurrency: 2 이상이면 chunk_size 단위 Range GET을 동시에 요청해 큰 파일을 병렬 다운로드
+                (서버가 Range를 지원하지 않으면 단일 GET으로 받음)
+            chunk_size: 병렬 다운로드 시 Range 요청 하나의 크기 (바이트)
         """
         # Signed download URL 생성
-        signed = self.dm.objects.get_signed_download(
-            bucket_key, object_key, minutes_valid=10
+        signed = self._signed(
+            "download", bucket_key, object_key, 10,
+            lambda: self.dm.objects.get_signed_download(bucket_key, object_key, minutes_valid=10),
         )
         url = signed.get("url") or signed.get("signedUrl")
 
-        # 파일 다운로드 (프록시 설정 적용을 위해 DataManagementClient의 session 사용)
-        response = self.dm.http_oss.session.get(url, timeout=300)
-        response.raise_for_status()
+        if not skip_mkdir:
+            Path(local_path).parent.mkdir(parents=True, exist_ok=True)
 
-        local_path = Path(local_path)
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+        if max_concurrency > 1:
+            self._download_ranges(url, local_path, max_concurrency, chunk_size)
+            return
+
+        self._download_single(url, local_path)
 
-        with open(local_path, "wb") as f:
-            f.write(response.content)
+    def _download_single(self, url: str, local_path: str | Path) -> None:
+        """풀링된 download_session으로 다운로드 (응답 전체를 메모리에 올리지 않고 1MB 단위로 디스크에 기록)"""
+        with self.download_session.get(url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            with open(local_path, "wb") as f:
+                for chunk in response.iter_content(1 << 20):
+                    f.write(chunk)
+
+    def _download_ranges(self, url: str, local_path: str | Path, max_concurrency: int, chunk_size: int) -> None:
+        """
+        첫 구간 응답의 Content-Range로 전체 크기를 알아낸 뒤 나머지 구간을 병렬 Range GET으로 받아 제자리에 기록
+        - 같은 디렉터리의 임시 파일에 받은 뒤 완료되면 local_path로 교체 (실패 시 잘린 파일을 남기지 않음)
+        - Range를 무시한 200 응답은 그 본문을 그대로 사용,
+          전체 크기를 알 수 없는 206(Content-Range 없음 또는 '.../*')이면 단일 GET으로 다시 받음
+        """
+        local_path = Path(local_path)
+        tmp = local_path.with_name(f"{local_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+        try:
+            with self.download_session.get(
+                url, headers={"Range": f"bytes=0-{chunk_size - 1}"}, stream=True, timeout=300,
+            ) as response:
+                response.raise_for_status()
+                partial = response.status_code == 206
+                total = _content_range_total(response.headers.get("Content-Range")) if partial else None
+                if not partial or total is not None:
+                    with open(tmp, "wb") as f:
+                        for chunk in response.iter_content(1 << 20):
+                            f.write(chunk)
+
+            if partial and total is None:
+                self._download_single(url, tmp)
+            elif partial and total > chunk_size:
+                with open(tmp, "r+b") as f:
+                    f.truncate(total)
+
+                def get_range(start: int) -> None:
+                    end = min(start + chunk_size, total) - 1
+                    with self.download_session.get(
+                        url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=300,
+                    ) as part:
+                        part.raise_for_status()
+                        if part.status_code != 206:
+                            raise HTTPError(part.status_code, "GET", url, "Range request was not honored")
+                        with open(tmp, "r+b") as f:
+                            f.seek(start)
+                            for chunk in part.iter_content(1 << 20):
+                                f.write(chunk)
+
+                _call_all([lambda s=start: get_range(s) for start in range(chunk_size, total, chunk_size)], max_concurrency)
+            os.replace(tmp, local_path)
+        except BaseException:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
 
     # ==================== 통합 워크플로우 ====================
 
@@ -313,6 +1065,9 @@ class AutomationWorkflow:
         on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
         on_complete_url: Optional[str] = None,
         on_progress_url: Optional[str] = None,
+        upload_concurrency: int = 8,
+        download_concurrency: int = 8,
+        wait: Optional[bool] = None,
     ) -> WorkItemResult:
         """
         파일 업로드 → WorkItem 실행 → 결과 다운로드 전체 워크플로우
@@ -329,9 +1084,13 @@ class AutomationWorkflow:
             on_progress: 진행 상황 콜백 함수 (로컬 폴링용)
             on_complete_url: WorkItem 완료 시 호출될 웹훅 URL (Design Automation에서 HTTP POST)
             on_progress_url: WorkItem 진행 중 호출될 웹훅 URL (Design Automation에서 HTTP POST)
+            upload_concurrency: 입력 업로드/출력 URL 준비를 동시에 진행할 최대 스레드 수 (1이면 순차)
+            download_concurrency: 출력 파일을 동시에 다운로드할 최대 스레드 수 (1이면 순차)
+            wait: 완료까지 대기 여부. 미지정시 on_complete_url이 있고 completion_registry가 없으면
+                대기하지 않음 (완료 통지는 호출자의 웹훅 엔드포인트가 받으므로 폴링은 낭비)
 
         Returns:
-            WorkItem 실행 결과
+            WorkItem 실행 결과 (대기하지 않으면 status="pending"이며 출력 파일은 다운로드하지 않음)
 
         Example:
             >>> # 일반적인 사용
@@ -357,6 +1116,8 @@ class AutomationWorkflow:
         Note:
             on_complete_url을 사용하면 폴링 없이 비동기로 결과를 받을 수 있습니다.
             콜백 URL은 공개적으로 접근 가능한 HTTPS 엔드포인트여야 합니다.
+            completion_registry가 설정되어 있으면 웹훅 수신 즉시 반환하며(폴링 없음),
+            wait=False로 바로 반환받은 뒤 나중에 wait_for_completion/await_for_completion으로 기다릴 수도 있습니다.
         """
         input_files = input_files or {}
         output_files = output_files or {}
@@ -371,27 +1132,33 @@ class AutomationWorkflow:
             # 버킷 확인/생성
             self.ensure_bucket(bucket_key)
 
-        # 1. 입력 파일 업로드
-        arguments: Dict[str, WorkItemArgument] = {}
+        # 1-2. 입력 파일 업로드 + 출력 URL 준비 (각각 독립적인 HTTPS 왕복이므로 병렬 처리)
+        calls: List[Callable[[], str]] = [
+            lambda p=local_path: self.upload_input_file(p, bucket_key=bucket_key)
+            for local_path in input_files.values()
+        ] + [
+            lambda k=object_key: self.prepare_output_url(k, bucket_key=bucket_key)
+            for object_key in output_files.values()
+        ]
+        urls = _call_all(calls, upload_concurrency)
 
-        for arg_name, local_path in input_files.items():
-            url = self.upload_input_file(local_path, bucket_key=bucket_key)
+        arguments: Dict[str, WorkItemArgument] = {}
+        for arg_name, url in zip(input_files, urls):
             arguments[arg_name] = WorkItemArgument(url=url, verb="get")
-
-        # 2. 출력 URL 준비
-        for arg_name, object_key in output_files.items():
-            url = self.prepare_output_url(object_key, bucket_key=bucket_key)
+        for arg_name, url in zip(output_files, urls[len(input_files):]):
             arguments[arg_name] = WorkItemArgument(url=url, verb="put")
 
         # 3. WorkItem 실행 (콜백 URL 포함)
-        workitem_id = self.start_workitem(
+        workitem_id = self.start_workitem_spec(WorkItemSpec(
             activity_id,
             arguments,
             on_complete=on_complete_url,
             on_progress=on_progress_url,
-        )
+        ))
 
-        # 4. 완료 대기
+        # 4. 완료 대기 (웹훅만 사용하는 경우 제출 직후 반환)
+        if not self._waits_for(on_complete_url, wait):
+            return WorkItemResult(workitem_id=workitem_id, status="pending")
         result = self.wait_for_completion(
             workitem_id,
             poll_interval=poll_interval,
@@ -399,13 +1166,102 @@ class AutomationWorkflow:
             on_progress=on_progress,
         )
 
+        if result.status != "success" and (input_files or output_files):
+            # 만료/거부된 URL 때문에 실패했을 수 있으므로 재시도 시에는 새로 발급
+            self.invalidate_signed_urls(bucket_key, _object_keys(input_files, output_files))
+
         # 5. 결과 다운로드
         if download_outputs and result.status == "success" and output_files:
-            output_dir = Path(output_dir) if output_dir else Path.cwd()
+            targets = _prepare_output_paths(output_dir, output_files.values())
+            _call_all(
+                [
+                    lambda k=object_key, p=path: self.download_output_file(bucket_key, k, p, skip_mkdir=True)
+                    for object_key, path in targets
+                ],
+                download_concurrency,
+            )
+
+        return result
+
+    async def arun_workitem_with_files(
+        self,
+        activity_id: str,
+        input_files: Optional[Dict[str, str | Path]] = None,
+        output_files: Optional[Dict[str, str]] = None,
+        *,
+        bucket_key: Optional[str] = None,
+        download_outputs: bool = True,
+        output_dir: Optional[str | Path] = None,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_complete_url: Optional[str] = None,
+        on_progress_url: Optional[str] = None,
+        wait: Optional[bool] = None,
+    ) -> WorkItemResult:
+        """
+        run_workitem_with_files의 비동기 버전 (asyncio 애플리케이션용)
+
+        업로드/다운로드 등 블로킹 HTTP·파일 I/O는 워커 스레드에서 실행하고(async_workers 참고) asyncio.gather로 동시에 진행하며,
+        완료 대기는 await_for_completion을 사용합니다. 인자는 run_workitem_with_files와 같습니다.
+
+        Example:
+            >>> results = await asyncio.gather(*(
+            ...     workflow.arun_workitem_with_files(
+            ...         "myowner.RevitActivity+prod",
+            ...         input_files={"inputRvt": path},
+            ...         output_files={"outputRvt": f"{path.stem}-out.rvt"},
+            ...     )
+            ...     for path in paths
+            ... ))
+        """
+        input_files = input_files or {}
+        output_files = output_files or {}
+
+        if input_files or output_files:
+            bucket_key = bucket_key or self.default_bucket
+            if not bucket_key:
+                raise ValueError(
+                    "bucket_key must be provided or default_bucket must be set when using input_files or output_files"
+                )
+            await self._run_async(self.ensure_bucket, bucket_key)
+
+        urls = await asyncio.gather(
+            *(self._run_async(self.upload_input_file, p, bucket_key=bucket_key) for p in input_files.values()),
+            *(self._run_async(self.prepare_output_url, k, bucket_key=bucket_key) for k in output_files.values()),
+        )
+
+        arguments: Dict[str, WorkItemArgument] = {}
+        for arg_name, url in zip(input_files, urls):
+            arguments[arg_name] = WorkItemArgument(url=url, verb="get")
+        for arg_name, url in zip(output_files, urls[len(input_files):]):
+            arguments[arg_name] = WorkItemArgument(url=url, verb="put")
+
+        workitem_id = await self._run_async(self.start_workitem_spec, WorkItemSpec(
+            activity_id,
+            arguments,
+            on_complete=on_complete_url,
+            on_progress=on_progress_url,
+        ))
+
+        if not self._waits_for(on_complete_url, wait):
+            return WorkItemResult(workitem_id=workitem_id, status="pending")
+        result = await self.await_for_completion(
+            workitem_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            on_progress=on_progress,
+        )
 
-            for arg_name, object_key in output_files.items():
-                local_path = output_dir / object_key
-                self.download_output_file(bucket_key, object_key, local_path)
+        if result.status != "success" and (input_files or output_files):
+            self.invalidate_signed_urls(bucket_key, _object_keys(input_files, output_files))
+
+        if download_outputs and result.status == "success" and output_files:
+            targets = _prepare_output_paths(output_dir, output_files.values())
+            await asyncio.gather(*(
+                self._run_async(self.download_output_file, bucket_key, k, path, skip_mkdir=True)
+                for k, path in targets
+            ))
 
         return result
 
@@ -417,30 +1273,280 @@ class AutomationWorkflow:
         *,
         poll_interval: Optional[float] = None,
         timeout: Optional[float] = None,
+        batch_size: int = _WORKITEM_BATCH_SIZE,
+        max_workers: int = 8,
     ) -> List[WorkItemResult]:
         """
         여러 WorkItem을 배치로 실행하고 모두 완료될 때까지 대기
 
+        asyncio 없이 동작합니다 (Jupyter 등 이벤트 루프를 쓰기 어려운 환경에서도 사용 가능).
+        WorkItem이 batch_size보다 많으면 배치 요청들을 스레드 풀에서 동시에 제출하며,
+        스레드들은 AutomationClient의 커넥션 풀을 공유합니다.
+
         Args:
             workitems: WorkItem 스펙 목록
             poll_interval: 폴링 간격 (초)
             timeout: 최대 대기 시간 (초)
+            batch_size: 배치 요청 하나에 담을 최대 WorkItem 수
+            max_workers: 배치 요청을 동시에 제출할 최대 스레드 수 (1이면 순차, 디버깅용)
 
         Returns:
             각 WorkItem의 실행 결과 목록
         """
         # 배치 시작
-        batch_result = self.auto.create_workitems_batch(workitems)
-        workitem_ids = [wi["id"] for wi in batch_result]
-
-        # 모든 WorkItem 완료 대기
-        results = []
-        for workitem_id in workitem_ids:
-            result = self.wait_for_completion(
-                workitem_id,
-                poll_interval=poll_interval,
-                timeout=timeout,
+        workitem_ids = self._submit_batches(workitems, batch_size, max_workers)
+
+        # 모든 WorkItem 완료 대기: 항목별 순차 대기 대신 라운드마다 /workitems/status 한 번으로 일괄 조회
+        statuses = self.auto.wait_for_workitems(
+            workitem_ids,
+            poll_interval=poll_interval or self.poll_interval,
+            timeout=timeout or self.timeout,
+        )
+        return [_to_result(workitem_id, statuses[workitem_id]) for workitem_id in workitem_ids]
+
+    async def arun_batch_workitems(
+        self,
+        workitems: List[Dict[str, Any]],
+        *,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> List[WorkItemResult]:
+        """
+        run_batch_workitems의 비동기 버전
+
+        라운드마다 미완료 WorkItem을 /workitems/status 한 번으로 조회하고 라운드 사이에는 asyncio.sleep으로 양보합니다.
+        (항목별 await_for_completion을 asyncio.gather로 묶는 것보다 HTTP 요청 수가 적음)
+        """
+        poll_interval = poll_interval or self.poll_interval
+        timeout = timeout or self.timeout
+
+        batch_result = await asyncio.gather(*(
+            self._run_async(self.auto.create_workitems_batch, workitems[i:i + _WORKITEM_BATCH_SIZE])
+            for i in range(0, len(workitems), _WORKITEM_BATCH_SIZE)
+        ))
+        workitem_ids = [wi["id"] for chunk in batch_result for wi in chunk]
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        statuses: Dict[str, Dict[str, Any]] = {}
+        pending = list(dict.fromkeys(workitem_ids))
+        while pending:
+            statuses.update(_status_by_id(await self._run_async(self.auto.get_workitems_status, pending)))
+            pending = [i for i in pending if (statuses.get(i) or {}).get("status") not in _TERMINAL_STATUSES]
+            if not pending:
+                break
+            if loop.time() + poll_interval > deadline:
+                raise TimeoutError(f"{len(pending)} WorkItem(s) still running after {timeout}s")
+            await asyncio.sleep(poll_interval)
+
+        return [_to_result(workitem_id, statuses[workitem_id]) for workitem_id in workitem_ids]
+
+    def run_batch_workitems_with_files(
+        self,
+        jobs: List[Dict[str, Any]],
+        *,
+        bucket_key: Optional[str] = None,
+        download_outputs: bool = True,
+        output_dir: Optional[str | Path] = None,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        concurrency: int = 8,
+        batch_size: int = _WORKITEM_BATCH_SIZE,
+        dedupe_inputs: bool = True,
+    ) -> List[WorkItemResult]:
+        """
+        여러 WorkItem의 파일 업로드 → 배치 실행 → 결과 다운로드
+
+        run_workitem_with_files를 N번 호출하는 대신 모든 업로드/출력 URL 준비를 한 번에 병렬로 처리하고,
+        WorkItem은 batch_size개씩 /workitems/batch로 제출한 뒤 /workitems/status로 일괄 대기합니다.
+
+        Args:
+            jobs: 작업 목록. 각 항목은 {"activity_id", "input_files", "output_files", "nickname"(선택)}
+                (input_files/output_files 형식은 run_workitem_with_files와 동일)
+            bucket_key: OSS 버킷 키 (미지정시 default_bucket 사용)
+            download_outputs: 성공한 WorkItem의 출력 파일 자동 다운로드 여부
+            output_dir: 출력 파일 저장 디렉토리
+            poll_interval: 폴링 간격 (초)
+            timeout: 최대 대기 시간 (초)
+            concurrency: 업로드/URL 준비/다운로드를 동시에 진행할 최대 스레드 수
+            batch_size: 배치 요청 하나에 담을 최대 WorkItem 수
+            dedupe_inputs: 여러 작업이 공유하는 입력 파일은 내용 해시 기준으로 한 번만 업로드
+                (upload_input_file(dedupe=True), 오브젝트 키는 '<해시 16자리>-<파일명>')
+
+        Returns:
+            jobs 순서대로의 WorkItem 실행 결과 목록
+        """
+        has_files = any(job.get("input_files") or job.get("output_files") for job in jobs)
+        if has_files:
+            bucket_key = bucket_key or self.default_bucket
+            if not bucket_key:
+                raise ValueError(
+                    "bucket_key must be provided or default_bucket must be set when using input_files or output_files"
+                )
+            self.ensure_bucket(bucket_key)
+
+        # 1-2. 모든 작업의 입력 업로드 + 출력 URL 준비를 한 번에 병렬 처리
+        calls: List[Callable[[], str]] = []
+        for job in jobs:
+            calls.extend(
+                lambda p=local_path: self.upload_input_file(p, bucket_key=bucket_key, dedupe=dedupe_inputs)
+                for local_path in (job.get("input_files") or {}).values()
+            )
+            calls.extend(
+                lambda k=object_key: self.prepare_output_url(k, bucket_key=bucket_key)
+                for object_key in (job.get("output_files") or {}).values()
+            )
+        urls = iter(_call_all(calls, concurrency))
+
+        specs: List[WorkItemSpec] = []
+        for job in jobs:
+            arguments: Dict[str, WorkItemArgument] = {}
+            for arg_name in job.get("input_files") or {}:
+                arguments[arg_name] = WorkItemArgument(url=next(urls), verb="get")
+            for arg_name in job.get("output_files") or {}:
+                arguments[arg_name] = WorkItemArgument(url=next(urls), verb="put")
+            specs.append(WorkItemSpec(job["activity_id"], arguments, nickname=job.get("nickname")))
+
+        # 3. batch_size 단위로 배치 제출 (jobs 순서대로 대기열에 들어가도록 순차 제출)
+        workitem_ids = self._submit_batches(specs, batch_size, 1)
+
+        # 4. 일괄 대기
+        statuses = self.auto.wait_for_workitems(
+            workitem_ids,
+            poll_interval=poll_interval or self.poll_interval,
+            timeout=timeout or self.timeout,
+        )
+        results = [_to_result(workitem_id, statuses[workitem_id]) for workitem_id in workitem_ids]
+
+        # 5. 성공한 작업의 출력 파일 다운로드
+        if download_outputs:
+            targets = _prepare_output_paths(output_dir, [
+                object_key
+                for job, result in zip(jobs, results)
+                if result.status == "success"
+                for object_key in (job.get("output_files") or {}).values()
+            ])
+            _call_all(
+                [
+                    lambda k=object_key, p=path: self.download_output_file(bucket_key, k, p, skip_mkdir=True)
+                    for object_key, path in targets
+                ],
+                concurrency,
             )
-            results.append(result)
 
         return results
+
+
+    def _submit_batches(self, workitems: List[Any], batch_size: int, max_workers: int) -> List[str]:
+        """batch_size개씩 /workitems/batch로 제출하고 입력 순서대로 WorkItem ID 반환 (배치 요청은 스레드 풀에서 동시 제출)"""
+        batch_size = max(1, batch_size)
+        chunks = _call_all(
+            [
+                lambda chunk=workitems[i:i + batch_size]: self.auto.create_workitems_batch(chunk)
+                for i in range(0, len(workitems), batch_size)
+            ],
+            max_workers,
+        )
+        return [wi["id"] for chunk in chunks for wi in chunk]
+
+
+def _to_result(workitem_id: str, status_data: Dict[str, Any]) -> WorkItemResult:
+    return WorkItemResult(
+        workitem_id=workitem_id,
+        status=status_data.get("status"),
+        report_url=status_data.get("reportUrl"),
+        stats=status_data.get("stats"),
+        details=status_data,
+    )
+
+
+def _object_keys(input_files: Dict[str, str | Path], output_files: Dict[str, str]) -> List[str]:
+    """run_*_with_files의 입력(파일명 키)/출력 오브젝트 키 목록"""
+    return [Path(p).name for p in input_files.values()] + list(output_files.values())
+
+
+def _prepare_output_paths(output_dir: Optional[str | Path], object_keys: Iterable[str]) -> List[Tuple[str, Path]]:
+    """출력 오브젝트 키별 로컬 경로 계산 후 필요한 상위 디렉토리를 (중복 없이) 한 번씩 생성"""
+    output_dir = Path(output_dir) if output_dir else Path.cwd()
+    targets = [(object_key, output_dir / object_key) for object_key in object_keys]
+    for parent in {path.parent for _, path in targets}:
+        parent.mkdir(parents=True, exist_ok=True)
+    return targets
+
+
+def _file_digest(path: Path, algorithm: str) -> str:
+    """
+    파일 해시(hex) 계산
+    - mmap으로 페이지 캐시를 직접 해시 (read 버퍼로의 복사 없음, 뒤이은 업로드는 캐시된 페이지를 읽음)
+    - 빈 파일이나 주소 공간보다 큰 파일(32비트)은 1MB 단위 읽기로 계산
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= sys.maxsize:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.new(algorithm, mm).hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        h = hashlib.new(algorithm)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+class _DigestCache:
+    """
+    파일 해시 캐시: (절대 경로, 알고리즘) -> (mtime_ns, 크기, 해시)
+    - 수정 시각과 크기가 그대로면 해시를 다시 계산하지 않음 (수정 직후 2초 이내의 파일은 캐시하지 않음)
+    - path 지정 시 JSON 파일에 저장하여 프로세스 재실행 간에도 재사용 (원자적 교체로 기록)
+    """
+
+    def __init__(self, path: Optional[str | Path] = None) -> None:
+        self._path = Path(path).expanduser() if path is not None else None
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, list]] = {}
+        if self._path is not None:
+            try:
+                self._entries = _json_loads(self._path.read_bytes())
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def get(self, path: Path, algorithm: str) -> str:
+        key = str(path.resolve())
+        st = path.stat()
+        with self._lock:
+            cached = self._entries.get(key, {}).get(algorithm)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        digest = _file_digest(path, algorithm)
+        if time.time_ns() - st.st_mtime_ns < _DIGEST_RACY_NS:
+            # 방금 수정된 파일은 같은 타임스탬프 안에서 다시 바뀔 수 있어 기록하지 않음 (git의 racy 검사와 동일)
+            return digest
+        with self._lock:
+            self._entries.setdefault(key, {})[algorithm] = [st.st_mtime_ns, st.st_size, digest]
+            if self._path is not None:
+                self._save()
+        return digest
+
+    def _save(self) -> None:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(_json_dumps(self._entries))
+            os.replace(tmp, self._path)
+        except OSError:
+            pass  # 캐시 저장 실패는 업로드에 영향 없음 (다음 실행에서 다시 해시)
+
+
+def _content_range_total(value: Optional[str]) -> Optional[int]:
+    """Content-Range('bytes 0-99/1234')의 전체 크기 (헤더가 없거나 '*'처럼 알 수 없으면 None)"""
+    total = (value or "").rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else None
+
+
+def _call_all(calls: List[Callable[[], Any]], max_workers: int) -> List[Any]:
+    """호출 목록을 스레드 풀에서 실행하고 입력 순서대로 결과 반환 (호출 1개 이하 또는 max_workers<=1이면 순차)"""
+    if max_workers <= 1 or len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as ex:
+        return list(ex.map(lambda call: call(), calls))
@@ -4,32 +4,33 @@ Design Automation Workflow 사용 예제
 """
 from __future__ import annotations
 
+import functools
+import logging
+import logging.handlers
 import os
-import time
-from pathlib import Path
+import queue
+import sys
+from typing import Optional
 
-from pyaps.auth import AuthClient, InMemoryTokenStore
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from pyaps._dotenv import load_dotenv
+from pyaps.auth import AuthClient, FileTokenStore, OAuth2Token
 from pyaps.automation import (
     AutomationClient,
     AutomationWorkflow,
-    DEFAULT_AUTOMATION_SCOPES,
+    DEFAULT_AUTOMATION_SCOPES_STR,
+    WebhookCompletionRegistry,
+    WorkItemStats,
 )
 from pyaps.datamanagement import DataManagementClient
 
-
-# Load .env file if exists
-def load_dotenv():
-    """Simple .env loader"""
-    env_file = Path(__file__).parent.parent.parent.parent / ".env"
-    if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    os.environ[key.strip()] = value.strip()
+logger = logging.getLogger(__name__)
 
 
+# Load .env file if exists
 load_dotenv()
 
 
@@ -39,16 +40,41 @@ APS_CLIENT_SECRET = os.getenv("APS_CLIENT_SECRET")
 APS_REGION = os.getenv("APS_REGION") or "us-east"
 
 
+# 모든 예제가 하나의 AuthClient를 공유하고, 토큰은 파일에 저장하여 다음 실행에서도 재사용
+# (2-legged 토큰은 약 1시간 유효하므로 예제를 반복 실행해도 /token 요청은 만료 시에만 발생)
+auth_client = AuthClient(
+    client_id=APS_CLIENT_ID,
+    client_secret=APS_CLIENT_SECRET,
+    store=FileTokenStore("~/.pyaps/tokens.json"),
+)
+
+# Automation/Data Management 클라이언트와 OSS(S3) signed URL 전송이 하나의 커넥션 풀을 공유
+# (create_workflow를 여러 번 호출해도, 파일을 여러 개 올리고 받아도 호스트별 TCP/TLS 연결은 keep-alive로 재사용됨)
+# POST(WorkItem 생성 등)는 중복 실행 위험이 있어 재시도 대상에서 제외 (urllib3 기본값)
+http_session = requests.Session()
+http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,  # 호스트 수 (APS API, OSS, S3 버킷 엔드포인트 등)
+        pool_maxsize=64,  # 호스트별 동시 연결 수 (배치 업로드/Range 다운로드 동시성 이상으로)
+        pool_block=False,
+        max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False),
+    ),
+)
+
+
 def create_workflow() -> AutomationWorkflow:
     """Create AutomationWorkflow instance"""
-    auth_client = AuthClient(
-        client_id=APS_CLIENT_ID,
-        client_secret=APS_CLIENT_SECRET,
-        store=InMemoryTokenStore(),
-    )
+
+    # 요청마다 호출되므로 받은 토큰을 그대로 들고 있다가 만료 60초 전에만 다시 받음
+    # (is_expired는 monotonic 시각 비교라 스코프 정렬/캐시 잠금 없이 끝남)
+    cached: Optional[OAuth2Token] = None
 
     def token_provider() -> str:
-        token = auth_client.two_legged.get_token(DEFAULT_AUTOMATION_SCOPES)
+        nonlocal cached
+        token = cached
+        if token is None or token.is_expired(60):
+            token = cached = auth_client.two_legged.get_token(DEFAULT_AUTOMATION_SCOPES_STR)
         return token.access_token
 
     auto = AutomationClient(
@@ -56,23 +82,35 @@ def create_workflow() -> AutomationWorkflow:
         region=APS_REGION,
         user_agent="pyaps-automation-workflow",
         timeout=30.0,
+        session=http_session,
     )
 
     dm = DataManagementClient(
         token_provider=token_provider,
         user_agent="pyaps-automation-workflow",
         timeout=30.0,
+        session=http_session,
     )
 
     return AutomationWorkflow(
         automation_client=auto,
         data_client=dm,
         default_bucket="my-design-automation-bucket",  # 기본 버킷 설정
-        poll_interval=10.0,  # 10초마다 상태 확인
+        download_session=http_session,  # S3 다운로드/파트 업로드도 같은 풀 사용
+        poll_interval=10.0,  # 최대 10초 간격으로 상태 확인 (1초부터 시작해 변화가 없으면 1.5배씩 증가)
         timeout=3600.0,  # 최대 1시간 대기
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_workflow() -> AutomationWorkflow:
+    """
+    프로세스 전체에서 공유하는 AutomationWorkflow (첫 호출 시 생성)
+    여러 예제를 연달아 실행해도 클라이언트/버킷 확인/signed URL 캐시를 재사용
+    """
+    return create_workflow()
+
+
 def example_simple_workflow():
     """
     가장 간단한 워크플로우 예제:
@@ -82,7 +120,7 @@ def example_simple_workflow():
     print("Example 1: Simple Workflow")
     print("=" * 60)
 
-    workflow = create_workflow()
+    workflow = get_workflow()
 
     # 전체 워크플로우를 한 번에 실행
     result = workflow.run_workitem_with_files(
@@ -112,7 +150,7 @@ def example_step_by_step_workflow():
     print("Example 2: Step-by-Step Workflow")
     print("=" * 60)
 
-    workflow = create_workflow()
+    workflow = get_workflow()
 
     # Step 1: 버킷 확인/생성
     print("\n[Step 1] Ensure bucket exists")
@@ -159,11 +197,15 @@ def example_step_by_step_workflow():
         progress = status_data.get("progress", "")
         print(f"  Status: {status} {progress}")
 
+    # 1초 간격으로 시작해 상태/진행 메시지가 그대로면 1.5배씩 늘려 최대 10초 간격으로 확인
+    # (진행 메시지가 바뀌면 다시 1초부터)
     result = workflow.wait_for_completion(
         workitem_id,
         poll_interval=10.0,
         timeout=3600.0,
         on_progress=on_progress,
+        min_interval=1.0,
+        backoff=1.5,
     )
     print(f"✓ Completed: {result.status}")
 
@@ -174,6 +216,7 @@ def example_step_by_step_workflow():
             bucket_key="my-design-automation-bucket",
             object_key="outputs/output.rvt",
             local_path="./results/output.rvt",
+            max_concurrency=8,  # 큰 출력 파일은 16MB 구간별 Range GET 8개를 동시에 요청
         )
         print("✓ Output downloaded")
 
@@ -186,7 +229,7 @@ def example_multiple_files():
     print("Example 3: Multiple Input/Output Files")
     print("=" * 60)
 
-    workflow = create_workflow()
+    workflow = get_workflow()
 
     result = workflow.run_workitem_with_files(
         activity_id="myowner.RevitActivity+prod",
@@ -216,52 +259,32 @@ def example_batch_processing():
     print("Example 4: Batch Processing")
     print("=" * 60)
 
-    workflow = create_workflow()
-
-    # 여러 파일을 처리할 WorkItem 스펙 준비
-    workitems = []
-
-    for i in range(1, 6):
-        # 각 파일별로 입력/출력 URL 준비
-        input_url = workflow.upload_input_file(
-            local_path=f"inputs/model_{i}.rvt",
-            bucket_key="my-bucket",
-            object_key=f"batch/input_{i}.rvt",
-        )
-
-        output_url = workflow.prepare_output_url(
-            object_key=f"batch/output_{i}.rvt",
-            bucket_key="my-bucket",
-        )
-
-        workitems.append(
-            {
-                "activityId": "myowner.RevitActivity+prod",
-                "arguments": {
-                    "inputRvt": {"url": input_url, "verb": "get"},
-                    "outputRvt": {"url": output_url, "verb": "put"},
-                },
-            }
-        )
-
-    # 배치 실행
-    results = workflow.run_batch_workitems(
-        workitems,
+    workflow = get_workflow()
+
+    # 5개 파일의 업로드/출력 URL 준비를 스레드 풀에서 동시에 진행하고,
+    # WorkItem은 /workitems/batch 한 번으로 제출한 뒤 /workitems/status로 일괄 대기
+    jobs = [
+        {
+            "activity_id": "myowner.RevitActivity+prod",
+            "input_files": {"inputRvt": f"inputs/model_{i}.rvt"},
+            "output_files": {"outputRvt": f"batch/output_{i}.rvt"},
+        }
+        for i in range(1, 6)
+    ]
+
+    results = workflow.run_batch_workitems_with_files(
+        jobs,
+        bucket_key="my-bucket",
+        output_dir="./results",  # 성공한 WorkItem의 출력은 동시에 다운로드
         poll_interval=10.0,
         timeout=3600.0,
+        concurrency=8,
     )
 
     # 결과 확인
     for i, result in enumerate(results, 1):
         print(f"WorkItem {i}: {result.status}")
 
-        if result.status == "success":
-            workflow.download_output_file(
-                bucket_key="my-bucket",
-                object_key=f"batch/output_{i}.rvt",
-                local_path=f"./results/output_{i}.rvt",
-            )
-
 
 def example_error_handling():
     """
@@ -271,7 +294,7 @@ def example_error_handling():
     print("Example 5: Error Handling")
     print("=" * 60)
 
-    workflow = create_workflow()
+    workflow = get_workflow()
 
     try:
         result = workflow.run_workitem_with_files(
@@ -307,7 +330,7 @@ def example_webhook_callbacks():
     print("Example 6: Webhook Callbacks")
     print("=" * 60)
 
-    workflow = create_workflow()
+    workflow = get_workflow()
 
     # 콜백 URL 사용 시 폴링 없이 비동기로 실행 가능
     result = workflow.run_workitem_with_files(
@@ -321,9 +344,30 @@ def example_webhook_callbacks():
         on_progress_url="https://myapp.com/api/webhooks/workitem-progress",
     )
 
-    print(f"✓ WorkItem started: {result.workitem_id}")
+    # on_complete_url만 지정하면 상태를 폴링하지 않고 제출 직후 반환 (status="pending", 다운로드 없음)
+    print(f"✓ WorkItem started: {result.workitem_id} ({result.status})")
     print(f"  Complete callback will be sent to: https://myapp.com/api/webhooks/workitem-complete")
 
+    # 같은 프로세스에서 결과를 기다려야 한다면 웹훅을 WebhookCompletionRegistry로 받아서 대기
+    # (폴링 없이 웹훅 수신 즉시 반환, 웹훅 유실 대비 webhook_fallback_interval마다 한 번만 상태 확인)
+    registry = WebhookCompletionRegistry()
+    registry.serve(port=5000)  # localhost에만 바인딩, ngrok/리버스 프록시로 외부에 노출한 URL + registry.path를 on_complete_url로 사용
+    try:
+        workflow.completion_registry = registry
+        result = workflow.run_workitem_with_files(
+            activity_id="myowner.RevitActivity+prod",
+            input_files={"inputRvt": "path/to/input.rvt"},
+            output_files={"outputRvt": "output.rvt"},
+            bucket_key="my-bucket",
+            on_complete_url=f"https://abc123.ngrok.io{registry.path}",
+            wait=False,  # 제출만 하고 다른 작업을 한 뒤
+        )
+        done = workflow.wait_for_completion(result.workitem_id)  # 웹훅이 도착하면 반환
+        print(f"✓ Completed via webhook: {done.status}")
+    finally:
+        workflow.completion_registry = None  # 공유 인스턴스이므로 다른 예제에 영향이 없도록 원복
+        registry.close()
+
 
 def example_webhook_callback_server():
     """
@@ -503,7 +547,7 @@ def example_progress_monitoring():
     print("Example 6: Progress Monitoring")
     print("=" * 60)
 
-    workflow = create_workflow()
+    workflow = get_workflow()
 
     # 입력/출력 URL 준비
     input_url = workflow.upload_input_file(
@@ -526,35 +570,38 @@ def example_progress_monitoring():
     )
 
     # 상세한 진행 상황 모니터링
-    def on_progress(status_data):
-        status = status_data.get("status")
-        progress = status_data.get("progress", "")
-        stats = status_data.get("stats", {})
-
-        print(f"\n[{time.strftime('%H:%M:%S')}] Status: {status}")
+    # 로그 레코드는 큐에만 넣고 출력(포맷팅/stdout 쓰기)은 QueueListener 스레드가 처리하여
+    # 폴링 스레드가 콘솔 I/O를 기다리지 않음
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", "%H:%M:%S"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.DEBUG)
+    listener.start()
 
-        if progress:
-            print(f"  Progress: {progress}")
-
-        if stats:
-            time_queued = stats.get("timeQueued")
-            time_download = stats.get("timeDownloadStarted")
-            time_instr = stats.get("timeInstructionsStarted")
-            time_upload = stats.get("timeUploadEnded")
-
-            if time_queued:
-                print(f"  Queued at: {time_queued}")
-            if time_download:
-                print(f"  Download started: {time_download}")
-            if time_instr:
-                print(f"  Processing started: {time_instr}")
-            if time_upload:
-                print(f"  Upload ended: {time_upload}")
+    def on_progress(status_data):
+        # 인자는 %-포맷으로 넘겨 실제로 출력될 때만 문자열을 만듦
+        logger.info("Status: %s %s", status_data.get("status"), status_data.get("progress") or "")
+        if logger.isEnabledFor(logging.DEBUG):
+            s = WorkItemStats.from_status(status_data)  # stats dict를 한 번만 파싱
+            if s.queued:
+                logger.debug("  Queued at: %s", s.queued)
+            if s.download_started:
+                logger.debug("  Download started: %s", s.download_started)
+            if s.instructions_started:
+                logger.debug("  Processing started: %s", s.instructions_started)
+            if s.upload_ended:
+                logger.debug("  Upload ended: %s", s.upload_ended)
 
-    result = workflow.wait_for_completion(
-        workitem_id,
-        on_progress=on_progress,
-    )
+    try:
+        result = workflow.wait_for_completion(
+            workitem_id,
+            on_progress=on_progress,
+        )
+    finally:
+        listener.stop()  # 남은 로그를 모두 출력한 뒤 종료
+        logger.handlers.clear()
 
     print(f"\n✓ Final status: {result.status}")
     if result.report_url:
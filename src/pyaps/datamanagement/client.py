@@ -1,15 +1,34 @@
 # src/pyaps/datamanagement/client.py
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, Optional
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 import requests
+from urllib3.util.retry import Retry
 
-from pyaps.http.client import HTTPClient, HTTPError
+from pyaps.http.client import CachingTokenProvider, HTTPClient, HTTPError, _CappedRetry, _NON_IDEMPOTENT_METHODS, _json_dumps, _pooled_session, _put_signed_parts
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_PROJECT_BASE    = "https://developer.api.autodesk.com/project/v1"
 DEFAULT_DATA_BASE       = "https://developer.api.autodesk.com/data/v1"
 DEFAULT_OSS_BASE        = "https://developer.api.autodesk.com/oss/v2"
 
+# 목록 API 기본 페이지 크기 (Data/Project v1 page[limit] 최대 200, OSS v2 limit 최대 100)
+DEFAULT_PAGE_SIZE = 200
+_OSS_MAX_PAGE_SIZE = 100
+_PAGE_LIMIT = "page[limit]"
+
+# Data v1 쓰기 요청은 JSON:API 본문을 orjson(있으면)으로 한 번 직렬화해 전송
+_JSONAPI_HEADERS = {"Content-Type": "application/vnd.api+json"}
+
+# signeds3upload 요청 한 번에 발급받을 수 있는 최대 파트 URL 수
+_SIGNED_UPLOAD_MAX_PARTS = 25
+
 class DataManagementClient:
     """
     APS Data Management
@@ -29,33 +48,54 @@ class DataManagementClient:
         session: Optional[requests.Session] = None,
         proxies: Optional[Dict[str, str]] = None,
         trust_env: bool = True,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cache_token: bool = False,
     ) -> None:
         """
         Args:
-            token_provider: APS 액세스 토큰 제공 함수
+            token_provider: APS 액세스 토큰 제공 함수 (str 또는 cache_token=True일 때 OAuth2Token 반환)
             project_base_url: Project API base URL
             data_base_url: Data API base URL
             oss_base_url: OSS API base URL
             timeout: 요청 타임아웃 (초)
             user_agent: User-Agent 헤더 값
             session: 커스텀 requests.Session (선택)
+                미지정 시 커넥션 풀과 idempotent 메서드 재시도가 설정된 세션을 생성
+                (project/data/oss 세 API가 같은 호스트이므로 하나의 세션·커넥션 풀을 공유)
             proxies: 프록시 설정 (선택)
             trust_env: 환경 변수에서 프록시 읽기 (기본: True)
+            page_size: 목록 API에서 limit 미지정 시 사용할 페이지 크기
+                (전체 목록 순회 시 왕복 횟수 감소, OSS 목록은 최대 100으로 제한)
+            cache_token: True면 token_provider를 CachingTokenProvider로 감싸 세 API가 공유
+                (OAuth2Token 반환 시 만료 60초 전까지 재사용, 문자열은 캐시하지 않음, 401 시 폐기 후 한 번 재시도)
         """
+        self.page_size = page_size
+        # limit 미지정 목록 호출이 공유하는 기본 쿼리 (requests는 params를 변경하지 않으므로 재사용 안전)
+        self._default_page = {_PAGE_LIMIT: page_size}
+        self._default_oss_page = {"limit": min(page_size, _OSS_MAX_PAGE_SIZE)}
+        if session is None:
+            session = _pooled_session(pool_connections=16, pool_maxsize=32, retry=_default_retry())
+        # opt-in: 세 HTTPClient가 같은 토큰 캐시를 공유 (OAuth2Token을 반환하는 provider만 실제 만료까지 재사용)
+        if cache_token and not isinstance(token_provider, CachingTokenProvider):
+            token_provider = CachingTokenProvider(token_provider)
+        self.token_provider = token_provider
+
+        # 공유 세션이므로 프록시 설정은 한 번만 적용
+        if proxies:
+            session.proxies.update(proxies)
+        self.session = session
+
         self.http_project = HTTPClient(
             token_provider, base_url=project_base_url,
-            user_agent=user_agent, timeout=timeout, session=session,
-            proxies=proxies, trust_env=trust_env
+            user_agent=user_agent, timeout=timeout, session=session, trust_env=trust_env
         )
         self.http_data = HTTPClient(
             token_provider, base_url=data_base_url,
-            user_agent=user_agent, timeout=timeout, session=session,
-            proxies=proxies, trust_env=trust_env
+            user_agent=user_agent, timeout=timeout, session=session, trust_env=trust_env
         )
         self.http_oss = HTTPClient(
             token_provider, base_url=oss_base_url,
-            user_agent=user_agent, timeout=timeout, session=session,
-            proxies=proxies, trust_env=trust_env
+            user_agent=user_agent, timeout=timeout, session=session, trust_env=trust_env
         )
 
         # public facades
@@ -68,130 +108,264 @@ class DataManagementClient:
         self.objects    = _Objects(self)
         self.commands   = _Commands(self)
 
+    def _page_params(self, limit: int | None, **extra: Any) -> Dict[str, Any]:
+        """목록 쿼리: limit/extra가 모두 없으면 미리 만든 기본 dict를 그대로 반환 (None 값은 생략)"""
+        if limit is None and not any(v is not None for v in extra.values()):
+            return self._default_page
+        params = {k: v for k, v in extra.items() if v is not None}
+        params[_PAGE_LIMIT] = limit or self.page_size
+        return params
+
+def _jget(obj: Any, *path: str, default: Any = None) -> Any:
+    """중첩 JSON 경로 조회: 중간 값이 dict가 아니거나 비어 있으면 default (임시 {} 할당 없이 한 번에 탐색)"""
+    for key in path:
+        obj = obj.get(key) if isinstance(obj, dict) else None
+        if not obj:
+            return default
+    return obj
+
+def _default_retry() -> Retry:
+    """
+    공유 세션의 어댑터 재시도 정책
+    - 429/503의 Retry-After 헤더를 따르되 RETRY_AFTER_CAP 초로 제한, 없으면 지터가 섞인 지수 백오프
+    - POST(폴더/아이템 생성 등)/PATCH는 중복 실행 위험이 있어 제외 (HTTPClient.request의 idempotent_only와 같은 기준)
+    - PUT 재시도는 본문을 되감아 다시 보냄 (put_signed_url의 파일 본문은 seek 가능한 _BlockReader,
+      되감을 수 없는 스트림이면 빈 본문 대신 UnrewindableBodyError)
+    """
+    kwargs: Dict[str, Any] = dict(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS - _NON_IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return _CappedRetry(backoff_jitter=0.2, **kwargs)
+    except TypeError:  # urllib3 < 2: backoff_jitter 미지원
+        return _CappedRetry(**kwargs)
+
+def _ref(type_: str, id_: str) -> Dict[str, Dict[str, str]]:
+    """JSON:API 관계 참조 {"data": {"type", "id"}}"""
+    return {"data": {"type": type_, "id": id_}}
+
+def _envelope(type_: str, attrs: Dict, rels: Optional[Dict] = None, included: Optional[List[Dict]] = None, *, id_: str | None = None) -> bytes:
+    """JSON:API 요청 본문 {"data": {...}, "included": [...]}를 만들어 직렬화된 bytes로 반환"""
+    data: Dict[str, Any] = {"type": type_}
+    if id_ is not None: data["id"] = id_
+    data["attributes"] = attrs
+    if rels: data["relationships"] = rels
+    body: Dict[str, Any] = {"data": data}
+    if included: body["included"] = included
+    return _json_dumps(body)
+
+def _resolve_paths(facade: Any, http: HTTPClient) -> None:
+    """
+    퍼사드의 클래스 수준 경로 템플릿(_로 시작하는 "/..." 문자열)을 인스턴스 생성 시 한 번 절대 URL로 바꿔 둠
+    (AutomationClient와 같은 방식 — 요청마다 base_url 결합 없이 % 포맷 한 번으로 URL 완성)
+    """
+    for name, value in vars(type(facade)).items():
+        if name.startswith("_") and isinstance(value, str) and value.startswith("/"):
+            setattr(facade, name, http.base_url + value)
+
 # ----------------------------
 # Project v1 — Hubs / Projects / TopFolders
 # ----------------------------
 class _Hubs:
-    def __init__(self, cli: DataManagementClient): self.cli = cli
+    _HUB = "/hubs/%s"
+    _HUB_PROJECTS = "/hubs/%s/projects"
+
+    def __init__(self, cli: DataManagementClient):
+        self.cli = cli
+        _resolve_paths(self, cli.http_project)
 
     def list(self, *, limit: int | None = None) -> Iterable[Dict]:
         """GET /project/v1/hubs — list accessible hubs."""
-        params = {"page[limit]": limit} if limit else None
+        params = self.cli._page_params(limit)
         page = self.cli.http_project.get("/hubs", params=params)
         yield from self.cli.http_project.paginate(page)
 
     def get(self, hub_id: str) -> Dict:
         """GET /project/v1/hubs/:hub_id"""
-        return self.cli.http_project.get(f"/hubs/{hub_id}")
+        return self.cli.http_project.get(self._HUB % hub_id)
 
     def list_projects(self, hub_id: str, *, limit: int | None = None) -> Iterable[Dict]:
         """GET /project/v1/hubs/:hub_id/projects — projects in a hub."""
-        params = {"page[limit]": limit} if limit else None
-        page = self.cli.http_project.get(f"/hubs/{hub_id}/projects", params=params)
+        params = self.cli._page_params(limit)
+        page = self.cli.http_project.get(self._HUB_PROJECTS % hub_id, params=params)
         yield from self.cli.http_project.paginate(page)
 
+    async def alist(self, *, limit: int | None = None) -> List[Dict]:
+        """list()의 비동기 버전 (모든 페이지를 워커 스레드에서 받아 리스트로 반환)"""
+        return await asyncio.to_thread(lambda: list(self.list(limit=limit)))
+
+    async def alist_projects(self, hub_id: str, *, limit: int | None = None) -> List[Dict]:
+        """list_projects()의 비동기 버전 (여러 허브를 asyncio.gather로 동시에 조회할 때 사용)"""
+        return await asyncio.to_thread(lambda: list(self.list_projects(hub_id, limit=limit)))
+
 class _Projects:
-    def __init__(self, cli: DataManagementClient): self.cli = cli
+    _PROJECT = "/hubs/%s/projects/%s"
+    _TOP_FOLDERS = "/hubs/%s/projects/%s/topFolders"
+
+    def __init__(self, cli: DataManagementClient):
+        self.cli = cli
+        _resolve_paths(self, cli.http_project)
 
     def get(self, hub_id: str, project_id: str) -> Dict:
         """GET /project/v1/hubs/:hub_id/projects/:project_id"""
-        return self.cli.http_project.get(f"/hubs/{hub_id}/projects/{project_id}")
+        return self.cli.http_project.get(self._PROJECT % (hub_id, project_id))
 
     def top_folders(self, hub_id: str, project_id: str) -> Dict:
         """GET /project/v1/hubs/:hub_id/projects/:project_id/topFolders"""
-        return self.cli.http_project.get(f"/hubs/{hub_id}/projects/{project_id}/topFolders")
+        return self.cli.http_project.get(self._TOP_FOLDERS % (hub_id, project_id))
+
+    async def atop_folders(self, hub_id: str, project_id: str) -> Dict:
+        """top_folders()의 비동기 버전"""
+        return await asyncio.to_thread(self.top_folders, hub_id, project_id)
+
+    async def atop_folders_many(self, hub_id: str, project_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 프로젝트의 topFolders를 동시에 조회
+        - 반환: {project_id: topFolders 응답} (입력 순서 유지)
+        - 요청은 공유 세션의 커넥션 풀을 사용하므로 동시 요청 수는 풀 크기(32) 이하 권장
+        """
+        ids = list(dict.fromkeys(project_ids))
+        results = await asyncio.gather(*(self.atop_folders(hub_id, pid) for pid in ids))
+        return dict(zip(ids, results))
 
 # ----------------------------
 # Data v1 — Folders / Items / Versions / Storage / Commands
 # ----------------------------
 class _Folders:
-    def __init__(self, cli: DataManagementClient): self.cli = cli
+    _FOLDERS = "/projects/%s/folders"
+    _FOLDER = "/projects/%s/folders/%s"
+    _FOLDER_CONTENTS = "/projects/%s/folders/%s/contents"
+    _FOLDER_SEARCH = "/projects/%s/folders/%s/search"
+
+    def __init__(self, cli: DataManagementClient):
+        self.cli = cli
+        _resolve_paths(self, cli.http_data)
 
-    def get(self, project_id: str, folder_id: str) -> Dict:
-        """GET /data/v1/projects/:project_id/folders/:folder_id"""
-        return self.cli.http_data.get(f"/projects/{project_id}/folders/{folder_id}")
+    def get(self, project_id: str, folder_id: str, *, include: str | None = None) -> Dict:
+        """GET /data/v1/projects/:project_id/folders/:folder_id (include: 같은 응답에 사이드로드할 관계, 예: "parent")"""
+        params = {"include": include} if include else None
+        return self.cli.http_data.get(self._FOLDER % (project_id, folder_id), params=params)
 
     def contents(self, project_id: str, folder_id: str, *, limit: int | None = None, include: str | None = None) -> Iterable[Dict]:
-        """GET /data/v1/projects/:project_id/folders/:folder_id/contents"""
-        params: Dict[str, Any] = {}
-        if limit: params["page[limit]"] = limit
-        if include: params["include"] = include
-        page = self.cli.http_data.get(f"/projects/{project_id}/folders/{folder_id}/contents", params=params)
+        """GET /data/v1/projects/:project_id/folders/:folder_id/contents — links.next 커서를 따라 전체 순회"""
+        params = self.cli._page_params(limit, include=include)
+        page = self.cli.http_data.get(self._FOLDER_CONTENTS % (project_id, folder_id), params=params)
         yield from self.cli.http_data.paginate(page)
 
+    def contents_with_included(
+        self, project_id: str, folder_id: str, *, include: str = "tip", limit: int | None = None,
+    ) -> Tuple[List[Dict], Dict[Tuple[str, str], Dict]]:
+        """
+        contents()와 같지만 JSON:API included 사이드로드를 (type, id) 키로 모아 함께 반환
+        자식마다 items.get / versions.get를 호출하는 N+1 왕복 대신 페이지당 요청 하나로 처리
+
+        Returns:
+            (contents, included) — included[("versions", tip_id)] 형태로 조회
+        """
+        params = self.cli._page_params(limit, include=include)
+        page = self.cli.http_data.get(self._FOLDER_CONTENTS % (project_id, folder_id), params=params)
+        data: List[Dict] = []
+        included: Dict[Tuple[str, str], Dict] = {}
+        while page:
+            data.extend(page.get("data") or [])
+            for res in page.get("included") or []:
+                included[(res.get("type"), res.get("id"))] = res
+            next_href = _jget(page, "links", "next", "href")
+            page = self.cli.http_data.get(next_href) if next_href else None
+        return data, included
+
+    async def acontents(self, project_id: str, folder_id: str, *, limit: int | None = None, include: str | None = None) -> List[Dict]:
+        """contents()의 비동기 버전 (모든 페이지를 리스트로 반환)"""
+        return await asyncio.to_thread(lambda: list(self.contents(project_id, folder_id, limit=limit, include=include)))
+
     def search(self, project_id: str, folder_id: str, q: str, *, limit: int | None = None) -> Iterable[Dict]:
         """GET /data/v1/projects/:project_id/folders/:folder_id/search?q=..."""
-        params: Dict[str, Any] = {"q": q}
-        if limit: params["page[limit]"] = limit
-        page = self.cli.http_data.get(f"/projects/{project_id}/folders/{folder_id}/search", params=params)
+        params = {k: v for k, v in (("q", q), (_PAGE_LIMIT, limit)) if v is not None}
+        page = self.cli.http_data.get(self._FOLDER_SEARCH % (project_id, folder_id), params=params)
         yield from self.cli.http_data.paginate(page)
 
     def create(self, project_id: str, parent_folder_id: str, name: str, *, hidden:bool = False) -> Dict:
         """POST /data/v1/projects/:project_id/folders"""
-        body = {
-            "data": {
-                "type": "folders",
-                "attributes": {"name": name, "hidden": hidden},
-                "relationships": {"parent": {"data": {"type": "folders", "id": parent_folder_id}}},
-            }
-        }
-        resp = self.cli.http_data.post(f"/projects/{project_id}/folders", json=body)
-        return (resp or {}).get("data", {})
+        body = _envelope("folders", {"name": name, "hidden": hidden}, {"parent": _ref("folders", parent_folder_id)})
+        resp = self.cli.http_data.post(self._FOLDERS % project_id, data=body, headers=_JSONAPI_HEADERS)
+        return _jget(resp, "data", default={})
 
     def patch(self, project_id: str, folder_id: str, attributes: Dict) -> Dict:
         """PATCH /data/v1/projects/:project_id/folders/:folder_id"""
-        body = {"data": {"type": "folders", "id": folder_id, "attributes": attributes}}
-        return self.cli.http_data.patch(f"/projects/{project_id}/folders/{folder_id}", json=body)
+        body = _envelope("folders", attributes, id_=folder_id)
+        return self.cli.http_data.patch(self._FOLDER % (project_id, folder_id), data=body, headers=_JSONAPI_HEADERS)
 
 class _Items:
-    def __init__(self, cli: DataManagementClient): self.cli = cli
+    _ITEMS = "/projects/%s/items"
+    _ITEM = "/projects/%s/items/%s"
+    _ITEM_VERSIONS = "/projects/%s/items/%s/versions"
+
+    def __init__(self, cli: DataManagementClient):
+        self.cli = cli
+        _resolve_paths(self, cli.http_data)
+
+    def get(self, project_id: str, item_id: str, *, include: str | None = None) -> Dict:
+        """GET /data/v1/projects/:project_id/items/:item_id (include: 예: "tip" — 최신 버전을 included로 함께 수신)"""
+        params = {"include": include} if include else None
+        return self.cli.http_data.get(self._ITEM % (project_id, item_id), params=params)
+
+    def list_versions(self, project_id: str, item_id: str, *, limit: int | None = None, include: str | None = None) -> Iterable[Dict]:
+        """GET /data/v1/projects/:project_id/items/:item_id/versions — links.next 커서를 따라 전체 순회"""
+        params = self.cli._page_params(limit, include=include)
+        page = self.cli.http_data.get(self._ITEM_VERSIONS % (project_id, item_id), params=params)
+        yield from self.cli.http_data.paginate(page)
 
-    def get(self, project_id: str, item_id: str) -> Dict:
-        """GET /data/v1/projects/:project_id/items/:item_id"""
-        return self.cli.http_data.get(f"/projects/{project_id}/items/{item_id}")
+    async def alist_versions(self, project_id: str, item_id: str, *, limit: int | None = None, include: str | None = None) -> List[Dict]:
+        """list_versions()의 비동기 버전 (모든 페이지를 리스트로 반환)"""
+        return await asyncio.to_thread(lambda: list(self.list_versions(project_id, item_id, limit=limit, include=include)))
 
-    def list_versions(self, project_id: str, item_id: str, *, limit: int | None = None) -> Iterable[Dict]:
-        """GET /data/v1/projects/:project_id/items/:item_id/versions"""
-        params = {"page[limit]": limit} if limit else None
-        page = self.cli.http_data.get(f"/projects/{project_id}/items/{item_id}/versions", params=params)
-        yield from self.cli.http_data.paginate(page)
+    def list_versions_bulk(self, project_id: str, item_ids: Iterable[str], *, concurrency: int = 8) -> Dict[str, List[Dict]]:
+        """
+        여러 아이템의 버전 목록을 한 번에 조회
+        - 반환: {item_id: [version, ...]} (입력 순서 유지, 중복 id는 한 번만 조회)
+        - Data v1에는 여러 아이템의 버전을 한 요청으로 주는 필터가 없으므로
+          아이템별 list_versions()를 공유 세션에서 concurrency개씩 동시에 실행
+        """
+        ids = list(dict.fromkeys(item_ids))
+        if concurrency <= 1 or len(ids) <= 1:
+            return {iid: list(self.list_versions(project_id, iid)) for iid in ids}
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(ids))) as ex:
+            results = ex.map(lambda iid: list(self.list_versions(project_id, iid)), ids)
+            return dict(zip(ids, results))
 
     def create_with_first_version(self, project_id: str, parent_folder_id: str, file_name: str, storage_urn: str) -> Dict:
         """POST /data/v1/projects/:project_id/items — create item + first version"""
-        body = {
-            "data": {
-                "type": "items",
-                "attributes": {"displayName": file_name},
-                "relationships": {
-                    "tip": {"data": {"type": "versions", "id": "1"}},
-                    "parent": {"data": {"type": "folders", "id": parent_folder_id}},
-                },
-            },
-            "included": [
-                {"type": "versions", "id": "1", "attributes": {"name": file_name, "storageUrn": storage_urn}}
-            ],
-        }
-        resp = self.cli.http_data.post(f"/projects/{project_id}/items", json=body)
-        return (resp or {}).get("data", {})
+        body = _envelope(
+            "items",
+            {"displayName": file_name},
+            {"tip": _ref("versions", "1"), "parent": _ref("folders", parent_folder_id)},
+            [{"type": "versions", "id": "1", "attributes": {"name": file_name, "storageUrn": storage_urn}}],
+        )
+        resp = self.cli.http_data.post(self._ITEMS % project_id, data=body, headers=_JSONAPI_HEADERS)
+        return _jget(resp, "data", default={})
 
 class _Versions:
-    def __init__(self, cli: DataManagementClient): self.cli = cli
+    _VERSIONS = "/projects/%s/versions"
+    _VERSION = "/projects/%s/versions/%s"
+
+    def __init__(self, cli: DataManagementClient):
+        self.cli = cli
+        _resolve_paths(self, cli.http_data)
 
     def get(self, project_id: str, version_id: str) -> Dict:
         """GET /data/v1/projects/:project_id/versions/:version_id"""
-        return self.cli.http_data.get(f"/projects/{project_id}/versions/{version_id}")
+        return self.cli.http_data.get(self._VERSION % (project_id, version_id))
 
     def create(self, project_id: str, item_id: str, file_name: str, storage_urn: str) -> Dict:
         """POST /data/v1/projects/:project_id/versions — create a new version for an item."""
-        body = {
-            "data": {
-                "type": "versions",
-                "attributes": {"name": file_name, "storageUrn": storage_urn},
-                "relationships": {"item": {"data": {"type": "items", "id": item_id}}},
-            }
-        }
-        resp = self.cli.http_data.post(f"/projects/{project_id}/versions", json=body)
-        return (resp or {}).get("data", {})
+        body = _envelope("versions", {"name": file_name, "storageUrn": storage_urn}, {"item": _ref("items", item_id)})
+        resp = self.cli.http_data.post(self._VERSIONS % project_id, data=body, headers=_JSONAPI_HEADERS)
+        return _jget(resp, "data", default={})
 
 class _Commands:
     def __init__(self, cli: DataManagementClient): self.cli = cli
@@ -210,27 +384,21 @@ class _Objects:
     # ----- Storage (Data v1 → direct S3 PUT) -----
     def create_storage(self, project_id: str, target_folder_id: str, file_name: str) -> Dict:
         """POST /data/v1/projects/:project_id/storage — reserve upload target and get signed URL metadata."""
-        body = {
-            "data": {
-                "type": "objects",
-                "attributes": {"name": file_name},
-                "relationships": {"target": {"data": {"type": "folders", "id": target_folder_id}}},
-            }
-        }
-        return self.cli.http_data.post(f"/projects/{project_id}/storage", json=body)
-
-    def upload_via_storage(self, storage_resp: Dict, payload: bytes | str | Any, *, timeout: float | None = None) -> None:
+        body = _envelope("objects", {"name": file_name}, {"target": _ref("folders", target_folder_id)})
+        return self.cli.http_data.post(f"/projects/{project_id}/storage", data=body, headers=_JSONAPI_HEADERS)
+
+    def upload_via_storage(self, storage_resp: Dict, payload: bytes | str | os.PathLike | Any, *, timeout: float | None = None) -> None:
         """
         Use storage response's signed URL to upload in a single PUT.
+        - payload: bytes, 바이너리 파일 객체 또는 파일 경로 (파일은 f.read() 없이 디스크에서 바로 스트리밍)
         """
-        data = (storage_resp or {}).get("data", {}) or {}
-        attrs = data.get("attributes", {}) or {}
-        up = attrs.get("uploadParameters", {}) or {}
-        url = up.get("url") or ((data.get("links") or {}).get("signedUrl") or {}).get("href")
-        print("[datamanagement/client.py] url: ", url)
+        up = _jget(storage_resp, "data", "attributes", "uploadParameters", default={})
+        url = up.get("url") or _jget(storage_resp, "data", "links", "signedUrl", "href")
         headers = up.get("headers") or {}
         if not url:
             raise HTTPError(500, "PUT", "signed-url", "No signed URL in storage response")
+        # 서명(쿼리 문자열)은 자격 증명이므로 로그에는 경로까지만 남김
+        logger.debug("upload_via_storage url=%s", url.split("?", 1)[0])
         self.cli.http_data.put_signed_url(url, payload, headers=headers, timeout=timeout)
 
     # ----- OSS v2: object metadata/details -----
@@ -238,6 +406,19 @@ class _Objects:
         """GET /oss/v2/buckets/:bucketKey/objects/:objectKey/details"""
         return self.cli.http_oss.get(f"/buckets/{bucket_key}/objects/{object_key}/details")
 
+    def head(self, bucket_key: str, object_key: str) -> Dict[str, str] | None:
+        """
+        HEAD /oss/v2/buckets/:bucketKey/objects/:objectKey/details
+        - 메타데이터 본문 없이 응답 헤더(Content-Length, ETag 등)만 반환, 객체가 없으면 None
+        - skip-if-exists 업로드 확인에 get_details() 대신 사용
+        """
+        try:
+            return self.cli.http_oss.head(f"/buckets/{bucket_key}/objects/{object_key}/details")
+        except HTTPError as e:
+            if e.status == 404:
+                return None
+            raise
+
     # ----- OSS v2: delete object -----
     def delete(self, bucket_key: str, object_key: str) -> None:
         """DELETE /oss/v2/buckets/:bucketKey/objects/:objectKey"""
@@ -252,10 +433,16 @@ class _Objects:
         )
 
     # ----- OSS v2: signed S3 upload/download -----
-    def get_signed_upload(self, bucket_key: str, object_key: str, *, parts: int | None = None, useAcceleration: bool | None = None) -> Dict:
-        """GET /oss/v2/buckets/:bucketKey/objects/:objectKey/signeds3upload"""
+    def get_signed_upload(self, bucket_key: str, object_key: str, *, parts: int | None = None, useAcceleration: bool | None = None,
+                          first_part: int | None = None, upload_key: str | None = None) -> Dict:
+        """
+        GET /oss/v2/buckets/:bucketKey/objects/:objectKey/signeds3upload
+        - 한 번에 최대 25개 파트 URL 발급. 이어지는 파트는 first_part와 이전 응답의 upload_key로 요청
+        """
         params: Dict[str, Any] = {}
         if parts is not None: params["parts"] = parts
+        if first_part is not None: params["firstPart"] = first_part
+        if upload_key: params["uploadKey"] = upload_key
         if useAcceleration: params["useAcceleration"] = "true"
         return self.cli.http_oss.get(f"/buckets/{bucket_key}/objects/{object_key}/signeds3upload", params=params)
 
@@ -266,6 +453,32 @@ class _Objects:
         if etags: body["eTags"] = etags
         return self.cli.http_oss.post(f"/buckets/{bucket_key}/objects/{object_key}/signeds3upload", json=body)
 
+    def upload_signed_s3(
+        self,
+        bucket_key: str,
+        object_key: str,
+        file_path: str | Path,
+        *,
+        part_size: int = 5 * 1024 * 1024,
+        concurrency: int = 8,
+        use_acceleration: bool | None = None,
+        timeout: float | None = None,
+    ) -> Dict:
+        """
+        signeds3upload 멀티파트 업로드: 파트 URL 발급(25개씩) → 파트 병렬 PUT → 완료 처리
+        - 파트는 공유 세션(커넥션 풀)으로 concurrency개씩 동시에 PUT
+        - part_size가 mmap 할당 단위의 배수면 파트를 mmap으로 바로 전송 (Python bytes로 복사하지 않음)
+        - 만료(403)된 파트 URL은 같은 uploadKey로 다시 발급받아 한 번 재시도
+        - 반환: 완료(POST signeds3upload) 응답
+        """
+        path = Path(file_path)
+        return _upload_signed_s3_parts(
+            self, bucket_key, object_key, path,
+            size=path.stat().st_size, part_size=part_size, concurrency=concurrency,
+            session=self.cli.http_oss.session, timeout=timeout or self.cli.http_oss.timeout,
+            use_acceleration=use_acceleration,
+        )
+
     def get_signed_download(self, bucket_key: str, object_key: str, *, minutes_valid: int | None = None) -> Dict:
         """GET /oss/v2/buckets/:bucketKey/objects/:objectKey/signeds3download"""
         params = {"minutesExpiration": minutes_valid} if minutes_valid else None
@@ -283,9 +496,25 @@ class _Objects:
             params["useCookies"] = "true"
         return self.cli.http_oss.post(f"/buckets/{bucket_key}/objects/{object_key}/signed", params=params, json={})
     
-    def upload_via_signed(self, signed_resp: Dict, file_path: str | bytes, *, timeout: float | None = None) -> None:
+    def post_signed_pair(self, bucket_key: str, object_key: str, *, minutes_valid: int = 60) -> Dict:
+        """
+        POST /signed (access=readwrite) 한 번으로 업로드/다운로드 겸용 URL 발급
+        - 반환: POST /signed 응답 + upload_url / download_url (같은 signed URL, PUT/GET 모두 가능)
+        - signeds3download는 업로드 완료 후에만 받을 수 있어 두 번째 왕복이 필요하지만, 이 방식은 발급 1회로 끝남
+        """
+        resp = self.cli.http_oss.post(
+            f"/buckets/{bucket_key}/objects/{object_key}/signed",
+            params={"access": "readwrite", "minutesExpiration": minutes_valid}, json={},
+        ) or {}
+        url = resp.get("signedUrl") or (isinstance(resp.get("signedUrls"), list) and resp["signedUrls"][0]) or None
+        if not url:
+            raise HTTPError(500, "POST", "signed-url", "No signedUrl in POST /signed response")
+        return dict(resp, upload_url=url, download_url=url)
+
+    def upload_via_signed(self, signed_resp: Dict, file_path: str | os.PathLike | bytes | Any, *, timeout: float | None = None) -> None:
         """
         POST /signed 응답의 signedUrl(또는 signedUrls[0]) 로 실제 바이트 업로드 (HTTP PUT)
+        - file_path: 파일 경로(str/PathLike), bytes 또는 바이너리 파일 객체 (파일은 메모리 적재 없이 스트리밍)
         """
         data = signed_resp or {}
         url = (data.get("signedUrl")
@@ -295,6 +524,51 @@ class _Objects:
             raise HTTPError(500, "PUT", "signed-url", "No signedUrl in POST /signed response")
         self.cli.http_oss.put_signed_url(url, file_path, headers={}, timeout=timeout)
 
+def _upload_signed_s3_parts(
+    objects: "_Objects",
+    bucket_key: str,
+    object_key: str,
+    path: Path,
+    *,
+    size: int,
+    part_size: int,
+    concurrency: int,
+    session: requests.Session,
+    timeout: float | None,
+    use_acceleration: bool | None = None,
+) -> Dict:
+    """_Objects.upload_signed_s3 본체 (AutomationWorkflow도 자체 세션으로 재사용)"""
+    n_parts = max(1, -(-size // part_size))
+    extra = {"useAcceleration": True} if use_acceleration else {}
+
+    urls: List[str] = []
+    upload_key: Optional[str] = None
+    for first_part in range(1, n_parts + 1, _SIGNED_UPLOAD_MAX_PARTS):
+        signed = objects.get_signed_upload(
+            bucket_key, object_key,
+            parts=min(_SIGNED_UPLOAD_MAX_PARTS, n_parts - first_part + 1),
+            first_part=first_part, upload_key=upload_key, **extra,
+        )
+        upload_key = signed["uploadKey"]
+        urls.extend(signed["urls"])
+
+    def resign(index: int) -> str:
+        return objects.get_signed_upload(
+            bucket_key, object_key, parts=1, first_part=index + 1, upload_key=upload_key, **extra,
+        )["urls"][0]
+
+    etags = _put_signed_parts(
+        session, urls, path, part_size, parallel=concurrency, resign=resign, timeout=timeout,
+    )
+    # ETag가 빠진 파트를 버리고 완료하면 S3가 파트를 잘못 조립하므로 실패 처리
+    for part_number, etag in enumerate(etags, 1):
+        if not etag:
+            raise HTTPError(
+                500, "PUT", f"{bucket_key}/{object_key}",
+                f"No ETag in S3 response for part {part_number} of {len(etags)}",
+            )
+    return objects.complete_signed_upload(bucket_key, object_key, upload_key, size=size, etags=etags)
+
 # ----------------------------
 # OSS v2 — Buckets
 # ----------------------------
@@ -302,14 +576,13 @@ class _Buckets:
     def __init__(self, cli: DataManagementClient): self.cli = cli
 
     def list(self, *, region: str | None = None, limit: int | None = None) -> Iterable[Dict]:
-        """GET /oss/v2/buckets — list buckets owned by the app."""
-        params: Dict[str, Any] = {}
-        if region: params["region"] = region
-        if limit: params["page[limit]"] = limit
+        """GET /oss/v2/buckets — list buckets owned by the app (next 커서를 따라 전체 순회)."""
+        params: Dict[str, Any] = self.cli._default_oss_page
+        if limit is not None or region:
+            params = {"limit": min(limit or self.cli.page_size, _OSS_MAX_PAGE_SIZE)}
+            if region: params["region"] = region
         page = self.cli.http_oss.get("/buckets", params=params)
-        data = (page or {}).get("items") or (page or {}).get("data") or []
-        for it in data:
-            yield it
+        yield from _paginate_oss(self.cli.http_oss, page)
 
     def create(self, bucket_key: str, *, region: str | None = None, policy_key: str | None = None) -> Dict:
         """POST /oss/v2/buckets — create a bucket."""
@@ -323,9 +596,18 @@ class _Buckets:
         return self.cli.http_oss.get(f"/buckets/{bucket_key}/details")
 
     def list_objects(self, bucket_key: str, *, limit: int | None = None) -> Iterable[Dict]:
-        """GET /oss/v2/buckets/:bucketKey/objects — list objects in a bucket."""
-        params = {"page[limit]": limit} if limit else None
+        """GET /oss/v2/buckets/:bucketKey/objects — list objects in a bucket (next 커서를 따라 전체 순회)."""
+        params = self.cli._default_oss_page if limit is None else {"limit": min(limit, _OSS_MAX_PAGE_SIZE)}
         page = self.cli.http_oss.get(f"/buckets/{bucket_key}/objects", params=params)
-        data = (page or {}).get("items") or (page or {}).get("data") or []
-        for it in data:
-            yield it
\ No newline at end of file
+        yield from _paginate_oss(self.cli.http_oss, page)
+
+
+def _paginate_oss(http: HTTPClient, page: Optional[Dict]) -> Iterable[Dict]:
+    """
+    OSS v2 목록 페이지네이션: 응답의 next(startAt 커서가 담긴 절대 URL)를 그대로 따라감
+    (오프셋 방식이 아니므로 목록이 커져도 페이지당 비용이 일정)
+    """
+    while page:
+        yield from page.get("items") or page.get("data") or []
+        next_url = page.get("next")
+        page = http.get(next_url) if next_url else None
\ No newline at end of file
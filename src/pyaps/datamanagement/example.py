@@ -4,7 +4,10 @@ Hubs, Projects, Folders, Items, Versions, Buckets, Objects 등의 기능을 smok
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pyaps.auth import AuthClient, Scopes, InMemoryTokenStore
 from pyaps.datamanagement.client import DataManagementClient
@@ -25,8 +28,12 @@ def load_dotenv():
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=1)
 def create_dm_client() -> DataManagementClient:
-    """Create DataManagementClient with 3-legged token provider"""
+    """
+    Create DataManagementClient with 2-legged token provider
+    (한 번만 생성하여 모든 예제가 같은 AuthClient/토큰 캐시/커넥션 풀을 공유)
+    """
     auth_client = AuthClient(
         client_id=os.getenv("APS_CLIENT_ID"),
         client_secret=os.getenv("APS_CLIENT_SECRET"),
@@ -34,12 +41,12 @@ def create_dm_client() -> DataManagementClient:
     )
 
     # For Data Management, we typically use 2-legged with data:read/write scopes
-    def token_provider() -> str:
+    # OAuth2Token을 그대로 반환하면 cache_token=True일 때 실제 만료 시각까지 재사용
+    def token_provider():
         scopes = [Scopes.DATA_READ, Scopes.DATA_WRITE, Scopes.BUCKET_READ]
-        token = auth_client.two_legged.get_token(scopes)
-        return token.access_token
+        return auth_client.two_legged.get_token(scopes)
 
-    return DataManagementClient(token_provider=token_provider)
+    return DataManagementClient(token_provider=token_provider, cache_token=True)
 
 
 def example_hubs():
@@ -72,10 +79,13 @@ def example_hubs():
         print(f"  ✓ Hub: {hub_attrs.get('name')}")
         print(f"  ✓ Region: {hub_attrs.get('region')}")
 
-        # 1-3. List projects in hub
-        print("\n[1-3] List projects in hub")
-        projects = list(dm.hubs.list_projects(first_hub_id, limit=5))
-        print(f"  ✓ Found {len(projects)} projects")
+        # 1-3. List projects in every hub (허브별 호출은 서로 독립 → 스레드로 동시 요청)
+        print("\n[1-3] List projects in hubs (concurrent)")
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            project_lists = list(ex.map(lambda h: list(dm.hubs.list_projects(h['id'])), hubs))
+        for hub, hub_projects in zip(hubs[:3], project_lists):
+            print(f"  ✓ {hub.get('attributes', {}).get('name', 'N/A')}: {len(hub_projects)} projects")
+        projects = project_lists[0]
         for proj in projects[:3]:
             proj_attrs = proj.get('attributes', {})
             print(f"    - {proj_attrs.get('name', 'N/A')} (ID: {proj.get('id', 'N/A')})")
@@ -116,12 +126,45 @@ def example_projects(hub_id: str, project_id: str):
             folder_attrs = folder.get('attributes', {})
             print(f"    - {folder_attrs.get('name', 'N/A')} (ID: {folder.get('id', 'N/A')})")
 
+        # 2-3. Top folders of several projects (concurrent)
+        print("\n[2-3] Top folders across projects (concurrent)")
+        project_ids = [p['id'] for p in dm.hubs.list_projects(hub_id)][:8]
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            folder_lists = list(ex.map(lambda pid: dm.projects.top_folders(hub_id, pid).get('data', []), project_ids))
+        print(f"  ✓ {sum(map(len, folder_lists))} top folders across {len(project_ids)} projects")
+
         return top_folders[0]['id'] if top_folders else None
     except Exception as e:
         print(f"  ✗ Error: {e}")
         return None
 
 
+def example_async_fan_out(hub_id: str):
+    """허브의 모든 프로젝트 topFolders를 동시에 조회하는 비동기 예제"""
+    print("\n" + "="*60)
+    print("2b. Async fan-out (topFolders of every project)")
+    print("="*60)
+
+    if not hub_id:
+        print("  ℹ Skipped - no hub available")
+        return
+
+    dm = create_dm_client()
+
+    async def run():
+        projects = await dm.hubs.alist_projects(hub_id)
+        # 프로젝트 수만큼의 GET을 순차 대기 대신 동시에 진행 (공유 커넥션 풀 사용)
+        return await dm.projects.atop_folders_many(hub_id, [p["id"] for p in projects])
+
+    try:
+        folders = asyncio.run(run())
+        print(f"  ✓ Fetched top folders of {len(folders)} projects")
+        for project_id, resp in list(folders.items())[:3]:
+            print(f"    - {project_id}: {len(resp.get('data', []))} top folders")
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+
+
 def example_folders(project_id: str, folder_id: str):
     """Folders API 예제"""
     print("\n" + "="*60)
@@ -143,14 +186,19 @@ def example_folders(project_id: str, folder_id: str):
         print(f"  ✓ Folder: {folder_attrs.get('name')}")
         print(f"  ✓ Hidden: {folder_attrs.get('hidden', False)}")
 
-        # 3-2. List folder contents
+        # 3-2. List folder contents (include=tip으로 최신 버전을 같은 응답에 사이드로드)
         print("\n[3-2] List folder contents")
-        contents = list(dm.folders.contents(project_id, folder_id, limit=10))
+        contents, included = dm.folders.contents_with_included(project_id, folder_id, include="tip")
         print(f"  ✓ Found {len(contents)} items")
         for item in contents[:5]:
             item_attrs = item.get('attributes', {})
             item_type = item.get('type', 'unknown')
             print(f"    - [{item_type}] {item_attrs.get('displayName') or item_attrs.get('name', 'N/A')}")
+            # 자식마다 items.get / versions.get를 호출하지 않고 included에서 조회
+            tip_ref = ((item.get('relationships') or {}).get('tip') or {}).get('data')
+            tip = included.get((tip_ref['type'], tip_ref['id'])) if tip_ref else None
+            if tip:
+                print(f"      tip: v{tip.get('attributes', {}).get('versionNumber')}")
 
         # 3-3. Search in folder (structure only)
         print("\n[3-3] Search in folder (structure only)")
@@ -192,7 +240,7 @@ def example_items():
     print("\n[4-3] Create item with first version (structure only)")
     print("  Workflow:")
     print("    1. Create storage: storage = dm.objects.create_storage(project_id, folder_id, 'file.rvt')")
-    print("    2. Upload file: dm.objects.upload_via_storage(storage, file_bytes)")
+    print("    2. Upload file: dm.objects.upload_via_storage(storage, 'myfile.rvt')")
     print("    3. Create item: item = dm.items.create_with_first_version(")
     print("        project_id, folder_id, 'file.rvt', storage['data']['id'])")
 
@@ -263,7 +311,7 @@ def example_objects():
     print("\n[6-2] Upload file via storage (structure only)")
     print("  Usage:")
     print("    with open('local_file.rvt', 'rb') as f:")
-    print("        dm.objects.upload_via_storage(storage, f.read())")
+    print("        dm.objects.upload_via_storage(storage, f)  # 파일 객체를 그대로 전달 (스트리밍)")
 
     print("\n[6-3] Get signed upload URL (OSS) (structure only)")
     print("  Usage:")
@@ -290,6 +338,11 @@ def example_objects():
     print("    )")
     print("    # Then use download['url'] to download the file")
 
+    print("\n[6-6] Skip upload if the object already exists (structure only)")
+    print("  Usage:")
+    print("    if dm.objects.head('my-bucket', 'path/to/file.txt') is None:  # HEAD — 본문 없이 헤더만 수신")
+    print("        dm.objects.upload_signed_s3('my-bucket', 'path/to/file.txt', 'local_file.txt')")
+
 
 def example_commands():
     """Commands API 예제"""
@@ -338,7 +391,7 @@ def example_workflow():
 
     print("\n  Step 3: Upload file to storage")
     print("    with open('myfile.rvt', 'rb') as f:")
-    print("        dm.objects.upload_via_storage(storage, f.read())")
+    print("        dm.objects.upload_via_storage(storage, f)  # 파일 객체를 그대로 전달 (스트리밍)")
 
     print("\n  Step 4: Create item with first version")
     print("    item = dm.items.create_with_first_version(")
@@ -369,6 +422,7 @@ def main():
         hub_id, project_id = example_hubs()
         if hub_id and project_id:
             folder_id = example_projects(hub_id, project_id)
+            example_async_fan_out(hub_id)
             if folder_id:
                 example_folders(project_id, folder_id)
 
@@ -1,7 +1,8 @@
 # src/pyaps/http/__init__.py
-from .client import HTTPClient, HTTPError
+from .client import CachingTokenProvider, HTTPClient, HTTPError
 
 __all__ = [
+    "CachingTokenProvider",
     "HTTPClient",
     "HTTPError",
 ]
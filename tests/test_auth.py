@@ -0,0 +1,287 @@
+"""Tests for the auth client token flows."""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+
+import pytest
+
+from pyaps.auth import AuthClient, InMemoryTokenStore, OAuth2Token, Scopes
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code}")
+
+    def json(self):
+        return self._payload
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
+
+class FakeSession:
+    """Records POSTs and answers /token with a fresh access token."""
+
+    def __init__(self, delay=0.0, expires_in=3599):
+        self.calls = []
+        self.delay = delay
+        self.expires_in = expires_in
+        self._lock = threading.Lock()
+
+    def post(self, url, data=None, timeout=None, **kwargs):
+        if isinstance(data, str):
+            data = dict(urllib.parse.parse_qsl(data))
+        with self._lock:
+            self.calls.append((url, dict(data or {})))
+            n = len(self.calls)
+        if self.delay:
+            time.sleep(self.delay)
+        return FakeResponse({
+            "access_token": f"token-{n}",
+            "token_type": "Bearer",
+            "expires_in": self.expires_in,
+            "scope": (data or {}).get("scope"),
+        })
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def client(session):
+    c = AuthClient("cid", "secret", store=InMemoryTokenStore())
+    c.http_auth.session = session
+    return c
+
+
+def test_two_legged_reuses_cached_token(client, session):
+    """A second get_token for the same scopes must not hit /token."""
+    t1 = client.two_legged.get_token([Scopes.DATA_READ, Scopes.BUCKET_READ])
+    t2 = client.two_legged.get_token([Scopes.BUCKET_READ, Scopes.DATA_READ])
+    assert t1.access_token == t2.access_token
+    assert len(session.calls) == 1
+
+
+def test_two_legged_accepts_prejoined_scope_string(client, session):
+    """A space-separated scope string shares the cache entry of the equivalent list."""
+    t1 = client.two_legged.get_token("data:write  data:read")
+    t2 = client.two_legged.get_token((Scopes.DATA_READ, Scopes.DATA_WRITE))
+    assert t1.access_token == t2.access_token
+    assert session.calls[0][1]["scope"] == "data:read data:write"
+
+
+def test_two_legged_concurrent_misses_fetch_once(client, session):
+    """Concurrent cache misses for one key collapse into a single POST."""
+    session.delay = 0.1
+    results = []
+
+    def worker():
+        results.append(client.two_legged.get_token([Scopes.DATA_READ]).access_token)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(session.calls) == 1
+    assert set(results) == {"token-1"}
+
+
+def test_two_legged_refetches_near_expiry(client, session):
+    """Tokens inside the memory-cache safety buffer are refreshed."""
+    session.expires_in = 120
+    client.two_legged.get_token([Scopes.DATA_READ])
+    client.two_legged.get_token([Scopes.DATA_READ])
+    assert len(session.calls) == 2
+
+
+def test_memory_cache_drops_tokens_after_store_clear_or_revoke(client, session):
+    """Clearing the store or revoking a token must not keep serving it from memory."""
+    assert client.two_legged.get_token([Scopes.DATA_READ]).access_token == "token-1"
+    client.store.clear()
+    assert client.two_legged.get_token([Scopes.DATA_READ]).access_token == "token-2"
+
+    client.tokens.revoke("token-2")
+    assert client.two_legged.get_token([Scopes.DATA_READ]).access_token == "token-4"
+    assert session.calls[2][1]["token"] == "token-2"
+
+
+def test_two_legged_requires_secret():
+    with pytest.raises(ValueError):
+        AuthClient("cid").two_legged.get_token([Scopes.DATA_READ])
+
+
+def test_arevoke_all_revokes_both_tokens(client, session):
+    """arevoke_all issues one /revoke per token type."""
+    token = OAuth2Token("acc", "Bearer", "2099-01-01T00:00:00Z", refresh_token="ref")
+    asyncio.run(client.tokens.arevoke_all(token))
+
+    hints = sorted(data["token_type_hint"] for url, data in session.calls)
+    assert hints == ["access_token", "refresh_token"]
+    assert all(url.endswith("/revoke") for url, _ in session.calls)
+
+
+def test_aget_token_shares_sync_cache(client, session):
+    t1 = client.two_legged.get_token([Scopes.DATA_READ])
+    t2 = asyncio.run(client.two_legged.aget_token([Scopes.DATA_READ]))
+    assert t1.access_token == t2.access_token
+    assert len(session.calls) == 1
+
+
+@pytest.mark.parametrize("length", [43, 64, 128])
+def test_pkce_pair_matches_rfc7636(client, length):
+    """Verifier has the requested length and challenge is its S256 digest."""
+    verifier, challenge = client.three_legged.generate_pkce_pair(length)
+    assert len(verifier) == length
+    expected = base64.urlsafe_b64encode(hashlib.sha256(verifier.encode()).digest()).rstrip(b"=").decode()
+    assert challenge == expected
+
+
+def test_revoke_all_revokes_both_tokens(client, session):
+    token = OAuth2Token("acc", "Bearer", "2099-01-01T00:00:00Z", refresh_token="ref")
+    client.tokens.revoke_all(token)
+
+    hints = sorted(data["token_type_hint"] for url, data in session.calls)
+    assert hints == ["access_token", "refresh_token"]
+
+
+def test_revoke_many_revokes_every_token(client, session):
+    tokens = [
+        OAuth2Token(f"acc-{i}", "Bearer", "2099-01-01T00:00:00Z", refresh_token=f"ref-{i}")
+        for i in range(5)
+    ]
+    client.tokens.revoke_many(tokens, max_workers=4)
+
+    revoked = sorted(data["token"] for _, data in session.calls)
+    assert revoked == sorted([f"acc-{i}" for i in range(5)] + [f"ref-{i}" for i in range(5)])
+
+
+def test_memory_cache_evicts_least_recently_used(client, session):
+    client._memory_cache.maxsize = 2
+    client.two_legged.get_token([Scopes.DATA_READ])
+    client.two_legged.get_token([Scopes.DATA_WRITE])
+    client.two_legged.get_token([Scopes.DATA_READ])     # refresh LRU position
+    client.two_legged.get_token([Scopes.BUCKET_READ])   # evicts DATA_WRITE
+
+    keys = list(client._memory_cache._entries)
+    assert len(keys) == 2
+    assert not any(k.endswith(Scopes.DATA_WRITE) for k in keys)
+
+
+def test_prefetch_scopes_warms_cache(monkeypatch, session):
+    """Tokens for prefetch_scopes are fetched in the background at construction."""
+    import pyaps.auth.client as auth_client
+
+    monkeypatch.setattr(auth_client, "_pooled_session", lambda: session)
+    c = AuthClient("cid", "secret", prefetch_scopes=[[Scopes.DATA_READ]])
+
+    deadline = time.time() + 2
+    while not session.calls and time.time() < deadline:
+        time.sleep(0.01)
+    c.two_legged.get_token([Scopes.DATA_READ])
+    assert len(session.calls) == 1
+
+
+def test_auto_refresh_replaces_token_before_expiry(session):
+    """With auto_refresh, a timer re-fetches the token ahead of the cache skew."""
+    from pyaps.auth.client import MEMORY_CACHE_SKEW_SECONDS
+
+    session.expires_in = MEMORY_CACHE_SKEW_SECONDS + 61   # refresh scheduled ~1s out
+    c = AuthClient("cid", "secret", auto_refresh=True)
+    c.http_auth.session = session
+    try:
+        first = c.two_legged.get_token([Scopes.DATA_READ])
+        deadline = time.time() + 5
+        while len(session.calls) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert len(session.calls) >= 2
+        assert c.two_legged.get_token([Scopes.DATA_READ]).access_token != first.access_token
+    finally:
+        c.close()
+    assert not c._refresh_timers
+
+
+def test_async_workers_uses_dedicated_pool(session):
+    c = AuthClient("cid", "secret", async_workers=4)
+    c.http_auth.session = session
+    try:
+        tokens = asyncio.run(c.two_legged.aget_tokens([[Scopes.DATA_READ], [Scopes.DATA_WRITE]]))
+        assert len({t.access_token for t in tokens}) == 2
+        assert c._async_executor is not None
+    finally:
+        c.close()
+    assert c._async_executor is None
+
+
+def test_token_form_bodies(session):
+    """Pre-encoded grant bodies carry the same fields as a urlencoded dict."""
+    c = AuthClient("cid", "s&cret", redirect_uri="http://localhost:8080/cb")
+    c.http_auth.session = session
+
+    c.two_legged.get_token([Scopes.DATA_READ, Scopes.DATA_WRITE])
+    c.three_legged.exchange_code("the code", code_verifier="v" * 43)
+    c.tokens.refresh("rt", scopes=[Scopes.DATA_READ])
+
+    (_, cc), (_, ac), (_, rt) = session.calls
+    assert cc == {"grant_type": "client_credentials", "client_id": "cid",
+                  "client_secret": "s&cret", "scope": "data:read data:write"}
+    assert ac == {"grant_type": "authorization_code", "client_id": "cid", "client_secret": "s&cret",
+                  "redirect_uri": "http://localhost:8080/cb", "code": "the code", "code_verifier": "v" * 43}
+    assert rt == {"grant_type": "refresh_token", "client_id": "cid", "client_secret": "s&cret",
+                  "refresh_token": "rt", "scope": "data:read"}
+
+
+def test_form_bodies_follow_credentials_set_after_construction(session):
+    c = AuthClient("cid")
+    c.http_auth.session = session
+    c.client_secret = "late"
+    c.redirect_uri = "http://localhost:8080/cb"
+
+    c.three_legged.exchange_code("code")
+    assert "localhost%3A8080" in c.three_legged.build_authorize_url([Scopes.DATA_READ])
+    c.redirect_uri = "https://app.example/cb"
+    assert "app.example" in c.three_legged.build_authorize_url([Scopes.DATA_READ])
+
+    (_, ac), = session.calls
+    assert ac["client_secret"] == "late" and ac["redirect_uri"] == "http://localhost:8080/cb"
+
+
+def test_cache_keys_follow_attributes_set_after_construction():
+    c = AuthClient("cid", "secret", redirect_uri="http://localhost:8080/cb")
+    assert c.three_legged._cache_key_3l("data:read") == "aps:3l:cid:http://localhost:8080/cb:data:read"
+
+    c.redirect_uri = "https://app.example/cb"
+    c.cache_prefix = "tenant"
+    assert c.three_legged._cache_key_3l("data:read") == "tenant:3l:cid:https://app.example/cb:data:read"
+
+
+def test_load_dotenv_empty_value_does_not_swallow_next_line(tmp_path, monkeypatch):
+    from pyaps._dotenv import load_dotenv
+
+    for key in ("PYAPS_T_EMPTY", "PYAPS_T_NEXT", "PYAPS_T_SET"):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("PYAPS_T_SET", "shell")
+    env = tmp_path / ".env"
+    env.write_text("# comment\nPYAPS_T_EMPTY=\nPYAPS_T_NEXT = value \nPYAPS_T_SET=file\n")
+
+    load_dotenv(env)
+
+    assert os.environ["PYAPS_T_EMPTY"] == ""
+    assert os.environ["PYAPS_T_NEXT"] == "value"
+    assert os.environ["PYAPS_T_SET"] == "shell"
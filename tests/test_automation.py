@@ -0,0 +1,156 @@
+"""Tests for AutomationClient request construction."""
+import asyncio
+import dataclasses
+import json
+
+import pytest
+
+from pyaps.automation import AutomationClient, WorkItemArgument, WorkItemSpec
+
+
+class FakeResponse:
+    def __init__(self, payload=None, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+        self.text = self.content.decode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Records every request and answers with an empty JSON object."""
+
+    def __init__(self, respond=None):
+        self.calls = []
+        self.proxies = {}
+        self.trust_env = True
+        self.respond = respond or (lambda method, url: {})
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, **kwargs):
+        self.calls.append({"method": method, "url": url, "headers": headers,
+                           "params": params, "data": data, "json": json})
+        return FakeResponse(self.respond(method, url))
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def client(session):
+    return AutomationClient(lambda: "tok", session=session)
+
+
+def _sent_json(call):
+    return json.loads(call["data"]) if call["data"] is not None else call["json"]
+
+
+def test_create_workitems_batch_body(client, session):
+    specs = [
+        WorkItemSpec("me.Act+prod", {"in": WorkItemArgument(f"https://x/{i}")}, nickname="n")
+        for i in range(3)
+    ]
+    client.create_workitems_batch(specs + [{"activityId": "raw"}])
+
+    call, = session.calls
+    assert call["url"].endswith("/workitems/batch")
+    assert call["headers"]["Content-Type"] == "application/json"
+    assert _sent_json(call) == [s.to_dict() for s in specs] + [{"activityId": "raw"}]
+
+
+def test_start_workitem_sends_serialized_json(client, session):
+    spec = WorkItemSpec("me.Act+prod", {"out": WorkItemArgument("https://x/o", verb="put", unzip=True)})
+    client.start_workitem(spec)
+    client.combine_workitems({"ids": ["a", "b"]})
+
+    start, combine = session.calls
+    assert start["json"] is None and isinstance(start["data"], bytes)
+    assert _sent_json(start) == spec.to_dict()
+    assert _sent_json(combine) == {"ids": ["a", "b"]}
+
+
+def test_poll_workitems_until_terminal():
+    """Items are re-polled concurrently until every status is terminal."""
+    seen = {}
+
+    def respond(method, url):
+        wid = url.rsplit("/", 1)[-1]
+        seen[wid] = seen.get(wid, 0) + 1
+        done = seen[wid] >= (2 if wid == "b" else 1)
+        return {"id": wid, "status": ("failed" if wid == "c" else "success") if done else "inprogress"}
+
+    client = AutomationClient(lambda: "tok", session=FakeSession(respond))
+    result = asyncio.run(client.poll_workitems(["a", "b", "c"], interval=0))
+
+    assert list(result) == ["a", "b", "c"]
+    assert [r["status"] for r in result.values()] == ["success", "success", "failed"]
+    assert seen == {"a": 1, "b": 2, "c": 1}
+
+
+def test_spec_serialization_reflects_mutation():
+    spec = WorkItemSpec("me.Act+prod", {"in": WorkItemArgument("https://x/i")})
+    assert "nickname" not in spec.to_dict()
+
+    spec.nickname = "n"
+    assert spec.to_dict()["nickname"] == "n"
+    assert "nickname" in dataclasses.asdict(spec)
+    assert [f.name for f in dataclasses.fields(spec)][-1] == "on_progress"
+
+
+def test_endpoint_urls_are_resolved_once(client, session):
+    """Parameterized endpoints are sent as absolute URLs for the client's region."""
+    eu = AutomationClient(lambda: "tok", region="eu-west", session=session)
+    client.get_workitem("w1")
+    eu.get_appbundle_alias_detail("me.Bundle", "prod")
+
+    assert [c["url"] for c in session.calls] == [
+        "https://developer.api.autodesk.com/da/us-east/v3/workitems/w1",
+        "https://developer.api.autodesk.com/da/eu-west/v3/appbundles/me.Bundle/aliases/prod",
+    ]
+    assert AutomationClient._WORKITEM == "/workitems/%s"
+
+
+def test_set_alias_sends_version_body(client, session):
+    client.set_appbundle_alias("me.Bundle", "prod", version=3)
+    client.set_activity_alias("me.Act", "prod", version=3)
+
+    assert [c["method"] for c in session.calls] == ["PATCH", "PATCH"]
+    assert all(_sent_json(c) == {"version": 3} for c in session.calls)
+
+
+def test_wait_for_workitems_batches_status_requests():
+    """Each round is one /workitems/status POST carrying only unfinished ids."""
+    rounds = {"n": 0}
+
+    def respond(method, url):
+        rounds["n"] += 1
+        done_b = rounds["n"] >= 2
+        return [{"id": "a", "status": "success"},
+                {"id": "b", "status": "success" if done_b else "inprogress"}]
+
+    session = FakeSession(respond)
+    client = AutomationClient(lambda: "tok", session=session)
+    result = client.wait_for_workitems(["a", "b"], poll_interval=0)
+
+    assert [c["json"] for c in session.calls] == [["a", "b"], ["b"]]
+    assert all(c["url"].endswith("/workitems/status") for c in session.calls)
+    assert {k: v["status"] for k, v in result.items()} == {"a": "success", "b": "success"}
+
+
+def test_automation_error_formats_lazily_and_pickles():
+    import pickle
+
+    from pyaps.automation import AutomationError
+
+    err = AutomationError("Upload failed", 403, {"detail": "x"})
+    assert str(err) == "[403] Upload failed"
+    clone = pickle.loads(pickle.dumps(err))
+    assert (clone.status, clone.payload, str(clone)) == (403, {"detail": "x"}, "[403] Upload failed")
+
+
+def test_workitem_argument_rejects_unknown_verb():
+    with pytest.raises(ValueError):
+        WorkItemArgument("https://x/o", verb="GETT")
+    assert WorkItemArgument("https://x/o", verb="post").verb == "post"
@@ -0,0 +1,248 @@
+"""Tests for DataManagementClient request construction."""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from pyaps.datamanagement import DataManagementClient
+from pyaps.http import HTTPError
+
+
+class FakeResponse:
+    def __init__(self, payload=None, status_code=200, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+        self.text = self.content.decode()
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Records every request and answers from a respond(method, url) callback."""
+
+    def __init__(self, respond=None):
+        self.calls = []
+        self.proxies = {}
+        self.trust_env = True
+        self.respond = respond or (lambda method, url, params: {})
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, **kwargs):
+        with self._lock:
+            self.calls.append({"method": method, "url": url, "params": params, "json": json})
+        return FakeResponse(self.respond(method, url, params or {}))
+
+    def put(self, url, data=None, timeout=None, **kwargs):
+        body = data.read() if hasattr(data, "read") else bytes(data)
+        with self._lock:
+            self.calls.append({"method": "PUT", "url": url, "data": body})
+        expired = url.endswith("?expired")
+        return FakeResponse(status_code=403 if expired else 200, headers={} if expired else {"ETag": url[-3:]})
+
+
+def test_api_surfaces_share_one_pooled_session():
+    dm = DataManagementClient(lambda: "tok", proxies={"https": "http://proxy:8080"}, trust_env=False)
+
+    assert dm.http_project.session is dm.http_data.session is dm.http_oss.session is dm.session
+    assert dm.session.proxies == {"https": "http://proxy:8080"} and dm.session.trust_env is False
+    retry = dm.session.get_adapter("https://developer.api.autodesk.com").max_retries
+    assert retry.total == 5 and retry.respect_retry_after_header
+    assert "PATCH" not in retry.allowed_methods and "POST" not in retry.allowed_methods
+
+
+def test_shared_session_retries_signed_put_with_full_body(tmp_path):
+    """An adapter-level 5xx retry must rewind the streamed upload body."""
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_PUT(self):
+            received.append(self.rfile.read(int(self.headers["Content-Length"])))
+            self.send_response(500 if len(received) == 1 else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    payload = bytes(range(256)) * 400
+    (tmp_path / "in.bin").write_bytes(payload)
+    try:
+        dm = DataManagementClient(lambda: "tok", timeout=5)
+        dm.http_oss.upload_chunk_size = 4096   # wrap the file in _BlockReader
+        dm.http_oss.put_signed_url(f"http://127.0.0.1:{server.server_address[1]}/put", tmp_path / "in.bin")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert received == [payload, payload]
+
+
+def test_async_top_folders_fan_out():
+    def respond(method, url, params):
+        if "/topFolders" not in url:
+            page = {"data": [{"id": "p1"}]}
+            if "page=2" not in url:
+                page["links"] = {"next": {"href": url + "?page=2"}}
+            return page
+        return {"data": [{"id": url.split("/")[-2] + "-root"}]}
+
+    session = FakeSession(respond)
+    dm = DataManagementClient(lambda: "tok", session=session)
+
+    async def run():
+        projects = await dm.hubs.alist_projects("h1")
+        return projects, await dm.projects.atop_folders_many("h1", ["p1", "p2", "p1"])
+
+    projects, folders = asyncio.run(run())
+    assert projects == [{"id": "p1"}, {"id": "p1"}]
+    assert list(folders) == ["p1", "p2"]
+    assert folders["p2"] == {"data": [{"id": "p2-root"}]}
+
+
+def test_upload_signed_s3_puts_parts_concurrently(tmp_path):
+    import mmap
+
+    part = mmap.ALLOCATIONGRANULARITY
+    body = bytes(range(256)) * (part * 3 // 256) + b"tail"
+    (tmp_path / "big.bin").write_bytes(body)
+
+    def respond(method, url, params):
+        if method == "GET":   # signeds3upload: part 2 starts out expired, re-signing returns a fresh URL
+            if params.get("uploadKey"):
+                assert (params["firstPart"], params["parts"]) == (2, 1)
+                return {"uploadKey": "uk", "urls": ["https://s3/p02"]}
+            return {"uploadKey": "uk", "urls": ["https://s3/p01", "https://s3/p02?expired",
+                                                "https://s3/p03", "https://s3/p04"]}
+        return {"objectKey": "big.bin"}
+
+    session = FakeSession(respond)
+    dm = DataManagementClient(lambda: "tok", session=session)
+    assert dm.objects.upload_signed_s3("bkt", "big.bin", tmp_path / "big.bin", part_size=part, concurrency=4) \
+        == {"objectKey": "big.bin"}
+
+    puts = {c["url"]: c["data"] for c in session.calls if c["method"] == "PUT"}
+    assert b"".join(puts[f"https://s3/p0{i}"] for i in range(1, 5)) == body
+    complete = session.calls[-1]
+    assert complete["method"] == "POST"
+    assert complete["json"] == {"uploadKey": "uk", "size": len(body), "eTags": ["p01", "p02", "p03", "p04"]}
+
+
+def test_upload_signed_s3_fails_on_missing_part_etag(tmp_path):
+    (tmp_path / "two.bin").write_bytes(b"ab")
+
+    def respond(method, url, params):
+        return {"uploadKey": "uk", "urls": ["https://s3/p01", "https://s3/noetag"]}
+
+    session = FakeSession(respond)
+    put = session.put
+    session.put = lambda url, **kw: FakeResponse() if url.endswith("noetag") else put(url, **kw)
+    dm = DataManagementClient(lambda: "tok", session=session)
+
+    with pytest.raises(HTTPError, match="part 2 of 2"):
+        dm.objects.upload_signed_s3("bkt", "two.bin", tmp_path / "two.bin", part_size=1, concurrency=1)
+    assert not any(c["method"] == "POST" for c in session.calls)
+
+
+
+def test_list_methods_use_large_pages_and_follow_cursors():
+    """List calls default to page_size and follow OSS next cursors verbatim."""
+    def respond(method, url, params):
+        if "startAt" in url:
+            return {"items": [{"objectKey": "b"}]}
+        if url.endswith("/objects"):
+            return {"items": [{"objectKey": "a"}], "next": url + "?startAt=b"}
+        return {"data": [{"id": "f"}]}
+
+    session = FakeSession(respond)
+    dm = DataManagementClient(lambda: "tok", session=session, page_size=150)
+    assert [o["objectKey"] for o in dm.buckets.list_objects("bkt")] == ["a", "b"]
+    list(dm.folders.contents("p", "f"))
+
+    first, cursor, contents = session.calls
+    assert first["params"] == {"limit": 100}
+    assert cursor["url"].endswith("?startAt=b")
+    assert contents["params"] == {"page[limit]": 150}
+
+
+def test_contents_with_included_indexes_side_loads():
+    def respond(method, url, params):
+        if "page=2" in url:
+            return {"data": [{"id": "i2"}], "included": [{"type": "versions", "id": "v2"}]}
+        return {"data": [{"id": "i1"}], "included": [{"type": "versions", "id": "v1"}],
+                "links": {"next": {"href": "https://x/contents?page=2"}}}
+
+    session = FakeSession(respond)
+    dm = DataManagementClient(lambda: "tok", session=session)
+    data, included = dm.folders.contents_with_included("p", "f", include="tip")
+
+    assert [d["id"] for d in data] == ["i1", "i2"]
+    assert set(included) == {("versions", "v1"), ("versions", "v2")}
+    assert session.calls[0]["params"]["include"] == "tip"
+
+
+def test_facade_paths_are_resolved_once():
+    session = FakeSession()
+    dm = DataManagementClient(lambda: "tok", session=session)
+    dm.items.get("p", "i")
+    dm.projects.top_folders("h", "p")
+
+    assert [c["url"] for c in session.calls] == [
+        "https://developer.api.autodesk.com/data/v1/projects/p/items/i",
+        "https://developer.api.autodesk.com/project/v1/hubs/h/projects/p/topFolders",
+    ]
+
+
+def test_object_head_returns_headers_or_none():
+    class HeadSession(FakeSession):
+        def request(self, method, url, **kwargs):
+            self.calls.append({"method": method, "url": url})
+            missing = "/missing/" in url
+            return FakeResponse(status_code=404 if missing else 200, headers={} if missing else {"Content-Length": "3"})
+
+    session = HeadSession()
+    dm = DataManagementClient(lambda: "tok", session=session)
+
+    assert dm.objects.head("bkt", "a.txt") == {"Content-Length": "3"}
+    assert dm.objects.head("bkt", "missing/b.txt") is None
+    assert [c["method"] for c in session.calls] == ["HEAD", "HEAD"]
+
+
+def test_jsonapi_bodies_are_serialized_once():
+    session = FakeSession()
+    session.request = lambda method, url, **kw: session.calls.append(kw) or FakeResponse({"data": {"id": "v"}})
+    dm = DataManagementClient(lambda: "tok", session=session)
+
+    assert dm.versions.create("p", "item", "a.rvt", "urn:s") == {"id": "v"}
+    call, = session.calls
+    assert call["headers"]["Content-Type"] == "application/vnd.api+json"
+    assert json.loads(call["data"]) == {"data": {
+        "type": "versions",
+        "attributes": {"name": "a.rvt", "storageUrn": "urn:s"},
+        "relationships": {"item": {"data": {"type": "items", "id": "item"}}},
+    }}
+
+
+def test_list_versions_bulk_keys_results_by_item():
+    session = FakeSession(lambda method, url, params: {"data": [{"id": url.split("/")[-2] + "-v1"}]})
+    dm = DataManagementClient(lambda: "tok", session=session)
+
+    result = dm.items.list_versions_bulk("p", ["a", "b", "a", "c"], concurrency=4)
+
+    assert result == {"a": [{"id": "a-v1"}], "b": [{"id": "b-v1"}], "c": [{"id": "c-v1"}]}
+    assert len(session.calls) == 3
+
+
+def test_token_caching_is_opt_in():
+    from pyaps.http import CachingTokenProvider
+
+    provider = lambda: "tok"
+    assert DataManagementClient(provider).token_provider is provider
+    assert isinstance(DataManagementClient(provider, cache_token=True).token_provider, CachingTokenProvider)
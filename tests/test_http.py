@@ -0,0 +1,430 @@
+"""Tests for HTTPClient upload helpers."""
+import email.parser
+import json
+
+import pytest
+
+from pyaps.http.client import HTTPClient
+
+
+class FakeResponse:
+    status_code = 204
+    text = ""
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+        self.proxies = {}
+        self.trust_env = True
+
+    def post(self, url, data=None, files=None, headers=None, **kwargs):
+        body = data.read() if hasattr(data, "read") else data
+        self.calls.append({"url": url, "data": body, "files": files, "headers": headers,
+                           "length": len(data) if hasattr(data, "__len__") else None})
+        return FakeResponse()
+
+    def put(self, url, data=None, headers=None, **kwargs):
+        self.calls.append({"url": url, "data": data.read(), "headers": headers, "closed_after": data})
+        return FakeResponse()
+
+
+def test_post_presigned_form_streams_large_files(tmp_path):
+    payload = bytes(range(256)) * 1000
+    path = tmp_path / "bundle.zip"
+    path.write_bytes(payload)
+    session = FakeSession()
+    http = HTTPClient(lambda: "tok", session=session)
+
+    http.post_presigned_form("https://s3/upload", {"key": "k", "policy": "p"}, str(path), stream_threshold=0)
+
+    call, = session.calls
+    assert call["files"] is None
+    assert call["length"] == len(call["data"])
+    raw = b"Content-Type: " + call["headers"]["Content-Type"].encode() + b"\r\n\r\n" + call["data"]
+    parts = {p.get_param("name", header="content-disposition"): p
+             for p in email.parser.BytesParser().parsebytes(raw).get_payload()}
+    assert parts["key"].get_payload() == "k"
+    assert parts["policy"].get_payload() == "p"
+    assert parts["file"].get_filename() == "bundle.zip"
+    assert parts["file"].get_payload(decode=True) == payload
+
+
+def test_put_signed_url_streams_path_with_content_length(tmp_path):
+    path = tmp_path / "model.rvt"
+    path.write_bytes(b"x" * 1000)
+    session = FakeSession()
+    http = HTTPClient(lambda: "tok", session=session)
+
+    http.put_signed_url("https://s3/put", path)
+    with open(path, "rb") as f:
+        f.seek(100)
+        http.put_signed_url("https://s3/put", f)
+
+    first, second = session.calls
+    assert first["data"] == b"x" * 1000 and first["headers"] == {"Content-Length": "1000"}
+    assert first["closed_after"].closed
+    assert second["headers"] == {"Content-Length": "900"}
+
+
+def test_caching_token_provider_caches_only_expiring_tokens(monkeypatch):
+    import time
+
+    from pyaps.auth import OAuth2Token
+    from pyaps.http import CachingTokenProvider
+
+    calls = []
+    plain = CachingTokenProvider(lambda: calls.append(1) or f"tok-{len(calls)}")
+    assert [plain(), plain()] == ["tok-1", "tok-2"]   # context-dependent strings are never reused
+
+    token = OAuth2Token("acc", "Bearer", "2099-01-01T00:00:00Z")
+    wrapped = CachingTokenProvider(lambda: calls.append(1) or token)
+    assert wrapped() == wrapped() == "acc" and len(calls) == 3
+    wrapped.invalidate()
+    assert wrapped() == "acc" and len(calls) == 4
+
+
+def test_request_invalidates_cached_token_and_retries_once_on_401():
+    from pyaps.auth import OAuth2Token
+    from pyaps.http import CachingTokenProvider
+
+    class Resp:
+        def __init__(self, status):
+            self.status_code, self.content, self.headers = status, b"{}", {}
+
+        def close(self):
+            pass
+
+    tokens = iter([OAuth2Token("old", "Bearer", "2099-01-01T00:00:00Z"),
+                   OAuth2Token("new", "Bearer", "2099-01-01T00:00:00Z")])
+    sent = []
+    session = FakeSession()
+    session.request = lambda method, url, headers=None, **kw: (
+        sent.append(headers["Authorization"]) or Resp(401 if headers["Authorization"] == "Bearer old" else 200))
+    http = HTTPClient(CachingTokenProvider(lambda: next(tokens)), session=session)
+
+    assert http.get("https://x/a") == {}
+    assert sent == ["Bearer old", "Bearer new"]
+
+
+def test_request_json_parses_raw_bytes_and_falls_back():
+    class JSONResponse:
+        status_code = 200
+
+        def __init__(self, content):
+            self.content = content
+
+        def json(self):
+            return {"fallback": True}
+
+    responses = iter([JSONResponse(b'{"data": [1, 2]}'), JSONResponse(b"\xff not json"), JSONResponse(b"")])
+    session = FakeSession()
+    session.request = lambda *a, **kw: next(responses)
+    http = HTTPClient(lambda: "tok", session=session)
+
+    assert http.get("https://x/a") == {"data": [1, 2]}
+    assert http.get("https://x/b") == {"fallback": True}
+    assert http.get("https://x/c") is None
+
+
+def test_auth_headers_are_reused_until_token_changes():
+    tokens = iter(["a", "a", "b"])
+    http = HTTPClient(lambda: next(tokens), session=FakeSession())
+
+    first = http._auth_headers()
+    assert http._auth_headers() is first
+    refreshed = http._auth_headers()
+    assert refreshed is not first and refreshed["Authorization"] == "Bearer b"
+
+
+def test_request_retries_with_jittered_backoff_and_retry_after(monkeypatch):
+    import pyaps.http.client as http_mod
+
+    class RetryResponse:
+        def __init__(self, status, headers=None):
+            self.status_code = status
+            self.headers = headers or {}
+
+        def close(self):
+            pass
+
+    responses = iter([RetryResponse(503), RetryResponse(429, {"Retry-After": "7"}), RetryResponse(200)])
+    sleeps = []
+    monkeypatch.setattr(http_mod.time, "sleep", sleeps.append)
+    monkeypatch.setattr(http_mod.random, "random", lambda: 0.5)
+    session = FakeSession()
+    session.request = lambda *a, **kw: next(responses)
+    http = HTTPClient(lambda: "tok", session=session)
+
+    assert http.request("GET", "https://x/a", retries=3, retry_wait=1.0).status_code == 200
+    assert sleeps == [0.5, 7.0]
+
+    responses = iter([RetryResponse(429, {"Retry-After": "3600"}), RetryResponse(200)])
+    assert http.request("GET", "https://x/a", retries=1, retry_cap=15.0).status_code == 200
+    assert sleeps[-1] == 15.0
+
+
+def test_adapter_retry_caps_retry_after_and_replaces_request_retries():
+    from pyaps.http.client import _CappedRetry, _pooled_session
+
+    class Limited:
+        status_code = 429
+        headers = {"Retry-After": "3600"}
+
+        def close(self):
+            pass
+
+    retry = _CappedRetry(total=5, status_forcelist=(429,))
+    assert retry.get_retry_after(Limited()) == 15.0
+
+    session = _pooled_session(retry=retry)
+    calls = []
+    session.request = lambda *a, **kw: calls.append(a) or Limited()
+    http = HTTPClient(lambda: "tok", session=session)
+    assert http.request("GET", "https://x/a", retries=3).status_code == 429
+    assert len(calls) == 1   # the adapter's policy is the only retry layer
+
+
+def test_put_signed_url_reads_files_in_upload_chunks(tmp_path):
+    path = tmp_path / "big.ifc"
+    path.write_bytes(b"y" * 100)
+    reads = []
+
+    class ChunkSession(FakeSession):
+        def put(self, url, data=None, headers=None, **kwargs):
+            while block := data.read(8):  # http.client asks for small blocks
+                reads.append(len(block))
+            return FakeResponse()
+
+    HTTPClient(lambda: "tok", session=ChunkSession(), upload_chunk_size=64).put_signed_url("https://s3/put", path)
+    assert reads == [64, 36]
+
+
+def test_put_signed_url_keeps_caller_block_reader(tmp_path):
+    from pyaps.http.client import _BlockReader
+
+    path = tmp_path / "big.ifc"
+    path.write_bytes(b"y" * 100)
+    sent = []
+
+    class RecordingSession(FakeSession):
+        def put(self, url, data=None, headers=None, **kwargs):
+            sent.append((data, headers))
+            return FakeResponse()
+
+    with open(path, "rb") as f:
+        body = _BlockReader(f, 100, 32)
+        HTTPClient(lambda: "tok", session=RecordingSession(), upload_chunk_size=64).put_signed_url("https://s3/put", body)
+    assert sent == [(body, {"Content-Length": "100"})]
+
+
+def test_block_reader_rewinds_relative_to_wrap_position():
+    import io
+
+    from requests.utils import super_len
+
+    from pyaps.http.client import _BlockReader
+
+    fp = io.BytesIO(b"hdr" + b"x" * 10)
+    fp.seek(3)
+    body = _BlockReader(fp, 10, 4)
+    assert super_len(body) == 10
+    assert body.read(1) == b"xxxx" and body.tell() == 4
+    assert body.seek(0) == 0 and body.read() == b"x" * 10
+
+    class Pipe(io.RawIOBase):
+        def tell(self):
+            raise OSError("not seekable")
+
+    with pytest.raises(io.UnsupportedOperation):
+        _BlockReader(Pipe(), 10, 4).seek(0)
+
+
+def test_put_signed_parts_retries_and_returns_etags(tmp_path, monkeypatch):
+    import threading
+
+    import pyaps.http.client as http_mod
+
+    path = tmp_path / "parts.bin"
+    path.write_bytes(b"".join(bytes([i]) * 10 for i in range(3)))
+    monkeypatch.setattr(http_mod.time, "sleep", lambda s: None)
+    lock = threading.Lock()
+    sent, failed_once = {}, set()
+
+    class PartResponse:
+        def __init__(self, status, etag=None):
+            self.status_code, self.text = status, ""
+            self.headers = {"ETag": etag} if etag else {}
+
+    class PartSession(FakeSession):
+        def put(self, url, data=None, **kwargs):
+            with lock:
+                if url == "u1" and url not in failed_once:
+                    failed_once.add(url)
+                    return PartResponse(503)
+                sent[url] = bytes(data)
+            return PartResponse(200, "e-" + url)
+
+    http = HTTPClient(lambda: "tok", session=PartSession())
+    etags = http.put_signed_parts(["u0", "u1", "u2"], path, 10, parallel=4, max_in_flight_bytes=20)
+
+    assert etags == ["e-u0", "e-u1", "e-u2"]
+    assert sent == {"u0": b"\x00" * 10, "u1": b"\x01" * 10, "u2": b"\x02" * 10}
+
+
+def test_post_presigned_form_missing_file_raises_http_error(tmp_path):
+    import pytest
+
+    from pyaps.http.client import HTTPError
+
+    session = FakeSession()
+    with pytest.raises(HTTPError) as exc:
+        HTTPClient(lambda: "tok", session=session).post_presigned_form("https://s3/upload", {}, tmp_path / "nope.zip")
+    assert exc.value.status == 400 and not session.calls
+
+
+def test_download_helpers_stream_without_resp_content(tmp_path):
+    import io
+
+    import requests
+    from urllib3 import HTTPResponse
+
+    payload = bytes(range(256)) * 40
+
+    def make_response(*a, **kw):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers["Content-Length"] = str(len(payload))
+        resp.raw = HTTPResponse(body=io.BytesIO(payload), preload_content=False)
+        return resp
+
+    session = FakeSession()
+    session.request = make_response
+    http = HTTPClient(lambda: "tok", session=session)
+
+    buf = bytearray(b"head")
+    assert http.request_bytes_into(buf, "GET", "https://x/blob", chunk=1000) == len(payload)
+    assert bytes(buf) == b"head" + payload
+
+    target = tmp_path / "blob.bin"
+    assert http.download_to_file(target, "GET", "https://x/blob", chunk=1000) == len(payload)
+    assert target.read_bytes() == payload
+
+
+def test_paginate_prefetches_next_page_while_yielding():
+    import threading
+    import time
+
+    fetched = []
+    released = threading.Event()
+
+    def get_page(url):
+        fetched.append(url)
+        released.wait(2)
+        return {"data": [url], "links": {}}
+
+    http = HTTPClient(lambda: "tok", session=FakeSession())
+    http._get_page = get_page
+    items = http.paginate({"data": ["a"], "links": {"next": {"href": "p2"}}}, prefetch=True)
+
+    assert next(items) == "a"
+    deadline = time.time() + 2
+    while not fetched and time.time() < deadline:
+        time.sleep(0.01)
+    assert fetched == ["p2"]   # requested before the consumer asked for the next item
+    released.set()
+    assert list(items) == ["p2"]
+
+    pool = http._bg_pool
+    with http:
+        pass
+    assert http._bg_pool is None and pool._shutdown
+
+
+def test_default_session_uses_tuned_pool():
+    http = HTTPClient(lambda: "tok")
+    adapter = http.session.get_adapter("https://developer.api.autodesk.com")
+
+    assert adapter._pool_maxsize == 32 and adapter._pool_block is False
+    assert adapter.max_retries.total == 0
+    assert http.session.get_adapter("http://localhost") is adapter
+
+
+def test_make_url_detects_scheme_not_http_prefix():
+    http = HTTPClient(lambda: "tok", base_url="https://api/v1/", session=FakeSession())
+
+    assert http._make_url("/hubs") == "https://api/v1/hubs"
+    assert http._make_url("httpbin/items") == "https://api/v1httpbin/items"
+    assert http._make_url("https://other/x") == "https://other/x"
+    assert HTTPClient(lambda: "tok", session=FakeSession())._make_url("/x") == "/x"
+
+
+def test_warmup_primes_connection_in_background():
+    import threading
+
+    done = threading.Event()
+
+    class WarmSession(FakeSession):
+        def head(self, url, **kwargs):
+            self.calls.append(url)
+            done.set()
+            raise OSError("unreachable")  # warmup failures are swallowed
+
+    session = WarmSession()
+    HTTPClient(lambda: "tok", base_url="https://api/v1", session=session, warmup=True)
+    assert done.wait(2) and session.calls == ["https://api/v1"]
+
+
+def test_paginate_fetches_next_pages_directly_on_the_session():
+    class PageResponse:
+        status_code = 200
+
+        def __init__(self, payload):
+            self.content = json.dumps(payload).encode()
+
+    pages = {"https://api/p2": {"data": [2], "links": {"next": {"href": "https://api/p3"}}},
+             "https://api/p3": {"data": [3]}}
+    session = FakeSession()
+    session.request = lambda method, url, headers=None, **kw: session.calls.append((url, headers)) or PageResponse(pages[url])
+    http = HTTPClient(lambda: "tok", base_url="https://api", session=session)
+
+    assert list(http.paginate({"data": [1], "links": {"next": {"href": "https://api/p2"}}})) == [1, 2, 3]
+    assert [url for url, _ in session.calls] == ["https://api/p2", "https://api/p3"]
+    assert session.calls[0][1]["Authorization"] == "Bearer tok"
+
+
+def test_to_stream_accepts_buffers_and_rejects_missing_paths(tmp_path):
+    import pytest
+
+    from pyaps.http.client import _to_stream
+
+    assert _to_stream(memoryview(b"abc")).read() == b"abc"
+    with pytest.raises(TypeError):
+        _to_stream(str(tmp_path / "missing.bin"))
+
+
+def test_request_does_not_retry_non_idempotent_methods_by_default(monkeypatch):
+    import email.utils
+    import time
+
+    import pyaps.http.client as http_mod
+
+    class Busy:
+        status_code, headers = 503, {}
+
+        def close(self):
+            pass
+
+    session = FakeSession()
+    session.request = lambda *a, **kw: session.calls.append(kw["method"]) or Busy()
+    monkeypatch.setattr(http_mod.time, "sleep", lambda s: None)
+    http = HTTPClient(lambda: "tok", session=session)
+
+    http.request("post", "https://x/workitems", retries=3)
+    http.request("POST", "https://x/workitems", retries=1, idempotent_only=False)
+    http.request("GET", "https://x/workitems/w", retries=1)
+    assert session.calls == ["POST", "POST", "POST", "GET", "GET"]
+
+    later = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 25 < http_mod._retry_after_seconds(later) <= 30
+    assert http_mod._retry_after_seconds("soon") == 0.0
@@ -0,0 +1,76 @@
+"""Tests for OAuth2Token and the in-memory token store."""
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+from pyaps.auth import InMemoryTokenStore, OAuth2Token
+
+
+def _iso(dt):
+    return dt.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def test_is_expired_respects_skew():
+    now = datetime.now(timezone.utc)
+    token = OAuth2Token("a", "Bearer", _iso(now + timedelta(seconds=120)))
+    assert not token.is_expired()
+    assert token.is_expired(skew_seconds=300)
+
+
+def test_is_expired_for_past_or_invalid_expiry():
+    past = OAuth2Token("a", "Bearer", _iso(datetime.now(timezone.utc) - timedelta(seconds=1)))
+    assert past.is_expired()
+    assert OAuth2Token("a", "Bearer", "not-a-date").is_expired()
+
+
+def test_from_token_response_sets_expiry():
+    now = datetime(2025, 9, 23, 1, 0, 0, tzinfo=timezone.utc)
+    token = OAuth2Token.from_token_response(
+        {"access_token": "a", "expires_in": 3599, "scope": "data:read"}, now=now
+    )
+    assert token.expires_at == "2025-09-23T01:59:59Z"
+    assert token.token_type == "Bearer"
+    assert token.scope == "data:read"
+
+
+def test_from_token_response_expiry_matches_parsed_token():
+    """The pre-computed expiry equals the one parsed back from expires_at."""
+    token = OAuth2Token.from_token_response({"access_token": "a", "expires_in": 120})
+    parsed = OAuth2Token(token.access_token, token.token_type, token.expires_at)
+    assert abs(token._mono_expiry - parsed._mono_expiry) < 0.01
+    assert not token.is_expired()
+    assert token.is_expired(skew_seconds=300)
+
+
+def test_asdict_contains_only_public_fields():
+    token = OAuth2Token("a", "Bearer", "2099-01-01T00:00:00Z", refresh_token="r")
+    assert asdict(token) == {
+        "access_token": "a",
+        "token_type": "Bearer",
+        "expires_at": "2099-01-01T00:00:00Z",
+        "refresh_token": "r",
+        "scope": None,
+    }
+
+
+def test_in_memory_store_roundtrip():
+    store = InMemoryTokenStore()
+    token = OAuth2Token("a", "Bearer", "2099-01-01T00:00:00Z")
+    store.write("k", token)
+    assert store.read("k") == token
+    store.delete("k")
+    assert store.read("k") is None
+
+
+def test_file_token_store_persists_across_instances(tmp_path):
+    from pyaps.auth import FileTokenStore
+
+    path = tmp_path / "nested" / "tokens.json"
+    token = OAuth2Token.from_token_response({"access_token": "a", "expires_in": 3600, "scope": "data:read"})
+    FileTokenStore(path).write("k", token)
+
+    reader = FileTokenStore(path)
+    assert reader.read("k") == token and not reader.read("k").is_expired()
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    FileTokenStore(path).delete("k")
+    assert reader.read("k") is None
@@ -0,0 +1,674 @@
+"""Tests for AutomationWorkflow orchestration."""
+import threading
+
+import pytest
+
+from pyaps.automation import AutomationWorkflow
+
+
+class FakeObjects:
+    def __init__(self):
+        self.uploads = []
+        self.signed_calls = []
+
+    def post_signed(self, bucket_key, object_key, access="readwrite"):
+        self.signed_calls.append((bucket_key, object_key))
+        return {"signedUrl": f"https://oss/{bucket_key}/{object_key}?put"}
+
+    def post_signed_pair(self, bucket_key, object_key, minutes_valid=60):
+        self.signed_calls.append((bucket_key, object_key))
+        url = f"https://oss/{bucket_key}/{object_key}?rw"
+        return {"signedUrl": url, "upload_url": url, "download_url": url}
+
+    def get_signed_download(self, bucket_key, object_key, minutes_valid=None):
+        return {"url": f"https://oss/{bucket_key}/{object_key}?get"}
+
+    def get_details(self, bucket_key, object_key):
+        from pyaps.http.client import HTTPError
+
+        details = getattr(self, "details", {}).get(object_key)
+        if details is None:
+            raise HTTPError(404, "GET", object_key)
+        return details
+
+    def upload_via_signed(self, signed, payload, timeout=None):
+        self.uploads.append((signed["signedUrl"], payload.read() if hasattr(payload, "read") else payload,
+                             hasattr(payload, "read")))
+
+
+class FakeBuckets:
+    def __init__(self):
+        self.gets = []
+
+    def get(self, bucket_key):
+        self.gets.append(bucket_key)
+        return {"bucketKey": bucket_key}
+
+    def create(self, bucket_key, region=None, policy_key=None):
+        return {"bucketKey": bucket_key}
+
+
+class FakeDownloadResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+class FakeOSSSession:
+    def __init__(self):
+        self.gets = []
+
+    def get(self, url, stream=False, timeout=None):
+        self.gets.append((url, stream))
+        return FakeDownloadResponse(url.encode())
+
+
+class FakeDM:
+    def __init__(self):
+        self.objects = FakeObjects()
+        self.buckets = FakeBuckets()
+        self.http_oss = type("HTTP", (), {})()
+        self.http_oss.session = FakeOSSSession()
+
+
+@pytest.fixture
+def dm():
+    return FakeDM()
+
+
+@pytest.fixture
+def workflow(dm):
+    return AutomationWorkflow(automation_client=None, data_client=dm, default_bucket="bkt")
+
+
+def test_upload_input_file_streams_file_handle(workflow, dm, tmp_path):
+    path = tmp_path / "in.rvt"
+    path.write_bytes(b"model-bytes")
+
+    url = workflow.upload_input_file(path)
+
+    assert url == "https://oss/bkt/in.rvt?get"
+    assert dm.objects.uploads == [("https://oss/bkt/in.rvt?put", b"model-bytes", True)]
+
+
+class FakeAuto:
+    """Starts work items and reports them as finished on the first poll."""
+
+    def __init__(self, status="success"):
+        self.started = []
+        self.polls = []
+        self.status = status
+
+    def start_workitem(self, spec):
+        self.started.append(spec)
+        return {"id": f"wi-{len(self.started)}"}
+
+    def get_workitem(self, workitem_id):
+        self.polls.append(workitem_id)
+        return {"id": workitem_id, "status": self.status}
+
+    def create_workitems_batch(self, workitems):
+        return [self.start_workitem(w) for w in workitems]
+
+    def wait_for_workitems(self, ids, poll_interval=None, timeout=None):
+        self.polls.append(list(ids))
+        return {i: {"id": i, "status": self.status} for i in ids}
+
+
+def test_run_workitem_uploads_inputs_concurrently(dm, tmp_path):
+    """Both uploads must be in flight at once to pass the barrier."""
+    barrier = threading.Barrier(2, timeout=5)
+    upload = dm.objects.upload_via_signed
+
+    def blocking_upload(signed, payload, timeout=None):
+        barrier.wait()
+        upload(signed, payload, timeout=timeout)
+
+    dm.objects.upload_via_signed = blocking_upload
+    for name in ("a.rvt", "b.rvt"):
+        (tmp_path / name).write_bytes(name.encode())
+    auto = FakeAuto()
+    wf = AutomationWorkflow(auto, dm, default_bucket="bkt", poll_interval=0.01)
+
+    result = wf.run_workitem_with_files(
+        "me.Act+prod",
+        input_files={"first": tmp_path / "a.rvt", "second": tmp_path / "b.rvt"},
+        output_files={"out": "out.rvt"},
+        download_outputs=False,
+    )
+
+    assert result.status == "success"
+    args = auto.started[0].arguments
+    assert list(args) == ["first", "second", "out"]
+    assert [a.url for a in args.values()] == [
+        "https://oss/bkt/a.rvt?get", "https://oss/bkt/b.rvt?get", "https://oss/bkt/out.rvt?put",
+    ]
+    assert [a.verb for a in args.values()] == ["get", "get", "put"]
+
+
+def test_webhook_registry_completes_without_polling(dm):
+    """A registered work item resolves from the webhook payload, even if it arrives first."""
+    import json
+    import urllib.error
+    import urllib.request
+
+    from pyaps.automation import WebhookCompletionRegistry
+
+    registry = WebhookCompletionRegistry()
+    server = registry.serve(port=0)
+    try:
+        auto = FakeAuto(status="inprogress")
+        wf = AutomationWorkflow(auto, dm, completion_registry=registry, webhook_fallback_interval=5)
+        wid = wf.start_workitem("me.Act+prod", {}, on_complete="https://hooks.example/done")
+
+        body = json.dumps({"id": wid, "status": "success", "reportUrl": "https://r"}).encode()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with pytest.raises(urllib.error.HTTPError) as forged:   # only the secret path is accepted
+            urllib.request.urlopen(urllib.request.Request(base + "/", data=body, method="POST"))
+        assert forged.value.code == 404
+        with urllib.request.urlopen(urllib.request.Request(base + registry.path, data=body, method="POST")) as resp:
+            assert resp.status == 200
+
+        result = wf.wait_for_completion(wid, timeout=5)
+    finally:
+        registry.close()
+
+    assert (result.status, result.report_url) == ("success", "https://r")
+    assert auto.polls == []
+    assert not registry.is_registered(wid)
+
+
+def test_webhook_registry_bounds_callbacks_for_unknown_ids():
+    from pyaps.automation import WebhookCompletionRegistry
+
+    registry = WebhookCompletionRegistry(max_pending=2)
+    for i in range(5):
+        assert registry.resolve({"id": f"x{i}", "status": "success"}) is False
+    registry.resolve({"id": "x9", "status": "inprogress"})
+    assert list(registry._pending) == ["x3", "x4"]
+    assert registry._events == {} and registry._payloads == {}
+
+    registry.register("x4")   # a callback that beat registration still completes the item
+    assert registry.wait("x4", timeout=0) == {"id": "x4", "status": "success"}
+
+
+def test_run_batch_waits_with_one_status_query(dm):
+    auto = FakeAuto()
+    wf = AutomationWorkflow(auto, dm)
+    results = wf.run_batch_workitems([{"activityId": "a"}, {"activityId": "b"}])
+
+    assert [r.workitem_id for r in results] == ["wi-1", "wi-2"]
+    assert all(r.status == "success" for r in results)
+    assert auto.polls == [["wi-1", "wi-2"]]
+
+
+def test_wait_for_completion_backs_off_exponentially(dm, monkeypatch):
+    """Poll gaps grow by 1.5x up to poll_interval and reset when the item starts running."""
+    import pyaps.automation.workflow as workflow_mod
+
+    sleeps = []
+    monkeypatch.setattr(workflow_mod.time, "sleep", sleeps.append)
+    statuses = iter(["pending", "pending", "pending", "inprogress", "inprogress", "success"])
+
+    class Auto(FakeAuto):
+        def get_workitem(self, workitem_id):
+            return {"id": workitem_id, "status": next(statuses)}
+
+    wf = AutomationWorkflow(Auto(), dm, poll_interval=2.0, min_poll_interval=1.0)
+    result = wf.wait_for_completion("wi-1")
+
+    assert result.status == "success"
+    assert sleeps == [1.0, 1.5, 2.0, 1.0, 1.5]
+
+
+def test_poll_interval_resets_on_progress_change(dm, monkeypatch):
+    import pyaps.automation.workflow as workflow_mod
+
+    sleeps = []
+    monkeypatch.setattr(workflow_mod.time, "sleep", sleeps.append)
+    updates = iter([("inprogress", "a"), ("inprogress", "a"), ("inprogress", "b"), ("success", "b")])
+
+    class Auto(FakeAuto):
+        def get_workitem(self, workitem_id):
+            status, progress = next(updates)
+            return {"id": workitem_id, "status": status, "progress": progress}
+
+    wf = AutomationWorkflow(Auto(), dm, poll_interval=10.0)
+    wf.wait_for_completion("wi-1", min_interval=0.5, backoff=2.0)
+
+    assert sleeps == [0.5, 1.0, 0.5]
+
+
+def test_outputs_are_streamed_to_disk(dm, tmp_path):
+    wf = AutomationWorkflow(FakeAuto(), dm, default_bucket="bkt", poll_interval=0.01,
+                            download_session=dm.http_oss.session)
+    wf.run_workitem_with_files(
+        "me.Act+prod",
+        output_files={"a": "a.rvt", "b": "sub/b.rvt"},
+        output_dir=tmp_path,
+    )
+
+    assert sorted(dm.http_oss.session.gets) == [
+        ("https://oss/bkt/a.rvt?get", True), ("https://oss/bkt/sub/b.rvt?get", True),
+    ]
+    assert (tmp_path / "a.rvt").read_bytes() == b"https://oss/bkt/a.rvt?get"
+    assert (tmp_path / "sub" / "b.rvt").read_bytes() == b"https://oss/bkt/sub/b.rvt?get"
+
+
+def test_default_download_session_is_pooled_and_proxied(dm):
+    dm.http_oss.session.proxies = {"https": "http://proxy:8080"}
+    wf = AutomationWorkflow(None, dm)
+
+    adapter = wf.download_session.get_adapter("https://bucket.s3.amazonaws.com/x")
+    assert adapter._pool_maxsize == 64 and adapter.max_retries.total == 3
+    assert wf.download_session.proxies == {"https": "http://proxy:8080"}
+
+
+def test_ensure_bucket_is_checked_once(workflow, dm):
+    assert workflow.ensure_bucket("bkt") == {"bucketKey": "bkt"}
+    assert workflow.ensure_bucket("bkt") == {"bucketKey": "bkt"}
+    assert dm.buckets.gets == ["bkt"]
+
+    workflow.bucket_cache_ttl = 0
+    workflow.ensure_bucket("bkt")
+    assert dm.buckets.gets == ["bkt", "bkt"]
+
+
+def test_signed_urls_are_reused_until_near_expiry(workflow, dm, monkeypatch):
+    import pyaps.automation.workflow as workflow_mod
+
+    assert workflow.prepare_output_url("out.rvt") == workflow.prepare_output_url("out.rvt")
+    workflow.prepare_output_url("other.rvt")
+    assert dm.objects.signed_calls == [("bkt", "out.rvt"), ("bkt", "other.rvt")]
+
+    now = workflow_mod.time.monotonic()
+    monkeypatch.setattr(workflow_mod.time, "monotonic", lambda: now + 3600)
+    workflow.prepare_output_url("out.rvt")
+    assert dm.objects.signed_calls[-1] == ("bkt", "out.rvt") and len(dm.objects.signed_calls) == 3
+
+
+def test_upload_skipped_when_object_unchanged(workflow, dm, tmp_path):
+    import hashlib
+
+    path = tmp_path / "in.rvt"
+    path.write_bytes(b"model-bytes")
+    dm.objects.details = {"in.rvt": {"size": 11, "sha1": hashlib.sha1(b"model-bytes").hexdigest()}}
+
+    assert workflow.upload_input_file(path, skip_if_unchanged=True) == "https://oss/bkt/in.rvt?get"
+    assert dm.objects.uploads == []
+
+    path.write_bytes(b"model-bytez")
+    workflow.upload_input_file(path, skip_if_unchanged=True)
+    workflow.upload_input_file(path, object_key="new.rvt", skip_if_unchanged=True)
+    assert [u[0] for u in dm.objects.uploads] == ["https://oss/bkt/in.rvt?put", "https://oss/bkt/new.rvt?put"]
+
+
+def test_async_workflows_share_one_event_loop(dm, tmp_path):
+    import asyncio
+
+    auto = FakeAuto()
+    wf = AutomationWorkflow(auto, dm, default_bucket="bkt", poll_interval=0.01,
+                            download_session=dm.http_oss.session, async_workers=2)
+    (tmp_path / "in.rvt").write_bytes(b"model")
+
+    async def main():
+        return await asyncio.gather(*(
+            wf.arun_workitem_with_files(
+                "me.Act+prod",
+                input_files={"in": tmp_path / "in.rvt"},
+                output_files={"out": f"out-{i}.rvt"},
+                output_dir=tmp_path,
+            )
+            for i in range(3)
+        ))
+
+    try:
+        results = asyncio.run(main())
+        assert wf._async_executor._max_workers == 2
+    finally:
+        wf.close()
+    assert wf._async_executor is None
+    assert [r.status for r in results] == ["success"] * 3
+    assert sorted(auto.polls) == ["wi-1", "wi-2", "wi-3"]
+    assert all((tmp_path / f"out-{i}.rvt").exists() for i in range(3))
+
+
+def test_batch_with_files_submits_in_chunks(dm, tmp_path):
+    auto = FakeAuto()
+    batches = []
+    create = auto.create_workitems_batch
+    auto.create_workitems_batch = lambda specs: batches.append(len(specs)) or create(specs)
+    wf = AutomationWorkflow(auto, dm, default_bucket="bkt", download_session=dm.http_oss.session)
+    (tmp_path / "in.rvt").write_bytes(b"model")
+
+    jobs = [
+        {"activity_id": "me.Act+prod", "input_files": {"in": tmp_path / "in.rvt"},
+         "output_files": {"out": f"out-{i}.rvt"}}
+        for i in range(5)
+    ]
+    results = wf.run_batch_workitems_with_files(jobs, output_dir=tmp_path, batch_size=2)
+
+    assert batches == [2, 2, 1]
+    assert [r.workitem_id for r in results] == [f"wi-{i}" for i in range(1, 6)]
+    assert auto.polls == [[f"wi-{i}" for i in range(1, 6)]]
+    assert auto.started[4].arguments["out"].url == "https://oss/bkt/out-4.rvt?put"
+    assert (tmp_path / "out-4.rvt").read_bytes() == b"https://oss/bkt/out-4.rvt?get"
+
+
+def test_large_uploads_are_read_in_big_blocks(workflow, dm, tmp_path, monkeypatch):
+    import pyaps.automation.workflow as wf_module
+
+    monkeypatch.setattr(wf_module, "_LARGE_UPLOAD_THRESHOLD", 10)
+    monkeypatch.setattr(wf_module, "_LARGE_UPLOAD_BLOCK", 8)
+    reads = []
+
+    def upload(signed, payload, timeout=None):
+        assert len(payload) == 20
+        while chunk := payload.read(3):
+            reads.append(chunk)
+
+    dm.objects.upload_via_signed = upload
+    path = tmp_path / "big.rvt"
+    path.write_bytes(bytes(range(20)))
+    workflow.upload_input_file(path)
+
+    assert [len(c) for c in reads] == [8, 8, 4] and b"".join(reads) == bytes(range(20))
+
+
+def test_dedupe_uploads_shared_input_once(workflow, dm, tmp_path):
+    import hashlib
+
+    shared = tmp_path / "shared.rvt"
+    shared.write_bytes(b"same")
+    copy = tmp_path / "copy" / "shared.rvt"
+    copy.parent.mkdir()
+    copy.write_bytes(b"same")
+
+    urls = {workflow.upload_input_file(p, dedupe=True) for p in (shared, copy, shared)}
+
+    key = f"{hashlib.sha256(b'same').hexdigest()[:16]}-shared.rvt"
+    assert urls == {f"https://oss/bkt/{key}?get"}
+    assert [u[0] for u in dm.objects.uploads] == [f"https://oss/bkt/{key}?put"]
+
+    # records older than bucket_cache_ttl are not trusted
+    workflow.bucket_cache_ttl = 0
+    workflow.upload_input_file(shared, dedupe=True)
+    assert len(dm.objects.uploads) == 2
+
+
+def test_shared_polling_uses_one_status_query_per_round(dm):
+    from concurrent.futures import ThreadPoolExecutor
+
+    class Auto(FakeAuto):
+        def get_workitem(self, workitem_id):
+            self.polls.append(workitem_id)
+            return {"id": workitem_id, "status": "inprogress"}
+
+        def get_workitems_status(self, ids):
+            self.rounds.append(list(ids))
+            seen = lambda i: sum(i in r for r in self.rounds)
+            return [{"id": i, "status": "success" if seen(i) >= 2 else "inprogress"} for i in ids]
+
+    auto = Auto()
+    auto.rounds = []
+    wf = AutomationWorkflow(auto, dm, poll_interval=0.05, shared_polling=True)
+    with ThreadPoolExecutor(3) as ex:
+        results = list(ex.map(lambda i: wf.wait_for_completion(i, timeout=5), ["a", "b", "c"]))
+
+    assert [r.status for r in results] == ["success"] * 3
+    assert sorted(auto.polls) == ["a", "b", "c"]      # one immediate check each, then the shared rounds
+    assert len(auto.rounds) <= 6 and max(len(r) for r in auto.rounds) > 1
+
+
+def test_shared_polling_wakes_every_waiter_of_the_same_item(dm):
+    from concurrent.futures import ThreadPoolExecutor
+
+    class Auto(FakeAuto):
+        def get_workitem(self, workitem_id):
+            return {"id": workitem_id, "status": "inprogress"}
+
+        def get_workitems_status(self, ids):
+            return [{"id": i, "status": "success"} for i in ids]
+
+    wf = AutomationWorkflow(Auto(), dm, poll_interval=0.05, shared_polling=True)
+    with ThreadPoolExecutor(2) as ex:
+        results = list(ex.map(lambda i: wf.wait_for_completion(i, timeout=5), ["a", "a"]))
+
+    assert [r.status for r in results] == ["success", "success"]
+    assert wf._poll_hub._waiters == {}
+
+
+def test_shared_polling_returns_finished_items_without_waiting(dm):
+    auto = FakeAuto()
+    auto.get_workitems_status = None   # the shared poller must not be needed
+    wf = AutomationWorkflow(auto, dm, poll_interval=60, shared_polling=True)
+
+    assert wf.wait_for_completion("wi-1").status == "success"
+    assert auto.polls == ["wi-1"]
+
+
+def test_async_progress_runs_callback_off_polling_thread(dm):
+    seen = []
+    auto = FakeAuto()
+    wf = AutomationWorkflow(auto, dm)
+
+    wf.wait_for_completion(
+        "wi-1",
+        on_progress=lambda status: seen.append((status["status"], threading.current_thread().name)),
+        async_progress=True,
+    )
+
+    assert seen == [("success", "pyaps-progress")]
+
+
+def test_single_presign_reuses_upload_url_for_download(dm, tmp_path):
+    dm.objects.get_signed_download = None   # must not be called
+    wf = AutomationWorkflow(None, dm, default_bucket="bkt", single_presign=True)
+    path = tmp_path / "in.rvt"
+    path.write_bytes(b"model")
+
+    assert wf.upload_input_file(path) == "https://oss/bkt/in.rvt?rw"
+    assert dm.objects.signed_calls == [("bkt", "in.rvt")]
+    assert dm.objects.uploads == [("https://oss/bkt/in.rvt?rw", b"model", True)]
+
+
+def test_large_inputs_upload_parts_concurrently(dm, tmp_path):
+    requested, completed, puts = [], [], {}
+
+    def get_signed_upload(bucket_key, object_key, parts=None, first_part=None, upload_key=None):
+        requested.append((first_part, parts, upload_key))
+        return {"uploadKey": "uk", "urls": [f"https://s3/part{first_part + i}" for i in range(parts)]}
+
+    class Session:
+        def put(self, url, data=None, timeout=None):
+            puts[url] = data
+            return type("R", (), {"status_code": 200, "headers": {"ETag": url[-2:]}, "text": ""})()
+
+    dm.objects.get_signed_upload = get_signed_upload
+    dm.objects.complete_signed_upload = lambda b, o, k, size=None, etags=None: completed.append((k, size, etags))
+    wf = AutomationWorkflow(None, dm, default_bucket="bkt", download_session=Session(),
+                            multipart_threshold=10, multipart_part_size=2)
+    path = tmp_path / "big.rvt"
+    path.write_bytes(bytes(range(53)))
+
+    assert wf.upload_input_file(path) == "https://oss/bkt/big.rvt?get"
+    assert requested == [(1, 25, None), (26, 2, "uk")]
+    assert b"".join(puts[f"https://s3/part{i}"] for i in range(1, 28)) == bytes(range(53))
+    assert completed == [("uk", 53, [f"https://s3/part{i}"[-2:] for i in range(1, 28)])]
+    assert dm.objects.uploads == []
+
+
+def test_download_uses_parallel_range_requests(dm, tmp_path):
+    body = bytes(range(256)) * 4
+    ranges = []
+
+    class RangeResponse(FakeDownloadResponse):
+        def __init__(self, headers):
+            start, end = map(int, headers["Range"][len("bytes="):].split("-"))
+            ranges.append(start)
+            super().__init__(body[start:end + 1])
+            self.status_code = 206
+            self.headers = {"Content-Range": f"bytes {start}-{end}/{len(body)}"}
+
+    session = type("S", (), {"get": lambda self, url, headers=None, stream=False, timeout=None: RangeResponse(headers)})()
+    wf = AutomationWorkflow(None, dm, download_session=session)
+    wf.download_output_file("bkt", "out.bin", tmp_path / "out.bin", max_concurrency=4, chunk_size=100)
+
+    assert (tmp_path / "out.bin").read_bytes() == body
+    assert sorted(ranges) == list(range(0, len(body), 100))
+
+
+@pytest.mark.parametrize("status, content_range", [(206, "bytes 0-99/*"), (206, None), (200, None)])
+def test_range_download_falls_back_without_known_total(dm, tmp_path, status, content_range):
+    body = bytes(range(256)) * 4
+    gets = []
+
+    class Response(FakeDownloadResponse):
+        def __init__(self, headers):
+            gets.append(headers)
+            ranged = headers is not None and status == 206   # the retry is a plain GET
+            super().__init__(body[:100] if ranged else body)
+            self.status_code = 206 if ranged else 200
+            self.headers = {"Content-Range": content_range} if ranged and content_range else {}
+
+    session = type("S", (), {"get": lambda self, url, headers=None, stream=False, timeout=None: Response(headers)})()
+    wf = AutomationWorkflow(None, dm, download_session=session)
+    wf.download_output_file("bkt", "out.bin", tmp_path / "out.bin", max_concurrency=4, chunk_size=100)
+
+    assert (tmp_path / "out.bin").read_bytes() == body
+    assert len(gets) == (1 if status == 200 else 2)
+    assert [p.name for p in tmp_path.iterdir()] == ["out.bin"]
+
+
+def test_failed_range_download_leaves_no_partial_file(dm, tmp_path):
+    from pyaps.http.client import HTTPError
+
+    body = bytes(range(256)) * 4
+
+    class Response(FakeDownloadResponse):
+        def __init__(self, headers):
+            start, end = map(int, headers["Range"][len("bytes="):].split("-"))
+            super().__init__(body[start:end + 1])
+            self.status_code = 206 if start == 0 else 200   # later ranges ignore Range
+            self.headers = {"Content-Range": f"bytes {start}-{end}/{len(body)}"}
+
+    session = type("S", (), {"get": lambda self, url, headers=None, stream=False, timeout=None: Response(headers)})()
+    wf = AutomationWorkflow(None, dm, download_session=session)
+    with pytest.raises(HTTPError):
+        wf.download_output_file("bkt", "out.bin", tmp_path / "out.bin", max_concurrency=4, chunk_size=100)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_arun_batch_workitems_polls_status_in_rounds(dm):
+    import asyncio
+
+    class Auto(FakeAuto):
+        def get_workitems_status(self, ids):
+            self.polls.append(list(ids))
+            return {"data": [{"id": i, "status": "success" if (i == "wi-1" or len(self.polls) > 1) else "pending"}
+                             for i in ids]}
+
+    auto = Auto()
+    wf = AutomationWorkflow(auto, dm, poll_interval=0.01)
+    results = asyncio.run(wf.arun_batch_workitems([{"activityId": "a"}, {"activityId": "b"}]))
+
+    assert [(r.workitem_id, r.status) for r in results] == [("wi-1", "success"), ("wi-2", "success")]
+    assert auto.polls == [["wi-1", "wi-2"], ["wi-2"]]
+
+
+def test_on_complete_url_skips_polling_without_registry(dm):
+    """With only an onComplete webhook the work item is submitted and returned unpolled."""
+    auto = FakeAuto(status="inprogress")
+    wf = AutomationWorkflow(auto, dm)
+    result = wf.run_workitem_with_files("me.Act+prod", on_complete_url="https://hooks.example/done")
+
+    assert (result.workitem_id, result.status) == ("wi-1", "pending")
+    assert auto.polls == []
+    assert auto.started[0].on_complete == "https://hooks.example/done"
+
+
+def test_digest_cache_skips_rehash_of_unchanged_files(dm, tmp_path, monkeypatch):
+    """Hashes persisted to digest_cache_path are reused while mtime and size match."""
+    import hashlib
+    import os
+
+    import pyaps.automation.workflow as wf_mod
+
+    path = tmp_path / "in.rvt"
+    path.write_bytes(b"model-bytes")
+    os.utime(path, (1_000_000, 1_000_000))
+    dm.objects.details = {"in.rvt": {"size": 11, "sha1": hashlib.sha1(b"model-bytes").hexdigest()}}
+    cache = tmp_path / "digests.json"
+
+    hashed = []
+    real = wf_mod._file_digest
+    monkeypatch.setattr(wf_mod, "_file_digest", lambda p, a: hashed.append(a) or real(p, a))
+
+    for _ in range(2):
+        wf = AutomationWorkflow(None, dm, default_bucket="bkt", digest_cache_path=cache)
+        wf.upload_input_file(path, skip_if_unchanged=True)
+    assert hashed == ["sha1"] and dm.objects.uploads == []
+
+    os.utime(path, (2_000_000, 2_000_000))
+    wf.upload_input_file(path, skip_if_unchanged=True)
+    assert hashed == ["sha1", "sha1"]
+
+
+def test_run_batch_submits_chunks_from_thread_pool(dm):
+    auto = FakeAuto()
+    threads = set()
+    create = auto.create_workitems_batch
+    auto.create_workitems_batch = lambda specs: threads.add(threading.get_ident()) or create(specs)
+    wf = AutomationWorkflow(auto, dm)
+
+    results = wf.run_batch_workitems([{"activityId": str(i)} for i in range(6)], batch_size=2, max_workers=3)
+    assert len(results) == 6 and all(r.status == "success" for r in results)
+    assert threading.get_ident() not in threads
+    assert sorted(auto.polls[0]) == sorted(r.workitem_id for r in results)
+
+
+def test_failed_run_drops_cached_signed_urls(dm):
+    auto = FakeAuto(status="failed")
+    wf = AutomationWorkflow(auto, dm, default_bucket="bkt")
+    wf.prepare_output_url("keep.rvt")
+    for _ in range(2):
+        wf.run_workitem_with_files("me.Act+prod", output_files={"out": "out.rvt"})
+    wf.prepare_output_url("keep.rvt")
+
+    assert dm.objects.signed_calls == [("bkt", "keep.rvt"), ("bkt", "out.rvt"), ("bkt", "out.rvt")]
+
+
+def test_workitem_stats_snapshot():
+    from pyaps.automation import WorkItemStats
+
+    s = WorkItemStats.from_status({"stats": {"timeQueued": "t0", "timeUploadEnded": "t4", "bytesUploaded": 7}})
+    assert (s.queued, s.upload_ended, s.bytes_uploaded, s.finished) == ("t0", "t4", 7, None)
+    assert WorkItemStats.from_status({"status": "pending"}) == WorkItemStats()
+
+
+def test_bucket_rechecked_after_signed_url_404(workflow, dm, monkeypatch):
+    from pyaps.http.client import HTTPError
+
+    workflow.ensure_bucket("bkt")
+
+    def gone(*args, **kwargs):
+        raise HTTPError(404, "POST", "signed")
+
+    monkeypatch.setattr(dm.objects, "post_signed", gone)
+    with pytest.raises(HTTPError):
+        workflow.prepare_output_url("out.rvt")
+    workflow.ensure_bucket("bkt")
+    assert dm.buckets.gets == ["bkt", "bkt"]